@@ -0,0 +1,5 @@
+"""In-process caches for the auth domain."""
+
+from .token_lookup_cache import TokenLookupCache, token_lookup_cache
+
+__all__ = ["TokenLookupCache", "token_lookup_cache"]
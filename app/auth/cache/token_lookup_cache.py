@@ -0,0 +1,79 @@
+"""Bearer token -> user id lookup cache (Redis, shared by every worker)."""
+
+import time
+import uuid
+from hashlib import blake2b
+from typing import Optional
+
+import jwt
+from cachetools import TTLCache
+from jwt.exceptions import PyJWTError
+
+from app.auth.repositories.cache.auth_cache_repository import auth_cache
+from app.common.exception import Unauthorized
+
+# 검증에 실패한 토큰 표시 (워커 로컬; 실패한 토큰은 다시 유효해지지 않음)
+_NEGATIVE = object()
+
+
+class TokenLookupCache:
+    """Cache of verified bearer tokens.
+
+    토큰 검증(서명/만료) 결과를 user id 로 캐시해 인증 요청마다 반복되는 검증을
+    생략. 무효화가 모든 워커에 즉시 적용되도록 양성 캐시는 Redis 에만 두고,
+    블랙리스트는 조회와 같은 파이프라인에서 매번 확인. User 자체는
+    UserRepository 의 프로필 캐시에서 조회하므로 프로필 변경/비활성화는 그쪽
+    무효화로 반영됨.
+    """
+
+    def __init__(self, maxsize: int = 10_000, ttl: int = 60, negative_ttl: int = 10):
+        self._ttl = ttl
+        self._negative: TTLCache = TTLCache(maxsize=maxsize, ttl=negative_ttl)
+
+    @staticmethod
+    def _digest(token: str) -> str:
+        return blake2b(token.encode(), digest_size=16).hexdigest()
+
+    async def get(self, token: str) -> Optional[uuid.UUID]:
+        """Return the cached user id, None on miss; raise for a known-bad token."""
+        digest = self._digest(token)
+        if self._negative.get(digest) is _NEGATIVE:
+            raise Unauthorized(message="Invalid token")
+
+        try:
+            # 서명 검증 없이 jti 만 읽음 - 캐시 miss 시 전체 검증을 거치므로 안전
+            claims = jwt.decode(token, options={"verify_signature": False})
+        except PyJWTError:
+            return None
+
+        user_hex, revoked = await auth_cache.get_token_lookup(digest, claims.get("jti"))
+        if revoked:
+            self.set_negative(token)
+            raise Unauthorized(message="Token has been revoked")
+        return uuid.UUID(user_hex) if user_hex is not None else None
+
+    async def set(self, token: str, user_id: uuid.UUID, exp: Optional[float]) -> None:
+        """Cache a verified token for at most min(ttl, remaining lifetime)."""
+        expire = self._ttl
+        if exp is not None:
+            expire = min(expire, int(exp - time.time()))
+        if expire <= 0:
+            return
+
+        await auth_cache.set_token_lookup(self._digest(token), user_id, expire)
+
+    def set_negative(self, token: str) -> None:
+        """Remember a token that failed verification."""
+        self._negative[self._digest(token)] = _NEGATIVE
+
+    async def invalidate(self, token: str) -> None:
+        """Forget a single token (e.g. on logout)."""
+        await auth_cache.delete_token_lookup(self._digest(token))
+
+    async def invalidate_user(self, user_id: uuid.UUID) -> None:
+        """Forget every cached token of a user."""
+        await auth_cache.clear_user_token_lookups(user_id)
+
+
+# Global instance
+token_lookup_cache = TokenLookupCache()
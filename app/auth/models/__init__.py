@@ -3,6 +3,9 @@
 # SQLAlchemy ORM Models (Database Layer)
 from .postgres_models import SocialAccount, User
 
+# Cache payloads
+from .session_payload import SessionPayload
+
 # Pydantic Domain Models (Business Logic Layer)
 from .social_account import SocialAccountModel
 from .user import UserModel
@@ -14,4 +17,6 @@ __all__ = [
     # Pydantic Domain Models
     "UserModel",
     "SocialAccountModel",
+    # Cache payloads
+    "SessionPayload",
 ]
@@ -10,14 +10,17 @@ from sqlalchemy import (
     Boolean,
     DateTime,
     ForeignKey,
+    Index,
     Integer,
     String,
     Text,
+    UniqueConstraint,
 )
 from sqlalchemy.dialects.postgresql import ENUM, JSONB, UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.sql import func
 
+from app.common.enums.user_level import ADMIN_LEVEL
 from app.common.storage.postgres import Base
 
 
@@ -65,10 +68,19 @@ class User(Base):
 
     model_config = ConfigDict(from_attributes=True)
 
+    @property
+    def is_admin(self) -> bool:
+        """관리자 권한 여부 (user_level 정수 비교만 수행)."""
+        return self.user_level >= ADMIN_LEVEL
+
     def __repr__(self):
         return f"<User(id={self.id}, email={self.email})>"
 
 
+# get_user_by_email 의 lower(email) 조회용 함수 인덱스
+Index("users_email_lower_idx", func.lower(User.email))
+
+
 # Create ENUM type for OAuth providers
 oauth_provider_enum = ENUM("google", "apple", name="oauth_provider", create_type=True)
 
@@ -77,12 +89,18 @@ class SocialAccount(Base):
     """Social account model for OAuth connections."""
 
     __tablename__ = "social_accounts"
+    __table_args__ = (
+        # OAuth 로그인 조회 (provider, provider_user_id) + 무결성 보장
+        UniqueConstraint("provider", "provider_user_id", name="uq_social_provider_pid"),
+        # user_id 단독 조회도 leftmost prefix로 처리
+        Index("ix_social_user_provider", "user_id", "provider"),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
     )
     user_id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True), ForeignKey("users.id"), nullable=False, index=True
+        UUID(as_uuid=True), ForeignKey("users.id"), nullable=False
     )
     provider: Mapped[str] = mapped_column(oauth_provider_enum, nullable=False)
     provider_user_id: Mapped[str] = mapped_column(String(255), nullable=False)
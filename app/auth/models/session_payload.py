@@ -0,0 +1,18 @@
+"""JWT session cache payload."""
+
+import msgspec
+
+
+class SessionPayload(msgspec.Struct):
+    """Redis 에 저장되는 JWT 세션 데이터 (로그인/토큰 갱신마다 읽고 씀)."""
+
+    email: str
+    user_level: int
+    created_at: str
+
+    def to_dict(self) -> dict:
+        return msgspec.structs.asdict(self)
+
+
+SESSION_ENCODER = msgspec.json.Encoder()
+SESSION_DECODER = msgspec.json.Decoder(SessionPayload)
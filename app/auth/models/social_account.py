@@ -1,16 +1,42 @@
 """Social Account domain models for business logic."""
 
+import re
+import time
 import uuid
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional
+from typing import Any, Dict, FrozenSet, List, Optional
 
-from pydantic import BaseModel, ConfigDict, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, field_validator
+
+from app.common.utils.datetime import utcnow_cached
+
+_ALLOWED_PROVIDERS = frozenset(("google", "apple"))
+_PUID_RE = re.compile(r"[A-Za-z0-9_-]+")
+_EMAIL_SCOPES = frozenset(
+    (
+        "email",  # Google, Apple
+        "https://www.googleapis.com/auth/userinfo.email",  # Google
+    )
+)
+_PROFILE_SCOPES = frozenset(
+    (
+        "profile",
+        "https://www.googleapis.com/auth/userinfo.profile",  # Google
+        "name",  # Apple
+    )
+)
 
 
 class SocialAccountModel(BaseModel):
     """소셜 계정 도메인 모델."""
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(
+        from_attributes=True,
+        frozen=True,
+        revalidate_instances="never",
+        validate_assignment=False,
+        extra="ignore",
+    )
 
     id: uuid.UUID
     user_id: uuid.UUID
@@ -24,14 +50,24 @@ class SocialAccountModel(BaseModel):
     connected_at: datetime = Field(..., description="계정 연결 시간")
     last_used_at: Optional[datetime] = Field(None, description="마지막 사용 시간")
 
+    # scope_granted를 생성 시 한 번만 집합으로 변환해 O(1) 조회에 사용
+    _scope_set: FrozenSet[str] = PrivateAttr(default_factory=frozenset)
+
+    def model_post_init(self, __context: Any) -> None:
+        self._scope_set = frozenset(self.scope_granted or ())
+
+    @classmethod
+    def from_orm_trusted(cls, obj) -> "SocialAccountModel":
+        """DB 에서 읽은 SocialAccount 객체나 컬럼 Row 로부터 검증 없이 생성."""
+        return cls.model_construct(**{f: getattr(obj, f) for f in cls.model_fields})
+
     @field_validator("provider")
     @classmethod
     def validate_provider(cls, v: str) -> str:
         """OAuth 제공자 검증."""
-        allowed_providers = {"google", "apple"}
-        if v.lower() not in allowed_providers:
+        if v.lower() not in _ALLOWED_PROVIDERS:
             raise ValueError(
-                f"지원되지 않는 OAuth 제공자입니다: {v}. 지원 제공자: {allowed_providers}"
+                f"지원되지 않는 OAuth 제공자입니다: {v}. 지원 제공자: {set(_ALLOWED_PROVIDERS)}"
             )
         return v.lower()
 
@@ -43,12 +79,13 @@ class SocialAccountModel(BaseModel):
             raise ValueError("제공자 사용자 ID는 비어있을 수 없습니다")
 
         # 기본적인 형식 검증 (영숫자, 하이픈, 언더스코어만 허용)
-        if not v.replace("-", "").replace("_", "").isalnum():
+        v = v.strip()
+        if not _PUID_RE.fullmatch(v):
             raise ValueError(
                 "제공자 사용자 ID는 영숫자, 하이픈, 언더스코어만 포함할 수 있습니다"
             )
 
-        return v.strip()
+        return v
 
     @field_validator("scope_granted")
     @classmethod
@@ -58,13 +95,14 @@ class SocialAccountModel(BaseModel):
             if not isinstance(v, list):
                 raise ValueError("scope_granted는 문자열 리스트여야 합니다")
 
-            # 각 스코프가 유효한 형식인지 확인
+            # 형식 확인과 중복 제거를 한 번의 순회로 처리 (순서 유지)
+            scopes: Dict[str, None] = {}
             for scope in v:
-                if not isinstance(scope, str) or not scope.strip():
+                if not isinstance(scope, str) or not (scope := scope.strip()):
                     raise ValueError("모든 스코프는 비어있지 않은 문자열이어야 합니다")
+                scopes[scope] = None
 
-            # 중복 제거
-            return list(set(scope.strip() for scope in v))
+            return list(scopes)
 
         return v
 
@@ -78,29 +116,29 @@ class SocialAccountModel(BaseModel):
 
     def has_scope(self, scope: str) -> bool:
         """특정 권한 스코프를 보유하고 있는지 확인."""
-        if not self.scope_granted:
-            return False
-        return scope in self.scope_granted
+        return scope in self._scope_set
 
     def get_granted_scopes(self) -> List[str]:
         """부여된 권한 스코프 목록 반환."""
         return self.scope_granted or []
 
-    def is_recently_used(self, days: int = 30) -> bool:
+    def is_recently_used(self, days: int = 30, now: Optional[datetime] = None) -> bool:
         """최근에 사용된 계정인지 확인."""
         if self.last_used_at is None:
             return False
 
-        cutoff_date = datetime.utcnow() - timedelta(days=days)
+        now = now or utcnow_cached(int(time.time()))
+        cutoff_date = now - timedelta(days=days)
         return self.last_used_at >= cutoff_date
 
-    def days_since_connected(self) -> int:
+    def days_since_connected(self, now: Optional[datetime] = None) -> int:
         """계정 연결 후 경과일수."""
-        return (datetime.utcnow() - self.connected_at).days
+        now = now or utcnow_cached(int(time.time()))
+        return (now - self.connected_at).days
 
-    def is_newly_connected(self, days: int = 7) -> bool:
+    def is_newly_connected(self, days: int = 7, now: Optional[datetime] = None) -> bool:
         """최근에 연결된 계정인지 확인 (기본 7일)."""
-        return self.days_since_connected() <= days
+        return self.days_since_connected(now) <= days
 
     def get_provider_display_name(self) -> str:
         """제공자의 표시용 이름 반환."""
@@ -109,21 +147,11 @@ class SocialAccountModel(BaseModel):
 
     def has_email_scope(self) -> bool:
         """이메일 권한이 있는지 확인."""
-        email_scopes = {
-            "email",
-            "https://www.googleapis.com/auth/userinfo.email",  # Google
-            "email",  # Apple
-        }
-        return any(self.has_scope(scope) for scope in email_scopes)
+        return bool(_EMAIL_SCOPES & self._scope_set)
 
     def has_profile_scope(self) -> bool:
         """프로필 정보 권한이 있는지 확인."""
-        profile_scopes = {
-            "profile",
-            "https://www.googleapis.com/auth/userinfo.profile",  # Google
-            "name",  # Apple
-        }
-        return any(self.has_scope(scope) for scope in profile_scopes)
+        return bool(_PROFILE_SCOPES & self._scope_set)
 
     def get_provider_data_value(self, key: str, default=None):
         """제공자별 데이터에서 특정 값 추출."""
@@ -135,9 +163,16 @@ class SocialAccountModel(BaseModel):
         """마지막 사용 시간을 현재 시간으로 업데이트하고 반환."""
         return datetime.utcnow()
 
-    def is_stale_connection(self, days: int = 90) -> bool:
+    def is_stale_connection(
+        self, days: int = 90, now: Optional[datetime] = None
+    ) -> bool:
         """오래된 연결인지 확인 (기본 90일)."""
+        now = now or utcnow_cached(int(time.time()))
         if self.last_used_at is None:
             # 사용된 적이 없다면 연결된 시간을 기준으로 판단
-            return self.days_since_connected() > days
-        return not self.is_recently_used(days)
+            return self.days_since_connected(now) > days
+        return not self.is_recently_used(days, now)
+
+
+# 스키마를 import 시점에 한 번 컴파일
+SocialAccountModel.model_rebuild(force=True)
@@ -1,40 +1,52 @@
 """User domain models for business logic."""
 
 import re
+import time
 import uuid
 from datetime import datetime, timedelta
 from typing import Optional
 
-from pydantic import BaseModel, ConfigDict, Field, field_validator
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    EmailStr,
+    Field,
+    HttpUrl,
+    field_validator,
+)
+
+from app.common.enums.user_level import ADMIN_LEVEL, NORMAL_LEVEL
+from app.common.utils.datetime import utcnow_cached
+
+_NAME_RE = re.compile(r"^[a-zA-Z0-9가-힣\s]+$")
+_IMAGE_SUFFIXES = (".jpg", ".jpeg", ".png", ".gif", ".webp")
+_ALLOWED_LEVELS = frozenset((100, 1000))  # 100: normal, 1000: admin
 
 
 class UserModel(BaseModel):
     """사용자 도메인 모델."""
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(
+        from_attributes=True,
+        frozen=True,
+        revalidate_instances="never",
+        validate_assignment=False,
+        extra="ignore",
+    )
 
     id: uuid.UUID
-    email: str = Field(..., description="사용자 이메일")
+    email: EmailStr = Field(..., description="사용자 이메일")
     name: str = Field(..., min_length=1, max_length=100, description="사용자 이름")
     user_level: int = Field(
         ..., description="사용자 권한 레벨 (100: normal, 1000: admin)"
     )
-    profile_image_url: Optional[str] = Field(None, description="프로필 이미지 URL")
+    profile_image_url: Optional[HttpUrl] = Field(None, description="프로필 이미지 URL")
     is_active: bool = Field(True, description="계정 활성화 상태")
     email_verified: bool = Field(False, description="이메일 인증 상태")
     last_login_at: Optional[datetime] = Field(None, description="마지막 로그인 시간")
     created_at: datetime
     updated_at: datetime
 
-    @field_validator("email")
-    @classmethod
-    def validate_email(cls, v: str) -> str:
-        """이메일 형식 검증."""
-        email_pattern = re.compile(r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$")
-        if not email_pattern.match(v):
-            raise ValueError("올바른 이메일 형식이 아닙니다")
-        return v.lower().strip()
-
     @field_validator("name")
     @classmethod
     def validate_name(cls, v: str) -> str:
@@ -43,8 +55,7 @@ class UserModel(BaseModel):
             raise ValueError("사용자 이름은 비어있을 수 없습니다")
 
         # 특수문자 제한 (기본적인 문자, 숫자, 공백, 한글만 허용)
-        name_pattern = re.compile(r"^[a-zA-Z0-9가-힣\s]+$")
-        if not name_pattern.match(v.strip()):
+        if not _NAME_RE.match(v.strip()):
             raise ValueError("사용자 이름에 허용되지 않는 문자가 포함되어 있습니다")
 
         return v.strip()
@@ -53,33 +64,27 @@ class UserModel(BaseModel):
     @classmethod
     def validate_user_level(cls, v: int) -> int:
         """사용자 레벨 검증."""
-        allowed_levels = {100, 1000}  # 100: normal, 1000: admin
-        if v not in allowed_levels:
+        if v not in _ALLOWED_LEVELS:
             raise ValueError(
-                f"허용되지 않는 사용자 레벨입니다: {v}. 허용 레벨: {allowed_levels}"
+                f"허용되지 않는 사용자 레벨입니다: {v}. 허용 레벨: {set(_ALLOWED_LEVELS)}"
             )
         return v
 
     @field_validator("profile_image_url")
     @classmethod
-    def validate_profile_image_url(cls, v: Optional[str]) -> Optional[str]:
-        """프로필 이미지 URL 검증."""
-        if v is not None and v.strip():
-            url_pattern = re.compile(
-                r"^https?://.+\.(jpg|jpeg|png|gif|webp)(\?.*)?$", re.IGNORECASE
-            )
-            if not url_pattern.match(v.strip()):
-                raise ValueError("올바른 이미지 URL 형식이 아닙니다")
-            return v.strip()
-        return None
+    def validate_profile_image_url(cls, v: Optional[HttpUrl]) -> Optional[HttpUrl]:
+        """프로필 이미지 URL 검증 (형식은 HttpUrl, 여기서는 확장자만 확인)."""
+        if v is not None and not (v.path or "").lower().endswith(_IMAGE_SUFFIXES):
+            raise ValueError("올바른 이미지 URL 형식이 아닙니다")
+        return v
 
     def is_admin(self) -> bool:
         """관리자 권한 여부 확인."""
-        return self.user_level >= 1000
+        return self.user_level >= ADMIN_LEVEL
 
     def is_normal_user(self) -> bool:
         """일반 사용자 권한 여부 확인."""
-        return self.user_level == 100
+        return self.user_level == NORMAL_LEVEL
 
     def is_profile_complete(self) -> bool:
         """프로필이 완성되었는지 확인."""
@@ -104,19 +109,22 @@ class UserModel(BaseModel):
             completed_fields += 1
 
         # 선택 필드들
-        if self.profile_image_url and self.profile_image_url.strip():
+        if self.profile_image_url:
             completed_fields += 1
         if self.last_login_at is not None:
             completed_fields += 1
 
         return completed_fields / total_fields
 
-    def is_recently_active(self, days: int = 30) -> bool:
-        """최근 활성 사용자인지 확인."""
+    def is_recently_active(
+        self, days: int = 30, now: Optional[datetime] = None
+    ) -> bool:
+        """최근 활성 사용자인지 확인 (now는 요청 단위로 주입 가능)."""
         if self.last_login_at is None:
             return False
 
-        cutoff_date = datetime.utcnow() - timedelta(days=days)
+        now = now or utcnow_cached(int(time.time()))
+        cutoff_date = now - timedelta(days=days)
         return self.last_login_at >= cutoff_date
 
     def can_perform_admin_action(self) -> bool:
@@ -129,10 +137,15 @@ class UserModel(BaseModel):
             return self.name
         return self.email.split("@")[0]  # 이메일의 앞부분 사용
 
-    def days_since_creation(self) -> int:
+    def days_since_creation(self, now: Optional[datetime] = None) -> int:
         """계정 생성 후 경과일수."""
-        return (datetime.utcnow() - self.created_at).days
+        now = now or utcnow_cached(int(time.time()))
+        return (now - self.created_at).days
 
-    def is_new_user(self, days: int = 7) -> bool:
+    def is_new_user(self, days: int = 7, now: Optional[datetime] = None) -> bool:
         """신규 사용자인지 확인 (기본 7일)."""
-        return self.days_since_creation() <= days
+        return self.days_since_creation(now) <= days
+
+
+# 스키마를 import 시점에 한 번 컴파일
+UserModel.model_rebuild(force=True)
@@ -1,37 +1,57 @@
 """Authentication cache repository using Redis."""
 
-import asyncio
 import uuid
-from typing import Any, Dict, Optional, Union
+from typing import Any, Dict, List, Optional, Tuple, Union
 
-from app.common.storage.redis import CacheExpire, _CacheClient
+import orjson
+
+from app.auth.models.session_payload import (
+    SESSION_DECODER,
+    SESSION_ENCODER,
+    SessionPayload,
+)
+from app.common.storage.redis import (
+    CacheExpire,
+    _CacheClient,
+    aioredis_error_handler,
+)
 
 
 class AuthCacheRepository(_CacheClient):
     """Cache repository for authentication data."""
 
     _alias: str = "auth"
+    _prefix: str = f"{_alias}:"
     _ttl: Union[int, CacheExpire] = CacheExpire.HOUR  # Default 1 hour
 
     def _get_key(self, key: str) -> str:
         """Generate cache key."""
-        return f"{self._alias}:{key}"
+        return self._prefix + key
 
     # JWT Token Management
+    @aioredis_error_handler
     async def set_jwt_session(
         self,
         user_id: uuid.UUID,
-        session_data: Dict[str, Any],
+        session_data: SessionPayload,
         expire: Optional[int] = None,
     ) -> None:
-        """Set JWT session data."""
+        """Set JWT session data (msgspec encoded)."""
         key = self._get_key(f"session:{user_id.hex}")
-        await self.set(key, value=session_data, expire=expire or self._ttl)
+        conn = await self.get_connection()
+        await conn.set(
+            self._get_key(key),
+            SESSION_ENCODER.encode(session_data),
+            ex=int(expire or self._ttl),
+        )
 
-    async def get_jwt_session(self, user_id: uuid.UUID) -> Optional[Dict[str, Any]]:
+    @aioredis_error_handler
+    async def get_jwt_session(self, user_id: uuid.UUID) -> Optional[SessionPayload]:
         """Get JWT session data."""
         key = self._get_key(f"session:{user_id.hex}")
-        return await self.get(key)
+        conn = await self.get_connection()
+        raw = await conn.get(self._get_key(key))
+        return SESSION_DECODER.decode(raw) if raw else None
 
     async def delete_jwt_session(self, user_id: uuid.UUID) -> None:
         """Delete JWT session data."""
@@ -39,33 +59,50 @@ class AuthCacheRepository(_CacheClient):
         await self.delete(key)
 
     # JWT Token Blacklist
+    @aioredis_error_handler
     async def blacklist_jwt_token(self, jti: str, expire: int) -> None:
-        """Add JWT token to blacklist."""
+        """Add JWT token to blacklist (presence only, empty payload)."""
         key = self._get_key(f"blacklist:{jti}")
-        await self.set(key, value=True, expire=expire)
+        conn = await self.get_connection()
+        await conn.set(self._get_key(key), "", ex=expire, nx=True)
 
     async def is_jwt_token_blacklisted(self, jti: str) -> bool:
         """Check if JWT token is blacklisted."""
-        key = self._get_key(f"blacklist:{jti}")
-        result = await self.get(key)
-        return result is not None
+        return bool(await self.exists(self._get_key(f"blacklist:{jti}")))
 
     # OAuth State Management
+    @aioredis_error_handler
     async def set_oauth_state(
         self,
         state_token: str,
         state_data: Dict[str, Any],
         expire: int = CacheExpire.MINUTE * 10,  # 10 minutes
-    ) -> None:
-        """Set OAuth state data."""
+    ) -> bool:
+        """Set OAuth state data only if the state is unused (SET NX EX).
+
+        Returns False when the state token already exists.
+        """
         key = self._get_key(f"oauth_state:{state_token}")
-        await self.set(key, value=state_data, expire=expire)
+        conn = await self.get_connection()
+        return bool(
+            await conn.set(
+                self._get_key(key), orjson.dumps(state_data), nx=True, ex=int(expire)
+            )
+        )
 
     async def get_oauth_state(self, state_token: str) -> Optional[Dict[str, Any]]:
         """Get OAuth state data."""
         key = self._get_key(f"oauth_state:{state_token}")
         return await self.get(key)
 
+    @aioredis_error_handler
+    async def pop_oauth_state(self, state_token: str) -> Optional[Dict[str, Any]]:
+        """Atomically get and delete OAuth state (GETDEL, Redis >= 6.2)."""
+        key = self._get_key(f"oauth_state:{state_token}")
+        conn = await self.get_connection()
+        raw = await conn.getdel(self._get_key(key))
+        return orjson.loads(raw) if raw else None
+
     async def delete_oauth_state(self, state_token: str) -> None:
         """Delete OAuth state data."""
         key = self._get_key(f"oauth_state:{state_token}")
@@ -133,15 +170,203 @@ class AuthCacheRepository(_CacheClient):
         key = self._get_key(f"user_session:{user_id.hex}")
         await self.delete(key)
 
+    @aioredis_error_handler
+    async def set_google_tokens_and_session(
+        self,
+        user_id: uuid.UUID,
+        access_token: str,
+        refresh_token: Optional[str],
+        expires_in: int,
+        session_data: SessionPayload,
+        session_expire: int,
+    ) -> None:
+        """Store Google tokens and the JWT session in one pipelined round-trip."""
+        # 개별 set_* 메서드와 동일한 키/직렬화 형식 유지
+        async with self._pipeline(transaction=False) as pipe:
+            if refresh_token:
+                pipe.set(
+                    self._get_key(self._get_key(f"google_refresh_token:{user_id.hex}")),
+                    orjson.dumps(refresh_token),
+                    ex=int(CacheExpire.MONTH),
+                )
+            pipe.set(
+                self._get_key(self._get_key(f"google_access_token:{user_id.hex}")),
+                orjson.dumps(access_token),
+                ex=int(expires_in),
+            )
+            pipe.set(
+                self._get_key(self._get_key(f"session:{user_id.hex}")),
+                SESSION_ENCODER.encode(session_data),
+                ex=int(session_expire),
+            )
+            await pipe.execute()
+
+    async def get_google_tokens(
+        self, user_id: uuid.UUID
+    ) -> Tuple[Optional[str], Optional[str]]:
+        """Get Google (access, refresh) tokens with a single MGET."""
+        access_token, refresh_token = await self.mget(
+            [
+                self._get_key(f"google_access_token:{user_id.hex}"),
+                self._get_key(f"google_refresh_token:{user_id.hex}"),
+            ]
+        )
+        return access_token, refresh_token
+
+    # User Profile Cache (current-user lookups)
+    async def set_user_profile(
+        self,
+        user_id: uuid.UUID,
+        profile: Dict[str, Any],
+        expire: int = CacheExpire.HOUR * 2,
+    ) -> None:
+        """Set cached user profile (users row columns)."""
+        key = self._get_key(f"user:{user_id.hex}:profile")
+        await self.set(key, value=profile, expire=expire)
+
+    async def set_user_missing(
+        self, user_id: uuid.UUID, expire: int = CacheExpire.SECOND * 10
+    ) -> None:
+        """Cache a short-lived 'no such user' marker (empty profile) for user_id."""
+        key = self._get_key(f"user:{user_id.hex}:profile")
+        await self.set(key, value={}, expire=expire)
+
+    async def get_user_profile(self, user_id: uuid.UUID) -> Optional[Dict[str, Any]]:
+        """Get cached user profile ({} means the user is known not to exist)."""
+        key = self._get_key(f"user:{user_id.hex}:profile")
+        return await self.get(key)
+
+    async def delete_user_profile(self, user_id: uuid.UUID) -> None:
+        """Invalidate cached user profile."""
+        key = self._get_key(f"user:{user_id.hex}:profile")
+        await self.delete(key)
+
+    @aioredis_error_handler
+    async def delete_user_profiles(self, user_ids: List[uuid.UUID]) -> None:
+        """Invalidate several cached user profiles with one DEL."""
+        if not user_ids:
+            return
+        conn = await self.get_connection()
+        await conn.delete(
+            *(
+                self._get_key(self._get_key(f"user:{user_id.hex}:profile"))
+                for user_id in user_ids
+            )
+        )
+
+    # Token Lookup Cache (bearer token digest -> user id)
+    @aioredis_error_handler
+    async def set_token_lookup(
+        self, token_digest: str, user_id: uuid.UUID, expire: int
+    ) -> None:
+        """Map a token digest to its user id and index it under the user."""
+        user_set_key = self._get_key(self._get_key(f"token_lookup:user:{user_id.hex}"))
+        async with self._pipeline(transaction=False) as pipe:
+            pipe.set(
+                self._get_key(self._get_key(f"token_lookup:{token_digest}")),
+                user_id.hex,
+                ex=expire,
+            )
+            pipe.sadd(user_set_key, token_digest)
+            pipe.expire(user_set_key, int(CacheExpire.HOUR))
+            await pipe.execute()
+
+    @aioredis_error_handler
+    async def get_token_lookup(
+        self, token_digest: str, jti: Optional[str]
+    ) -> Tuple[Optional[str], bool]:
+        """Get (user id hex, blacklisted) for a token in one round-trip."""
+        async with self._pipeline(transaction=False, decode_responses=True) as pipe:
+            pipe.get(self._get_key(self._get_key(f"token_lookup:{token_digest}")))
+            if jti:
+                pipe.exists(self._get_key(self._get_key(f"blacklist:{jti}")))
+            results = await pipe.execute()
+        return results[0], bool(jti and results[1])
+
+    @aioredis_error_handler
+    async def delete_token_lookup(self, token_digest: str) -> None:
+        """Drop a single token lookup entry."""
+        conn = await self.get_connection()
+        await conn.delete(self._get_key(self._get_key(f"token_lookup:{token_digest}")))
+
+    @aioredis_error_handler
+    async def clear_user_token_lookups(self, user_id: uuid.UUID) -> None:
+        """Drop every token lookup entry recorded for a user."""
+        user_set_key = self._get_key(self._get_key(f"token_lookup:user:{user_id.hex}"))
+        conn = await self.get_connection(decode_responses=True)
+        digests = await conn.smembers(user_set_key)
+        await conn.delete(
+            user_set_key,
+            *(
+                self._get_key(self._get_key(f"token_lookup:{digest}"))
+                for digest in digests
+            ),
+        )
+
+    # Last Login Buffer (flushed to Postgres periodically)
+    @aioredis_error_handler
+    async def buffer_last_login(self, user_id: uuid.UUID, timestamp: float) -> None:
+        """Record a login timestamp in the pending hash."""
+        conn = await self.get_connection()
+        await conn.hset(
+            self._get_key(self._get_key("pending_last_login")),
+            user_id.hex,
+            timestamp,
+        )
+
+    @aioredis_error_handler
+    async def drain_last_logins(self) -> Dict[str, float]:
+        """Atomically read and clear pending login timestamps (MULTI/EXEC)."""
+        key = self._get_key(self._get_key("pending_last_login"))
+        async with self._pipeline(transaction=True, decode_responses=True) as pipe:
+            pipe.hgetall(key)
+            pipe.delete(key)
+            pending, _ = await pipe.execute()
+        return {user_hex: float(ts) for user_hex, ts in pending.items()}
+
+    @aioredis_error_handler
+    async def restore_last_logins(self, pending: Dict[str, float]) -> None:
+        """Put drained timestamps back after a failed flush.
+
+        HSETNX 라서 drain 이후 새로 기록된 더 최신 로그인은 덮어쓰지 않음.
+        """
+        if not pending:
+            return
+        key = self._get_key(self._get_key("pending_last_login"))
+        async with self._pipeline(transaction=False) as pipe:
+            for user_hex, ts in pending.items():
+                pipe.hsetnx(key, user_hex, ts)
+            await pipe.execute()
+
     # Utility methods
-    async def clear_user_auth_data(self, user_id: uuid.UUID) -> None:
-        """Clear all authentication data for a user."""
-        await asyncio.gather(
-            self.delete_jwt_session(user_id),
-            self.delete_google_access_token(user_id),
-            self.delete_google_refresh_token(user_id),
-            self.delete_user_session(user_id),
+    async def get_user_auth_bundle(self, user_id: uuid.UUID) -> Dict[str, Any]:
+        """Get session and Google access token data with a single MGET."""
+        session, google_access_token, user_session = await self.mget(
+            [
+                self._get_key(f"session:{user_id.hex}"),
+                self._get_key(f"google_access_token:{user_id.hex}"),
+                self._get_key(f"user_session:{user_id.hex}"),
+            ]
         )
+        return {
+            "session": session,
+            "google_access_token": google_access_token,
+            "user_session": user_session,
+        }
+
+    @aioredis_error_handler
+    async def clear_user_auth_data(self, user_id: uuid.UUID) -> None:
+        """Clear all authentication data for a user in one round-trip."""
+        async with self._pipeline() as pipe:
+            for key in (
+                f"session:{user_id.hex}",
+                f"google_access_token:{user_id.hex}",
+                f"google_refresh_token:{user_id.hex}",
+                f"user_session:{user_id.hex}",
+            ):
+                # Same key layout as delete(): _CacheClient prefixes once more.
+                pipe.delete(self._get_key(self._get_key(key)))
+            await pipe.execute()
 
 
 # Global instance
@@ -3,11 +3,14 @@
 import uuid
 from typing import Any, Dict, List, Optional
 
-from sqlalchemy import select
+from sqlalchemy import delete, literal, select
+from sqlalchemy.orm import raiseload
 
 from app.auth.models.postgres_models import SocialAccount
+from app.auth.models.social_account import SocialAccountModel
 from app.common.storage.base_postgres import BaseRepository
 from app.common.storage.postgres import handle_postgres_error, postgres_storage
+from app.common.storage.query_cache import cached_read
 from app.common.utils.datetime import get_utc_datetime
 
 
@@ -43,11 +46,12 @@ class SocialAccountRepository(BaseRepository):
 
     @classmethod
     @handle_postgres_error
+    @cached_read(key=lambda account_id: f"id:{account_id}")
     async def get_social_account_by_id(
         cls, account_id: uuid.UUID
     ) -> Optional[SocialAccount]:
-        """Get social account by ID."""
-        return await cls.get_by_id(account_id.hex)
+        """Get social account by ID (Redis cached; the result is read-only)."""
+        return await cls.get_by_id(account_id)
 
     @classmethod
     @handle_postgres_error
@@ -59,10 +63,12 @@ class SocialAccountRepository(BaseRepository):
             domain=cls.domain
         ) as session:
             result = await session.execute(
-                select(cls.model_class).where(
+                select(cls.model_class)
+                .where(
                     cls.model_class.provider == provider,
                     cls.model_class.provider_user_id == provider_user_id,
                 )
+                .options(raiseload("*"))
             )
             return result.scalar_one_or_none()
 
@@ -70,18 +76,43 @@ class SocialAccountRepository(BaseRepository):
     @handle_postgres_error
     async def get_user_social_accounts(
         cls, user_id: uuid.UUID, provider: Optional[str] = None
-    ) -> List[SocialAccount]:
-        """Get all social accounts for a user, optionally filtered by provider."""
+    ) -> List[SocialAccountModel]:
+        """Get all social accounts for a user, optionally filtered by provider.
+
+        읽기 전용 목록이므로 ORM 인스턴스 대신 컬럼 튜플을 조회해
+        도메인 모델로 바로 생성 (identity map / relationship 설정 생략).
+        """
         async with postgres_storage.get_domain_read_session(
             domain=cls.domain
         ) as session:
-            stmt = select(cls.model_class).where(cls.model_class.user_id == user_id)
+            stmt = select(*cls.model_class.__table__.c).where(
+                cls.model_class.user_id == user_id
+            )
 
             if provider:
                 stmt = stmt.where(cls.model_class.provider == provider)
 
-            result = await session.execute(stmt)
-            return list(result.scalars().all())
+            rows = (await session.execute(stmt)).all()
+            return [SocialAccountModel.from_orm_trusted(r) for r in rows]
+
+    @classmethod
+    @handle_postgres_error
+    async def has_other_social_account(
+        cls, user_id: uuid.UUID, account_id: uuid.UUID
+    ) -> bool:
+        """Check whether the user has any social account other than account_id."""
+        async with postgres_storage.get_domain_read_session(
+            domain=cls.domain
+        ) as session:
+            result = await session.execute(
+                select(literal(1))
+                .where(
+                    cls.model_class.user_id == user_id,
+                    cls.model_class.id != account_id,
+                )
+                .limit(1)
+            )
+            return result.scalar() is not None
 
     @classmethod
     @handle_postgres_error
@@ -89,23 +120,34 @@ class SocialAccountRepository(BaseRepository):
         cls, account_id: uuid.UUID, **kwargs
     ) -> Optional[SocialAccount]:
         """Update social account information."""
-        return await cls.update_by_id(account_id.hex, **kwargs)
+        return await cls.update_by_id(account_id, **kwargs)
 
     @classmethod
     @handle_postgres_error
     async def update_last_used(cls, account_id: uuid.UUID) -> None:
         """Update social account's last used timestamp."""
         data = {"last_used_at": get_utc_datetime()}
-        return await cls.update_by_id(account_id.hex, **data)
+        return await cls.update_by_id(account_id, **data)
 
     @classmethod
     @handle_postgres_error
     async def delete_social_account(cls, account_id: uuid.UUID) -> bool:
         """Delete social account."""
-        return await cls.delete_by_id(account_id.hex)
+        return await cls.delete_by_id(account_id)
 
     @classmethod
     @handle_postgres_error
     async def delete_user_social_accounts(cls, user_id: uuid.UUID) -> int:
-        """Delete all social accounts for a user."""
-        return await cls.delete_by_field("user_id", user_id.hex)
+        """Delete all social accounts for a user in a single statement."""
+        async with postgres_storage.get_domain_write_session(
+            domain=cls.domain
+        ) as session:
+            stmt = (
+                delete(cls.model_class)
+                .where(cls.model_class.user_id == user_id)
+                .execution_options(synchronize_session=False)
+            )
+            result = await session.execute(stmt)
+        # 영향받은 계정 id 를 모르므로 모델 캐시 전체를 무효화
+        await cls.invalidate_cached_reads()
+        return result.rowcount
@@ -1,13 +1,19 @@
 """Token repository for JWT token management."""
 
+import time
 import uuid
-from datetime import datetime, timedelta
+from datetime import timedelta
+from hashlib import blake2b
 from typing import Any, Dict, Optional
 
-from jose import JWTError, jwt
+import jwt
+from cachetools import TTLCache
+from jwt.exceptions import PyJWTError as JWTError
 
+from app.auth.models.session_payload import SessionPayload
 from app.auth.repositories.cache.auth_cache_repository import auth_cache
 from app.common.exception import Unauthorized
+from app.common.utils.datetime import utcnow_cached
 from config.settings import settings
 
 
@@ -18,6 +24,12 @@ class TokenRepository:
         self.secret_key = settings.jwt_secret_key
         self.algorithm = settings.jwt_algorithm
         self.access_token_expire_minutes = settings.jwt_access_token_expire_minutes
+        # Decoded payloads per worker, keyed by token digest (JWT is deterministic)
+        self._payload_cache: TTLCache = TTLCache(maxsize=10_000, ttl=60)
+
+    @staticmethod
+    def _token_cache_key(token: str) -> bytes:
+        return blake2b(token.encode(), digest_size=16).digest()
 
     def create_access_token(
         self,
@@ -27,21 +39,20 @@ class TokenRepository:
         expires_delta: Optional[timedelta] = None,
     ) -> Dict[str, Any]:
         """Create JWT access token."""
-        if expires_delta:
-            expire = datetime.utcnow() + expires_delta
-        else:
-            expire = datetime.utcnow() + timedelta(
-                minutes=self.access_token_expire_minutes
-            )
+        now = utcnow_cached(int(time.time()))
+        if expires_delta is None:
+            expires_delta = timedelta(minutes=self.access_token_expire_minutes)
+        expire = now + expires_delta
+        expires_in = int(expires_delta.total_seconds())
 
-        jti = str(uuid.uuid4())  # JWT ID for token tracking
+        jti = uuid.uuid4().hex  # JWT ID for token tracking
 
         to_encode = {
-            "sub": str(user_id),  # Subject (user ID)
+            "sub": user_id.hex,  # Subject (user ID)
             "email": email,
             "user_level": user_level,
             "exp": expire,  # Expiration time
-            "iat": datetime.utcnow(),  # Issued at
+            "iat": now,  # Issued at
             "jti": jti,  # JWT ID
             "type": "access",
         }
@@ -51,11 +62,7 @@ class TokenRepository:
         return {
             "access_token": encoded_jwt,
             "token_type": "bearer",
-            "expires_in": (
-                int(expires_delta.total_seconds())
-                if expires_delta
-                else self.access_token_expire_minutes * 60
-            ),
+            "expires_in": expires_in,
             "expires_at": expire,
             "jti": jti,
         }
@@ -64,17 +71,18 @@ class TokenRepository:
         self, user_id: uuid.UUID, expires_delta: Optional[timedelta] = None
     ) -> Dict[str, Any]:
         """Create JWT refresh token."""
+        now = utcnow_cached(int(time.time()))
         if expires_delta:
-            expire = datetime.utcnow() + expires_delta
+            expire = now + expires_delta
         else:
-            expire = datetime.utcnow() + timedelta(days=30)  # 30 days for refresh token
+            expire = now + timedelta(days=30)  # 30 days for refresh token
 
-        jti = str(uuid.uuid4())
+        jti = uuid.uuid4().hex
 
         to_encode = {
-            "sub": str(user_id),
+            "sub": user_id.hex,
             "exp": expire,
-            "iat": datetime.utcnow(),
+            "iat": now,
             "jti": jti,
             "type": "refresh",
         }
@@ -83,23 +91,39 @@ class TokenRepository:
 
         return {"refresh_token": encoded_jwt, "expires_at": expire, "jti": jti}
 
+    def decode_token(self, token: str) -> Dict[str, Any]:
+        """Check signature/expiry and decode JWT token (no blacklist lookup)."""
+        cache_key = self._token_cache_key(token)
+        payload = self._payload_cache.get(cache_key)
+
+        if payload is None or payload.get("exp", 0) <= time.time():
+            try:
+                payload = jwt.decode(
+                    token, self.secret_key, algorithms=[self.algorithm]
+                )
+            except JWTError:
+                self._payload_cache.pop(cache_key, None)
+                raise Unauthorized(message="Invalid token")
+            self._payload_cache[cache_key] = payload
+
+        return payload
+
+    async def ensure_not_revoked(self, payload: Dict[str, Any]) -> None:
+        """Raise if the decoded token has been blacklisted."""
+        jti = payload.get("jti")
+        if jti and await auth_cache.is_jwt_token_blacklisted(jti):
+            raise Unauthorized(message="Token has been revoked")
+
     async def verify_token(self, token: str) -> Dict[str, Any]:
         """Verify and decode JWT token."""
-        try:
-            payload = jwt.decode(token, self.secret_key, algorithms=[self.algorithm])
-
-            # Check if token is blacklisted
-            jti = payload.get("jti")
-            if jti and await auth_cache.is_jwt_token_blacklisted(jti):
-                raise Unauthorized(message="Token has been revoked")
-
-            return payload
-
-        except JWTError:
-            raise Unauthorized(message="Invalid token")
+        payload = self.decode_token(token)
+        # Check if token is blacklisted (always, even on cache hits)
+        await self.ensure_not_revoked(payload)
+        return payload
 
     async def blacklist_token(self, token: str) -> None:
         """Add token to blacklist."""
+        self._payload_cache.pop(self._token_cache_key(token), None)
         try:
             payload = jwt.decode(token, self.secret_key, algorithms=[self.algorithm])
             jti = payload.get("jti")
@@ -107,7 +131,7 @@ class TokenRepository:
 
             if jti and exp:
                 # Calculate remaining time for the token
-                expire_time = int(exp - datetime.utcnow().timestamp())
+                expire_time = int(exp - time.time())
                 if expire_time > 0:
                     await auth_cache.blacklist_jwt_token(jti, expire_time)
 
@@ -133,8 +157,8 @@ class TokenRepository:
         # Create new access token
         return self.create_access_token(
             user_id=user_id,
-            email=session_data["email"],
-            user_level=session_data["user_level"],
+            email=session_data.email,
+            user_level=session_data.user_level,
         )
 
     async def get_current_user_id(self, token: str) -> uuid.UUID:
@@ -142,15 +166,20 @@ class TokenRepository:
         payload = await self.verify_token(token)
         return uuid.UUID(payload.get("sub"))
 
+    @staticmethod
+    def build_session(email: str, user_level: int) -> SessionPayload:
+        """Build the session payload stored alongside issued JWTs."""
+        return SessionPayload(
+            email=email,
+            user_level=user_level,
+            created_at=utcnow_cached(int(time.time())).isoformat(),
+        )
+
     async def set_session(
         self, user_id: uuid.UUID, email: str, user_level: int, expires_in: int
     ) -> None:
         """Store user session in cache."""
-        session_data = {
-            "email": email,
-            "user_level": user_level,
-            "created_at": datetime.utcnow().isoformat(),
-        }
+        session_data = self.build_session(email, user_level)
         await auth_cache.set_jwt_session(user_id, session_data, expire=expires_in)
 
     async def clear_session(self, user_id: uuid.UUID) -> None:
@@ -1,15 +1,33 @@
 """User repository for database operations."""
 
+import asyncio
+import functools
 import uuid
-from typing import List, Optional
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
-from sqlalchemy import select
-from sqlalchemy.orm import selectinload
+from cachetools import TTLCache
+from sqlalchemy import DateTime, and_, column, func, select, update, values
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import load_only, raiseload, selectinload
 
-from app.auth.models.postgres_models import User
+from app.auth.models.postgres_models import SocialAccount, User
+from app.auth.repositories.cache.auth_cache_repository import auth_cache
 from app.common.storage.base_postgres import BaseRepository
 from app.common.storage.postgres import handle_postgres_error, postgres_storage
-from app.common.utils.datetime import get_utc_datetime
+from app.common.utils.datetime import get_utc_datetime, get_utc_timestamp
+
+# 캐시(JSON)에서 복원할 때 타입 변환이 필요한 컬럼
+_UUID_COLUMNS = tuple(c.key for c in User.__table__.c if isinstance(c.type, UUID))
+_DATETIME_COLUMNS = tuple(
+    c.key for c in User.__table__.c if isinstance(c.type, DateTime)
+)
+
+# L1 (프로세스 내) 캐시: Redis TTL(2h) 보다 짧게 유지해 워커 간 불일치 최소화
+_USER_L1: TTLCache = TTLCache(maxsize=10_000, ttl=60)
+# 존재하지 않는 user_id (삭제된 사용자 등) 는 짧게만 기억
+_USER_MISSING: TTLCache = TTLCache(maxsize=10_000, ttl=10)
+_USER_LOCKS: Dict[uuid.UUID, asyncio.Lock] = {}
 
 
 class UserRepository(BaseRepository):
@@ -30,7 +48,7 @@ class UserRepository(BaseRepository):
         """Create a new user."""
         user = User(
             id=uuid.uuid4(),
-            email=email,
+            email=email.lower(),
             name=name,
             profile_image_url=profile_image_url,
             user_level=user_level,
@@ -43,13 +61,113 @@ class UserRepository(BaseRepository):
     @handle_postgres_error
     async def get_user_by_id(cls, user_id: uuid.UUID) -> Optional[User]:
         """Get user by ID."""
-        return await cls.get_by_id(user_id.hex)
+        return await cls.get_by_id(user_id)
+
+    @classmethod
+    async def get_user_by_id_cached(cls, user_id: uuid.UUID) -> Optional[User]:
+        """Get user by ID via L1 (in-process) -> Redis profile cache -> DB.
+
+        캐시 hit 시 반환되는 User 는 세션에 속하지 않은(transient) 객체이므로
+        읽기 전용으로만 사용.
+        """
+        user = _USER_L1.get(user_id)
+        if user is not None:
+            return user
+        if user_id in _USER_MISSING:
+            return None
+
+        # 같은 사용자에 대한 동시 miss 는 한 번만 Redis/DB 조회
+        lock = _USER_LOCKS.setdefault(user_id, asyncio.Lock())
+        try:
+            async with lock:
+                user = _USER_L1.get(user_id)
+                if user is not None:
+                    return user
+                if user_id in _USER_MISSING:
+                    return None
+
+                cached = await auth_cache.get_user_profile(user_id)
+                if cached == {}:
+                    _USER_MISSING[user_id] = True
+                    return None
+                if cached:
+                    user = cls._user_from_cache(cached)
+                else:
+                    user = await cls.get_user_by_id(user_id)
+                    if user is None:
+                        _USER_MISSING[user_id] = True
+                        await auth_cache.set_user_missing(user_id)
+                        return None
+                    await auth_cache.set_user_profile(user_id, cls._user_to_cache(user))
+                _USER_L1[user_id] = user
+                return user
+        finally:
+            if not lock.locked():
+                _USER_LOCKS.pop(user_id, None)
+
+    @staticmethod
+    async def invalidate_user_cache(user_id: uuid.UUID) -> None:
+        """Drop the user (or its not-found marker) from the L1 and Redis caches."""
+        _USER_L1.pop(user_id, None)
+        _USER_MISSING.pop(user_id, None)
+        await auth_cache.delete_user_profile(user_id)
+
+    @staticmethod
+    def _user_to_cache(user: User) -> Dict[str, Any]:
+        return {c.key: getattr(user, c.key) for c in User.__table__.c}
+
+    @staticmethod
+    def _user_from_cache(data: Dict[str, Any]) -> User:
+        for key in _UUID_COLUMNS:
+            if data.get(key) is not None:
+                data[key] = uuid.UUID(data[key])
+        for key in _DATETIME_COLUMNS:
+            if data.get(key) is not None:
+                data[key] = datetime.fromisoformat(data[key])
+        return User(**data)
 
     @classmethod
     @handle_postgres_error
     async def get_user_by_email(cls, email: str) -> Optional[User]:
-        """Get user by email."""
-        return await cls.get_by_field(field_name="email", field_value=email.lower())
+        """Get user by email (case-insensitive, uses users_email_lower_idx)."""
+        async with postgres_storage.get_domain_read_session(
+            domain=cls.domain
+        ) as session:
+            result = await session.execute(
+                select(User).where(func.lower(User.email) == email.lower()).limit(1)
+            )
+            return result.scalar_one_or_none()
+
+    @classmethod
+    @handle_postgres_error
+    async def get_user_with_google_account(
+        cls, email: str, provider_user_id: str
+    ) -> Tuple[Optional[User], Optional[SocialAccount]]:
+        """Get user by email and the Google account for provider_user_id in one query.
+
+        소셜 계정은 user_id 로 조인하지 않고 provider id 로만 찾음 (다른 사용자에
+        연결된 계정도 반환해야 호출부가 중복 생성하지 않음).
+        """
+        async with postgres_storage.get_domain_read_session(
+            domain=cls.domain
+        ) as session:
+            result = await session.execute(
+                select(User, SocialAccount)
+                .outerjoin(
+                    SocialAccount,
+                    and_(
+                        SocialAccount.provider == "google",
+                        SocialAccount.provider_user_id == provider_user_id,
+                    ),
+                )
+                .options(raiseload("*"))
+                .where(func.lower(User.email) == email.lower())
+                .limit(1)
+            )
+            row = result.first()
+            if row is None:
+                return None, None
+            return row[0], row[1]
 
     @classmethod
     @handle_postgres_error
@@ -60,30 +178,110 @@ class UserRepository(BaseRepository):
         ) as session:
             result = await session.execute(
                 select(User)
-                .options(selectinload(User.social_accounts))
+                .options(selectinload(User.social_accounts), raiseload("*"))
                 .where(User.id == user_id)
             )
             return result.scalar_one_or_none()
 
+    @classmethod
+    @handle_postgres_error
+    async def get_users_with_social_accounts(
+        cls,
+        limit: int = 100,
+        offset: int = 0,
+        provider: Optional[str] = None,
+    ) -> List[User]:
+        """List users with social accounts eagerly loaded (2 queries in total)."""
+        async with postgres_storage.get_domain_read_session(
+            domain=cls.domain
+        ) as session:
+            # social_accounts 외 관계의 lazy load(N+1)는 즉시 에러로 드러나도록
+            stmt = select(User).options(
+                selectinload(User.social_accounts), raiseload("*")
+            )
+
+            if provider:
+                stmt = (
+                    stmt.join(SocialAccount)
+                    .where(SocialAccount.provider == provider)
+                    .distinct()
+                )
+
+            stmt = stmt.order_by(User.created_at).offset(offset).limit(limit)
+            result = await session.execute(stmt)
+            return list(result.scalars().all())
+
     @classmethod
     @handle_postgres_error
     async def update_user(cls, user_id: uuid.UUID, **kwargs) -> Optional[User]:
         """Update user information."""
         kwargs.update({"updated_at": get_utc_datetime()})
-        return await cls.update_by_id(user_id, **kwargs)
+        user = await cls.update_by_id(user_id, **kwargs)
+        # 요청 세션이면 commit 이후에 무효화해야 그 사이 조회가 옛 값을 다시 캐시하지 않음
+        await postgres_storage.run_after_commit(
+            cls.domain, functools.partial(cls.invalidate_user_cache, user_id)
+        )
+        return user
 
     @classmethod
-    @handle_postgres_error
     async def update_last_login(cls, user_id: uuid.UUID) -> None:
-        """Update user's last login timestamp."""
-        data = {"updated_at": get_utc_datetime()}
-        return await cls.update_by_id(user_id, **data)
+        """Buffer user's last login timestamp in Redis.
+
+        DB 반영은 flush_last_logins 가 주기적으로 한 번의 UPDATE 로 처리.
+        """
+        await auth_cache.buffer_last_login(user_id, get_utc_timestamp())
+
+    @classmethod
+    @handle_postgres_error
+    async def flush_last_logins(cls) -> int:
+        """Write buffered login timestamps with a single bulk UPDATE."""
+        pending = await auth_cache.drain_last_logins()
+        if not pending:
+            return 0
+
+        written = False
+        try:
+            rows = [
+                (uuid.UUID(user_hex), datetime.fromtimestamp(ts, tz=timezone.utc))
+                for user_hex, ts in pending.items()
+            ]
+            pending_values = values(
+                column("id", UUID(as_uuid=True)),
+                column("ts", DateTime(timezone=True)),
+                name="v",
+            ).data(rows)
+            async with postgres_storage.get_domain_write_session(
+                domain=cls.domain
+            ) as session:
+                # UPDATE users SET updated_at = v.ts FROM (VALUES ...) v(id, ts) ...
+                await session.execute(
+                    update(User)
+                    .where(User.id == pending_values.c.id)
+                    .values(updated_at=pending_values.c.ts)
+                    .execution_options(synchronize_session=False)
+                )
+            written = True
+        finally:
+            if not written:
+                # 실패나 취소(CancelledError) 시 다음 flush 가 다시 쓰도록 버퍼로 되돌림
+                await auth_cache.restore_last_logins(pending)
+
+        user_ids = [user_id for user_id, _ in rows]
+        for user_id in user_ids:
+            _USER_L1.pop(user_id, None)
+        await auth_cache.delete_user_profiles(user_ids)
+        return len(rows)
 
     @classmethod
     @handle_postgres_error
     async def delete_user(cls, user_id: uuid.UUID) -> bool:
         """Delete user and all associated data."""
-        return await cls.delete_by_id(user_id)
+        deleted = await cls.delete_by_id(user_id)
+        # 요청 세션이면 commit 이후에 무효화해야 그 사이 조회가 옛 값을 다시 캐시하지 않음
+        await postgres_storage.run_after_commit(
+            cls.domain, functools.partial(cls.invalidate_user_cache, user_id)
+        )
+        return deleted
 
     @classmethod
     @handle_postgres_error
@@ -92,7 +290,37 @@ class UserRepository(BaseRepository):
         limit: int = 100,
         offset: int = 0,
         is_active: Optional[bool] = None,
+        columns: Optional[Sequence[str]] = None,
     ) -> List[User]:
         """List users with pagination."""
-        filters = {"is_active": is_active}
-        return await cls.list_all(limit=limit, offset=offset, filters=filters)
+        filters = {"is_active": is_active} if is_active is not None else None
+        return await cls.list_all(
+            limit=limit, offset=offset, filters=filters, columns=columns
+        )
+
+    @classmethod
+    @handle_postgres_error
+    async def list_users_keyset(
+        cls,
+        after_id: Optional[uuid.UUID] = None,
+        limit: int = 100,
+        is_active: Optional[bool] = None,
+        columns: Optional[Sequence[str]] = None,
+    ) -> List[User]:
+        """List users ordered by id, starting after the given cursor.
+
+        OFFSET 과 달리 앞 페이지 행을 읽고 버리지 않으므로 깊은 페이지도 일정한 비용.
+        """
+        async with postgres_storage.get_domain_read_session(
+            domain=cls.domain
+        ) as session:
+            stmt = select(User).order_by(User.id).limit(limit)
+            if after_id is not None:
+                stmt = stmt.where(User.id > after_id)
+            if is_active is not None:
+                stmt = stmt.where(User.is_active == is_active)
+            if columns:
+                stmt = stmt.options(load_only(*(getattr(User, c) for c in columns)))
+
+            result = await session.execute(stmt)
+            return list(result.scalars().all())
@@ -4,7 +4,7 @@ import uuid
 from datetime import datetime
 from typing import List, Optional
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
 
 
 class UserResponse(BaseModel):
@@ -86,3 +86,7 @@ class MessageResponse(BaseModel):
     """Generic message response model."""
 
     message: str = Field(..., description="Response message")
+
+
+# 모듈 로드 시 한 번만 생성해 요청마다 재사용
+USER_ADAPTER = TypeAdapter(UserResponse)
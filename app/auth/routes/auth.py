@@ -1,8 +1,10 @@
 import uuid
 from typing import List, Optional
 
-from fastapi import APIRouter, Depends, Header, HTTPException, Request, status
+from fastapi import APIRouter, Depends, HTTPException, Request, status
+from fastapi.responses import ORJSONResponse
 from fastapi.routing import APIRoute
+from pydantic import TypeAdapter
 
 from app.auth import logger
 from app.auth.models.postgres_models import User
@@ -13,6 +15,7 @@ from app.auth.representations.request import (
     UserUpdateRequest,
 )
 from app.auth.representations.response import (
+    USER_ADAPTER,
     GoogleLoginResponse,
     LoginResponse,
     MessageResponse,
@@ -21,8 +24,12 @@ from app.auth.representations.response import (
     UserResponse,
 )
 from app.auth.services.oauth_service import oauth_service
-from app.auth.services.token_service import get_current_user
-from app.auth.services.user_service import user_service
+from app.auth.services.token_service import (
+    AuthContext,
+    get_authenticated_context,
+    get_current_user,
+)
+from app.auth.services.user_service import UserService, get_request_user_service
 from app.common.exception import APIException
 from app.common.middleware.rate_limiting import RATE_LIMITS, limiter
 
@@ -30,8 +37,11 @@ auth_public_router_v1 = APIRouter(
     route_class=APIRoute,
     prefix="/api/v1/auth",
     tags=["auth"],
+    default_response_class=ORJSONResponse,
 )
 
+_SOCIAL_LIST_ADAPTER = TypeAdapter(List[SocialAccountResponse])
+
 
 @auth_public_router_v1.get("/google/login/", response_model=GoogleLoginResponse)
 @limiter.limit(RATE_LIMITS["oauth"])
@@ -58,19 +68,19 @@ async def google_callback(
 ):
     """Handle Google OAuth callback and authenticate user."""
     try:
-        print(callback_request.code)
-        print(callback_request.state)
-
         user, tokens, is_new_user = await oauth_service.handle_google_callback(
             callback_request.code, callback_request.state
         )
 
-        print(user)
-        print(tokens)
-        print(is_new_user)
+        logger.debug(
+            "google_callback code=%s state=%s new_user=%s",
+            callback_request.code[:8],
+            callback_request.state[:8],
+            is_new_user,
+        )
 
         return LoginResponse(
-            user=UserResponse.model_validate(user),
+            user=USER_ADAPTER.validate_python(user, from_attributes=True),
             tokens=tokens,
             is_new_user=is_new_user,
         )
@@ -127,19 +137,10 @@ async def refresh_google_token(
 
 
 @auth_public_router_v1.post("/logout/", response_model=MessageResponse)
-async def logout(
-    current_user: User = Depends(get_current_user),
-    authorization: Optional[str] = Header(None),
-):
+async def logout(ctx: AuthContext = Depends(get_authenticated_context)):
     """Logout current user and invalidate tokens."""
     try:
-        # Extract token from Authorization header
-        token = None
-        if authorization and authorization.startswith("Bearer "):
-            token = authorization.split(" ")[1]
-
-        if token:
-            await oauth_service.logout_user(current_user.id, token)
+        await oauth_service.logout_user(ctx.user_id, ctx.token)
 
         return MessageResponse(message="Successfully logged out")
     except APIException:
@@ -157,7 +158,8 @@ async def get_current_user_info(
     current_user: User = Depends(get_current_user),
 ):
     """Get current authenticated user information."""
-    return UserResponse.model_validate(current_user)
+    user = USER_ADAPTER.validate_python(current_user, from_attributes=True)
+    return ORJSONResponse(USER_ADAPTER.dump_python(user, mode="json"))
 
 
 @auth_public_router_v1.put("/self/", response_model=UserResponse)
@@ -166,6 +168,7 @@ async def update_current_user(
     request: Request,
     update_request: UserUpdateRequest,
     current_user: User = Depends(get_current_user),
+    user_service: UserService = Depends(get_request_user_service),
 ):
     """Update current user profile information."""
     try:
@@ -174,7 +177,8 @@ async def update_current_user(
             name=update_request.name,
             profile_image_url=update_request.profile_image_url,
         )
-        return UserResponse.model_validate(updated_user)
+        user = USER_ADAPTER.validate_python(updated_user, from_attributes=True)
+        return ORJSONResponse(USER_ADAPTER.dump_python(user, mode="json"))
     except APIException:
         raise
     except Exception as e:
@@ -191,6 +195,7 @@ async def update_current_user(
 async def get_user_social_accounts(
     current_user: User = Depends(get_current_user),
     provider: Optional[str] = None,
+    user_service: UserService = Depends(get_request_user_service),
 ):
     """Get current user's connected social accounts."""
     try:
@@ -198,9 +203,11 @@ async def get_user_social_accounts(
             current_user.id, provider
         )
 
-        return [
-            SocialAccountResponse.model_validate(account) for account in social_accounts
-        ]
+        # 이미 검증된 리스트를 직접 직렬화해 response_model 재검증을 건너뜀
+        accounts = _SOCIAL_LIST_ADAPTER.validate_python(
+            social_accounts, from_attributes=True
+        )
+        return ORJSONResponse(_SOCIAL_LIST_ADAPTER.dump_python(accounts, mode="json"))
     except APIException:
         raise
     except Exception as e:
@@ -215,15 +222,14 @@ async def get_user_social_accounts(
     "/self/social-accounts/{account_id}/", response_model=MessageResponse
 )
 async def disconnect_social_account(
-    account_id: str,
+    account_id: uuid.UUID,
     current_user: User = Depends(get_current_user),
+    user_service: UserService = Depends(get_request_user_service),
 ):
     """Disconnect a social account from current user."""
     try:
-        account_uuid = uuid.UUID(account_id)
-
         success = await user_service.disconnect_social_account(
-            current_user.id, account_uuid
+            current_user.id, account_id
         )
 
         if success:
@@ -233,11 +239,6 @@ async def disconnect_social_account(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Social account not found",
             )
-    except ValueError:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Invalid account ID format",
-        )
     except APIException:
         raise
     except Exception as e:
@@ -249,7 +250,10 @@ async def disconnect_social_account(
 
 
 @auth_public_router_v1.delete("/self/", response_model=MessageResponse)
-async def delete_current_user(current_user: User = Depends(get_current_user)):
+async def delete_current_user(
+    current_user: User = Depends(get_current_user),
+    user_service: UserService = Depends(get_request_user_service),
+):
     """Delete current user account permanently."""
     try:
         success = await user_service.delete_user(current_user.id)
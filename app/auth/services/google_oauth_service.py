@@ -5,6 +5,7 @@ from typing import Any, Dict, Tuple
 from urllib.parse import urlencode
 
 import httpx
+from cachetools import TTLCache
 
 from app.auth.repositories.cache.auth_cache_repository import auth_cache
 from app.common.exception import BadRequest, ServerError
@@ -13,6 +14,9 @@ from app.common.storage.redis import CacheExpire
 from app.common.utils.datetime import get_utc_timestamp
 from config.settings import settings
 
+# 이미 소비됐거나 존재하지 않는 state (재시도/재생 콜백은 Redis 조회 없이 거절)
+_STATE_NEG: TTLCache = TTLCache(maxsize=10_000, ttl=5)
+
 
 class GoogleOAuthService:
     """Google OAuth 2.0 service implementation."""
@@ -30,43 +34,63 @@ class GoogleOAuthService:
         # OAuth scopes
         self.scopes = ["openid", "email", "profile"]
 
+        # state 를 제외한 인가 URL 파라미터는 고정값이므로 한 번만 인코딩
+        self._auth_url_prefix = "{}?{}".format(
+            self.auth_endpoint,
+            urlencode(
+                {
+                    "client_id": self.client_id,
+                    "redirect_uri": self.redirect_uri,
+                    "scope": " ".join(self.scopes),
+                    "response_type": "code",
+                    "access_type": "offline",  # Request refresh token
+                    "prompt": "consent",  # Force consent screen to get refresh token
+                }
+            ),
+        )
+        self._token_request_headers = {"Accept": "application/json"}
+
+        # Google 과의 TCP/TLS 연결을 요청 간 재사용
+        self._client = httpx.AsyncClient(
+            http2=True,
+            timeout=httpx.Timeout(10.0),
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=50),
+        )
+
+    async def aclose(self) -> None:
+        """Close the shared HTTP client (app shutdown)."""
+        await self._client.aclose()
+
     async def generate_auth_url(self) -> Tuple[str, str]:
         """Generate Google OAuth authorization URL with state parameter."""
-        # Generate secure random state for CSRF protection
-        state = secrets.token_urlsafe(32)
-
-        # Set state in cache for verification
         state_data = {
             "created_at": get_utc_timestamp(),  # Just a timestamp placeholder
             "provider": "google",
         }
-        await auth_cache.set_oauth_state(
-            state, state_data, expire=CacheExpire.MINUTE * 10
-        )  # 1 minutes
 
-        # Build authorization URL
-        params = {
-            "client_id": self.client_id,
-            "redirect_uri": self.redirect_uri,
-            "scope": " ".join(self.scopes),
-            "response_type": "code",
-            "state": state,
-            "access_type": "offline",  # Request refresh token
-            "prompt": "consent",  # Force consent screen to get refresh token
-        }
+        # Generate secure random state for CSRF protection; SET NX guarantees
+        # it is unique, so regenerate in the (practically impossible) collision
+        while True:
+            state = secrets.token_urlsafe(32)
+            if await auth_cache.set_oauth_state(
+                state, state_data, expire=CacheExpire.MINUTE * 10
+            ):
+                break
 
-        auth_url = f"{self.auth_endpoint}?{urlencode(params)}"
+        # Build authorization URL (token_urlsafe output needs no escaping)
+        auth_url = f"{self._auth_url_prefix}&state={state}"
 
         return auth_url, state
 
     async def verify_state(self, state: str) -> bool:
-        """Verify OAuth state parameter."""
-        state_data = await auth_cache.get_oauth_state(state)
+        """Verify OAuth state parameter (single-use, consumed atomically)."""
+        if state in _STATE_NEG:
+            return False
+        state_data = await auth_cache.pop_oauth_state(state)
         if not state_data:
+            # Redis 에서 없다고 확인된 경우에만 기억 (조회 실패 시 재시도 가능해야 함)
+            _STATE_NEG[state] = True
             return False
-
-        # Clean up state after verification
-        await auth_cache.delete_oauth_state(state)
         return True
 
     async def exchange_code_for_tokens(self, code: str) -> Dict[str, Any]:
@@ -79,55 +103,51 @@ class GoogleOAuthService:
             "redirect_uri": self.redirect_uri,
         }
 
-        async with httpx.AsyncClient() as client:
-            try:
-                response = await client.post(
-                    self.token_endpoint,
-                    data=token_data,
-                    headers={"Accept": "application/json"},
-                )
-                response.raise_for_status()
+        try:
+            response = await self._client.post(
+                self.token_endpoint,
+                data=token_data,
+                headers=self._token_request_headers,
+            )
+            response.raise_for_status()
 
-                tokens = response.json()
+            tokens = response.json()
 
-                # Validate required fields
-                if "access_token" not in tokens:
-                    raise BadRequest(
-                        message="Failed to obtain access token from Google"
-                    )
+            # Validate required fields
+            if "access_token" not in tokens:
+                raise BadRequest(message="Failed to obtain access token from Google")
 
-                return tokens
+            return tokens
 
-            except httpx.HTTPStatusError as e:
-                logger.error(f"Google token exchange failed: {e.response.text}")
-                raise BadRequest(message="Failed to exchange authorization code")
-            except Exception as e:
-                logger.error(f"Google token exchange error: {str(e)}")
-                raise ServerError(message="OAuth token exchange failed")
+        except httpx.HTTPStatusError as e:
+            logger.error(f"Google token exchange failed: {e.response.text}")
+            raise BadRequest(message="Failed to exchange authorization code")
+        except Exception as e:
+            logger.error(f"Google token exchange error: {str(e)}")
+            raise ServerError(message="OAuth token exchange failed")
 
     async def get_user_info(self, access_token: str) -> Dict[str, Any]:
         """Get user information from Google using access token."""
         headers = {"Authorization": f"Bearer {access_token}"}
 
-        async with httpx.AsyncClient() as client:
-            try:
-                response = await client.get(self.userinfo_endpoint, headers=headers)
-                response.raise_for_status()
+        try:
+            response = await self._client.get(self.userinfo_endpoint, headers=headers)
+            response.raise_for_status()
 
-                user_info = response.json()
+            user_info = response.json()
 
-                # Validate required fields
-                if "email" not in user_info:
-                    raise BadRequest(message="Email not provided by Google")
+            # Validate required fields
+            if "email" not in user_info:
+                raise BadRequest(message="Email not provided by Google")
 
-                return user_info
+            return user_info
 
-            except httpx.HTTPStatusError as e:
-                logger.error(f"Google user info request failed: {e.response.text}")
-                raise BadRequest(message="Failed to fetch user information from Google")
-            except Exception as e:
-                logger.error(f"Google user info error: {str(e)}")
-                raise ServerError(message="Failed to fetch user information")
+        except httpx.HTTPStatusError as e:
+            logger.error(f"Google user info request failed: {e.response.text}")
+            raise BadRequest(message="Failed to fetch user information from Google")
+        except Exception as e:
+            logger.error(f"Google user info error: {str(e)}")
+            raise ServerError(message="Failed to fetch user information")
 
     async def refresh_access_token(self, refresh_token: str) -> Dict[str, Any]:
         """Refresh Google access token using refresh token."""
@@ -138,40 +158,38 @@ class GoogleOAuthService:
             "grant_type": "refresh_token",
         }
 
-        async with httpx.AsyncClient() as client:
-            try:
-                response = await client.post(
-                    self.token_endpoint,
-                    data=token_data,
-                    headers={"Accept": "application/json"},
-                )
-                response.raise_for_status()
+        try:
+            response = await self._client.post(
+                self.token_endpoint,
+                data=token_data,
+                headers=self._token_request_headers,
+            )
+            response.raise_for_status()
 
-                tokens = response.json()
+            tokens = response.json()
 
-                if "access_token" not in tokens:
-                    raise BadRequest(message="Failed to refresh Google access token")
+            if "access_token" not in tokens:
+                raise BadRequest(message="Failed to refresh Google access token")
 
-                return tokens
+            return tokens
 
-            except httpx.HTTPStatusError as e:
-                logger.error(f"Google token refresh failed: {e.response.text}")
-                raise BadRequest(message="Failed to refresh Google access token")
-            except Exception as e:
-                logger.error(f"Google token refresh error: {str(e)}")
-                raise ServerError(message="Token refresh failed")
+        except httpx.HTTPStatusError as e:
+            logger.error(f"Google token refresh failed: {e.response.text}")
+            raise BadRequest(message="Failed to refresh Google access token")
+        except Exception as e:
+            logger.error(f"Google token refresh error: {str(e)}")
+            raise ServerError(message="Token refresh failed")
 
     async def revoke_token(self, token: str) -> bool:
         """Revoke Google access or refresh token."""
         revoke_url = f"https://oauth2.googleapis.com/revoke?token={token}"
 
-        async with httpx.AsyncClient() as client:
-            try:
-                response = await client.post(revoke_url)
-                return response.status_code == 200
-            except Exception as e:
-                logger.error(f"Google token revocation error: {str(e)}")
-                return False
+        try:
+            response = await self._client.post(revoke_url)
+            return response.status_code == 200
+        except Exception as e:
+            logger.error(f"Google token revocation error: {str(e)}")
+            return False
 
 
 # Global instance
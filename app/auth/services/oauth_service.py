@@ -1,8 +1,10 @@
 """OAuth service for handling authentication flows."""
 
+import asyncio
 import uuid
 from typing import Any, Dict, Tuple
 
+from app.auth.cache.token_lookup_cache import token_lookup_cache
 from app.auth.models.postgres_models import User
 from app.auth.repositories.cache.auth_cache_repository import auth_cache
 from app.auth.repositories.token_repository import token_repository
@@ -57,32 +59,27 @@ class OAuthService:
             )
         )
 
-        # Update last login
-        await self.user_service.update_last_login(user.id)
-
-        # Set Google tokens in cache
-        if refresh_token:
-            await auth_cache.set_google_refresh_token(user.id, refresh_token)
-
         # Calculate token expiration
         expires_in = google_tokens.get("expires_in", 3600)  # Default 1 hour
-        await auth_cache.set_google_access_token(
-            user.id, access_token, expire=expires_in
-        )
 
-        # Create JWT tokens
+        # Create JWT tokens (CPU only, no I/O)
         access_token_data = self.token_repo.create_access_token(
             user_id=user.id, email=user.email, user_level=user.user_level
         )
 
         refresh_token_data = self.token_repo.create_refresh_token(user.id)
 
-        # Set session in cache
-        await self.token_repo.set_session(
-            user_id=user.id,
-            email=user.email,
-            user_level=user.user_level,
-            expires_in=access_token_data["expires_in"],
+        # Update last login (DB) and store Google tokens + session (Redis pipeline)
+        await asyncio.gather(
+            self.user_service.update_last_login(user.id),
+            auth_cache.set_google_tokens_and_session(
+                user.id,
+                access_token,
+                refresh_token,
+                expires_in,
+                self.token_repo.build_session(user.email, user.user_level),
+                session_expire=access_token_data["expires_in"],
+            ),
         )
 
         # Create token response
@@ -135,30 +132,35 @@ class OAuthService:
 
     async def logout_user(self, user_id: uuid.UUID, access_token: str) -> None:
         """Logout user and cleanup tokens."""
-        # Blacklist the current JWT token
-        await self.token_repo.blacklist_token(access_token)
-
-        # Clear user session
-        await self.token_repo.clear_session(user_id)
-
-        # Try to revoke Google tokens
-        google_access_token = await auth_cache.get_google_access_token(user_id)
-        if google_access_token:
-            await self.google_oauth.revoke_token(google_access_token)
-
-        google_refresh_token = await auth_cache.get_google_refresh_token(user_id)
-        if google_refresh_token:
-            await self.google_oauth.revoke_token(google_refresh_token)
+        google_access_token, google_refresh_token = await auth_cache.get_google_tokens(
+            user_id
+        )
 
-        # Clear all cached auth data
-        await auth_cache.clear_user_auth_data(user_id)
+        # Blacklist JWT, clear session, revoke Google tokens and clear cached
+        # auth data concurrently (revocations are independent HTTPS calls)
+        await asyncio.gather(
+            self.token_repo.blacklist_token(access_token),
+            token_lookup_cache.invalidate(access_token),
+            self.token_repo.clear_session(user_id),
+            (
+                self.google_oauth.revoke_token(google_access_token)
+                if google_access_token
+                else asyncio.sleep(0)
+            ),
+            (
+                self.google_oauth.revoke_token(google_refresh_token)
+                if google_refresh_token
+                else asyncio.sleep(0)
+            ),
+            auth_cache.clear_user_auth_data(user_id),
+        )
 
         logger.info(f"User logged out: {user_id}")
 
     async def get_current_user_from_token(self, token: str) -> User:
         """Get current user from JWT token."""
         user_id = await self.token_repo.get_current_user_id(token)
-        return await self.user_service.get_user_by_id(user_id)
+        return await self.user_service.get_current_user(user_id)
 
     async def validate_token(self, token: str) -> Dict[str, Any]:
         """Validate JWT token and return payload."""
@@ -1,26 +1,73 @@
 """Token service for JWT management and authentication middleware."""
 
+import asyncio
+import uuid
+from dataclasses import dataclass
 from typing import Optional
 
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 
 from app.auth import logger
+from app.auth.cache.token_lookup_cache import token_lookup_cache
 from app.auth.models.postgres_models import User
+from app.auth.repositories.token_repository import token_repository
 from app.auth.services.oauth_service import oauth_service
+from app.auth.services.user_service import user_service
 from app.common.exception import Unauthorized
 
 # Security scheme for API documentation
 security = HTTPBearer()
 
 
+@dataclass(frozen=True)
+class AuthContext:
+    """Per-request authentication result."""
+
+    user: User
+    token: str
+
+    @property
+    def user_id(self) -> uuid.UUID:
+        return self.user.id
+
+
 class TokenService:
     """Service for token validation and authentication."""
 
-    async def get_current_user(
-        self, credentials: HTTPAuthorizationCredentials = Depends(security)
-    ) -> User:
-        """Get current authenticated user from JWT token."""
+    async def _resolve_user(self, token: str) -> User:
+        """Resolve bearer token to user (token lookup cache -> JWT verification)."""
+        user_id = await token_lookup_cache.get(token)
+        if user_id is not None:
+            return await user_service.get_current_user(user_id)
+
+        # 서명/만료 검증은 CPU 작업이라 먼저 수행하고, 블랙리스트 확인(Redis)과
+        # 사용자 조회(캐시/DB)는 서로 독립적이므로 동시에 실행
+        try:
+            payload = token_repository.decode_token(token)
+        except Unauthorized:
+            token_lookup_cache.set_negative(token)
+            raise
+        user_id = uuid.UUID(payload["sub"])
+        revoke_check, user = await asyncio.gather(
+            token_repository.ensure_not_revoked(payload),
+            user_service.get_current_user(user_id),
+            return_exceptions=True,
+        )
+        if isinstance(revoke_check, Unauthorized):
+            token_lookup_cache.set_negative(token)
+        if isinstance(revoke_check, BaseException):
+            raise revoke_check
+        if isinstance(user, BaseException):
+            raise user
+
+        await token_lookup_cache.set(token, user_id, payload.get("exp"))
+        return user
+
+    async def get_authenticated_context(
+        self, credentials: Optional[HTTPAuthorizationCredentials]
+    ) -> AuthContext:
+        """Authenticate bearer credentials and build the request's AuthContext."""
         if not credentials:
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
@@ -29,19 +76,7 @@ class TokenService:
             )
 
         try:
-            user = await oauth_service.get_current_user_from_token(
-                credentials.credentials
-            )
-
-            if not user.is_active:
-                raise HTTPException(
-                    status_code=status.HTTP_401_UNAUTHORIZED,
-                    detail="User account is deactivated",
-                    headers={"WWW-Authenticate": "Bearer"},
-                )
-
-            return user
-
+            user = await self._resolve_user(credentials.credentials)
         except Unauthorized as e:
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
@@ -56,19 +91,24 @@ class TokenService:
                 headers={"WWW-Authenticate": "Bearer"},
             )
 
-    async def get_current_active_user(
-        self, current_user: User = Depends(lambda self: self.get_current_user)
-    ) -> User:
-        """Get current active user (same as get_current_user but explicit)."""
-        return current_user
+        if not user.is_active:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="User account is deactivated",
+                headers={"WWW-Authenticate": "Bearer"},
+            )
 
-    async def get_current_admin_user(
-        self, current_user: User = Depends(lambda self: self.get_current_user)
+        return AuthContext(user=user, token=credentials.credentials)
+
+    async def get_current_user(
+        self, credentials: HTTPAuthorizationCredentials = Depends(security)
     ) -> User:
-        """Get current user if they are admin."""
-        from app.common.enums.user_level import UserLevel
+        """Get current authenticated user from JWT token."""
+        return (await self.get_authenticated_context(credentials)).user
 
-        if not UserLevel.is_admin(current_user.user_level):
+    async def get_current_admin_user(self, current_user: User) -> User:
+        """Get current user if they are admin."""
+        if not current_user.is_admin:
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail="Admin access required",
@@ -85,9 +125,7 @@ class TokenService:
             return None
 
         try:
-            return await oauth_service.get_current_user_from_token(
-                credentials.credentials
-            )
+            return await self._resolve_user(credentials.credentials)
         except Exception as e:
             logger.warning(e)
             return None
@@ -102,11 +140,18 @@ token_service = TokenService()
 
 
 # Dependency functions for FastAPI
-async def get_current_user(
+async def get_authenticated_context(
     credentials: HTTPAuthorizationCredentials = Depends(security),
+) -> AuthContext:
+    """FastAPI dependency resolving the bearer token once per request."""
+    return await token_service.get_authenticated_context(credentials)
+
+
+async def get_current_user(
+    ctx: AuthContext = Depends(get_authenticated_context),
 ) -> User:
     """FastAPI dependency to get current authenticated user."""
-    return await token_service.get_current_user(credentials)
+    return ctx.user
 
 
 async def get_current_admin_user(
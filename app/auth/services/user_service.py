@@ -1,9 +1,15 @@
 """User service for user management operations."""
 
+import asyncio
 import uuid
 from typing import Any, Dict, Optional, Tuple
 
+from fastapi import Depends
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.auth.cache.token_lookup_cache import token_lookup_cache
 from app.auth.models.postgres_models import SocialAccount, User
+from app.auth.models.social_account import SocialAccountModel
 from app.auth.repositories.cache.auth_cache_repository import auth_cache
 from app.auth.repositories.social_account_repository import (
     SocialAccountRepository,
@@ -12,6 +18,7 @@ from app.auth.repositories.user_repository import UserRepository
 from app.common.enums.user_level import UserLevel
 from app.common.exception import BadRequest, NotFound
 from app.common.logging import logger
+from app.common.storage.postgres import get_db_session
 
 
 class UserService:
@@ -31,18 +38,13 @@ class UserService:
         provider_user_id = google_user_info["id"]
         email_verified = google_user_info.get("verified_email", False)
 
-        # Check if user already exists
-        existing_user = await self.user_repo.get_user_by_email(email)
+        # Check if user already exists, together with a linked Google account
+        existing_user, existing_social_account = (
+            await self.user_repo.get_user_with_google_account(email, provider_user_id)
+        )
         is_new_user = existing_user is None
 
         if existing_user:
-            # Check if Google account is already linked
-            existing_social_account = (
-                await self.social_account_repo.get_social_account_by_provider(
-                    "google", provider_user_id
-                )
-            )
-
             if existing_social_account:
                 # Update last used timestamp
                 await self.social_account_repo.update_last_used(
@@ -93,8 +95,15 @@ class UserService:
         return user, social_account, is_new_user
 
     async def get_user_by_id(self, user_id: uuid.UUID) -> User:
-        """Get user by ID."""
-        user = await self.user_repo.get_user_by_id(user_id)
+        """Get user by ID (cached; the returned user is read-only)."""
+        user = await self.user_repo.get_user_by_id_cached(user_id)
+        if not user:
+            raise NotFound(message="User not found")
+        return user
+
+    async def get_current_user(self, user_id: uuid.UUID) -> User:
+        """Get the authenticated user (profile cache first, then DB)."""
+        user = await self.user_repo.get_user_by_id_cached(user_id)
         if not user:
             raise NotFound(message="User not found")
         return user
@@ -120,9 +129,6 @@ class UserService:
         profile_image_url: Optional[str] = None,
     ) -> User:
         """Update user profile information."""
-        # Verify user exists
-        user = await self.get_user_by_id(user_id)
-
         # Build update data
         update_data = {}
         if name is not None:
@@ -134,13 +140,14 @@ class UserService:
             update_data["profile_image_url"] = profile_image_url
 
         if not update_data:
-            return user
+            return await self.get_user_by_id(user_id)
 
+        # 존재 여부는 UPDATE ... RETURNING 결과로 판단 (사전 SELECT 생략)
         updated_user = await self.user_repo.update_user(user_id, **update_data)
         if not updated_user:
             raise NotFound(message="User not found")
 
-        logger.info(f"User profile updated: {user.email} (ID: {user_id})")
+        logger.info(f"User profile updated: {updated_user.email} (ID: {user_id})")
 
         return updated_user
 
@@ -148,15 +155,28 @@ class UserService:
         """Update user's last login timestamp."""
         await self.user_repo.update_last_login(user_id)
 
+    async def run_last_login_flusher(self, interval: float = 30.0) -> None:
+        """Periodically flush buffered last-login timestamps to Postgres."""
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                flushed = await self.user_repo.flush_last_logins()
+                if flushed:
+                    logger.info(f"Flushed {flushed} buffered last-login updates")
+            except Exception as e:
+                logger.exception(e)
+
     async def deactivate_user(self, user_id: uuid.UUID) -> User:
         """Deactivate user account."""
-        updated_user = await self.user_repo.update_user(user_id, is_active=False)
+        # DB 갱신과 인증 캐시 정리는 서로 독립적이므로 동시에 수행
+        updated_user, _, _ = await asyncio.gather(
+            self.user_repo.update_user(user_id, is_active=False),
+            auth_cache.clear_user_auth_data(user_id),
+            token_lookup_cache.invalidate_user(user_id),
+        )
         if not updated_user:
             raise NotFound(message="User not found")
 
-        # Clear user cache
-        await auth_cache.clear_user_auth_data(user_id)
-
         logger.info(f"User deactivated: {updated_user.email} (ID: {user_id})")
 
         return updated_user
@@ -176,11 +196,13 @@ class UserService:
         # Verify user exists
         user = await self.get_user_by_id(user_id)
 
-        # Clear cache first
-        await auth_cache.clear_user_auth_data(user_id)
-
         # Delete user (this will cascade delete social accounts due to foreign key)
-        deleted = await self.user_repo.delete_user(user_id)
+        # while clearing its auth caches concurrently
+        deleted, _, _ = await asyncio.gather(
+            self.user_repo.delete_user(user_id),
+            auth_cache.clear_user_auth_data(user_id),
+            token_lookup_cache.invalidate_user(user_id),
+        )
 
         if deleted:
             logger.info(f"User deleted: {user.email} (ID: {user_id})")
@@ -189,7 +211,7 @@ class UserService:
 
     async def get_user_social_accounts(
         self, user_id: uuid.UUID, provider: Optional[str] = None
-    ) -> list[SocialAccount]:
+    ) -> list[SocialAccountModel]:
         """Get user's social accounts."""
         # Verify user exists
         await self.get_user_by_id(user_id)
@@ -213,10 +235,9 @@ class UserService:
             raise NotFound(message="Social account not found")
 
         # Check if user has other social accounts or password (in future)
-        user_social_accounts = await self.social_account_repo.get_user_social_accounts(
-            user_id
-        )
-        if len(user_social_accounts) <= 1:
+        if not await self.social_account_repo.has_other_social_account(
+            user_id, account_id
+        ):
             raise BadRequest(message="Cannot disconnect the only authentication method")
 
         # Delete social account
@@ -232,3 +253,12 @@ class UserService:
 
 # Global instance
 user_service = UserService()
+
+get_user_db_session = get_db_session(UserRepository.domain)
+
+
+async def get_request_user_service(
+    session: AsyncSession = Depends(get_user_db_session, scope="function"),
+) -> UserService:
+    """UserService whose repository calls share one session for the request."""
+    return user_service
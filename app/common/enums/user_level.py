@@ -9,12 +9,7 @@ class UserLevel(IntEnum):
     NORMAL = 100
     ADMIN = 1000
 
-    @classmethod
-    def is_admin(cls, level: int) -> bool:
-        """Check if user level is admin."""
-        return level >= cls.ADMIN.value
 
-    @classmethod
-    def is_normal(cls, level: int) -> bool:
-        """Check if user level is normal user."""
-        return level == cls.NORMAL.value
+# 권한 체크용 plain int 상수 (enum 속성 조회 없이 바로 비교)
+NORMAL_LEVEL: int = UserLevel.NORMAL.value
+ADMIN_LEVEL: int = UserLevel.ADMIN.value
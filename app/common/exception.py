@@ -1,13 +1,21 @@
 from typing import Dict, Optional
 
+import orjson
+from fastapi.responses import ORJSONResponse
 from starlette import status
-from starlette.responses import JSONResponse, Response
+from starlette.responses import Response
 
 
 class APIException(Exception):
     status_code = status.HTTP_500_INTERNAL_SERVER_ERROR
     message = "An unknown error"
     headers: Dict = {}
+    # 기본 메시지 응답 본문은 클래스 정의 시 한 번만 직렬화
+    _default_body: bytes = orjson.dumps({"message": message})
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._default_body = orjson.dumps({"message": cls.message})
 
     def __init__(
         self,
@@ -34,7 +42,18 @@ class APIException(Exception):
         return self.__str__()
 
     def construct_response(self) -> Response:
-        return JSONResponse(
+        cls = type(self)
+        if (
+            self.message == cls.message
+            and self.status_code == cls.status_code
+            and not self.headers
+        ):
+            return Response(
+                content=cls._default_body,
+                status_code=self.status_code,
+                media_type="application/json",
+            )
+        return ORJSONResponse(
             content={
                 "message": self.message,
             },
@@ -1,5 +1,15 @@
+import atexit
 import logging
+import queue
 import sys
+from logging.handlers import QueueListener
+
+_CONSOLE_FORMAT = "[%(asctime)s] [%(levelname)s] [%(name)s] [%(process)d] %(message)s"
+_CONSOLE_DATEFMT = "%Y-%m-%d %H:%M:%S %z"
+
+# 요청 코루틴은 큐에 넣기만 하고 실제 write() 는 리스너 스레드에서 처리
+LOG_QUEUE: queue.SimpleQueue = queue.SimpleQueue()
+ERROR_LOG_QUEUE: queue.SimpleQueue = queue.SimpleQueue()
 
 # Log config for local development
 CONSOLE_LOGGING_CONFIG: dict = {
@@ -24,29 +34,44 @@ CONSOLE_LOGGING_CONFIG: dict = {
         },
     },
     "handlers": {
+        # 포맷터는 리스너 쪽 StreamHandler 에만 지정 (start_log_listeners)
         "default": {
-            "class": "logging.StreamHandler",
-            "formatter": "default",
-            "stream": sys.stdout,
+            "()": "logging.handlers.QueueHandler",
+            "queue": "ext://app.common.logging.LOG_QUEUE",
         },
         "error": {
-            "class": "logging.StreamHandler",
-            "formatter": "default",
-            "stream": sys.stderr,
+            "()": "logging.handlers.QueueHandler",
+            "queue": "ext://app.common.logging.ERROR_LOG_QUEUE",
         },
         "ignore": {
             "class": "logging.NullHandler",
         },
     },
-    "formatters": {
-        "default": {
-            "format": "[%(asctime)s] [%(levelname)s] [%(name)s] [%(process)d] %(message)s",
-            "datefmt": "%Y-%m-%d %H:%M:%S %z",
-            "class": "logging.Formatter",
-        },
-    },
 }
 
+_LISTENERS: list = []
+
+
+def start_log_listeners() -> None:
+    """Start threads that drain the console log queues into stdout/stderr."""
+    if _LISTENERS:
+        return
+    formatter = logging.Formatter(_CONSOLE_FORMAT, datefmt=_CONSOLE_DATEFMT)
+    for log_queue, stream in ((LOG_QUEUE, sys.stdout), (ERROR_LOG_QUEUE, sys.stderr)):
+        handler = logging.StreamHandler(stream)
+        handler.setFormatter(formatter)
+        listener = QueueListener(log_queue, handler)
+        listener.start()
+        _LISTENERS.append(listener)
+    atexit.register(stop_log_listeners)
+
+
+def stop_log_listeners() -> None:
+    """Flush queued records and stop the listener threads."""
+    while _LISTENERS:
+        _LISTENERS.pop().stop()
+
+
 # Log config for local development
 UVICORN_LOGGING_CONFIG: dict = {
     "version": 1,
@@ -79,8 +104,8 @@ UVICORN_LOGGING_CONFIG: dict = {
     "formatters": {
         "default": {
             "()": "uvicorn.logging.DefaultFormatter",
-            "fmt": "[%(asctime)s] [%(levelname)s] [%(name)s] [%(process)d] %(message)s",
-            "datefmt": "%Y-%m-%d %H:%M:%S %z",
+            "fmt": _CONSOLE_FORMAT,
+            "datefmt": _CONSOLE_DATEFMT,
         },
         "access": {
             "()": "uvicorn.logging.AccessFormatter",
@@ -1,4 +1,8 @@
+import asyncio
+import logging
 import time
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional, Tuple
 
 from starlette.middleware import Middleware
 from starlette.middleware.base import (
@@ -8,7 +12,137 @@ from starlette.middleware.base import (
 from starlette.requests import Request
 from starlette.responses import Response
 
-from app.common.logging import access_logger
+from app.common.logging import access_logger, logger
+
+# (created, args, extra)
+_AccessEntry = Tuple[float, Tuple[Any, ...], Dict[str, Any]]
+
+_ACCESS_LOG_FORMAT = "%s %s HTTP/%s %d"
+
+
+class AccessLogBuffer:
+    """Collect access-log entries and emit them in batches.
+
+    요청 경로에서는 deque 에 넣기만 하고, 백그라운드 task 가 FLUSH_INTERVAL 초
+    또는 FLUSH_SIZE 건마다 레코드를 만들어 StreamHandler 에 한 번의 write 로 출력.
+    """
+
+    FLUSH_SIZE = 32
+    FLUSH_INTERVAL = 0.1
+
+    def __init__(self, maxlen: int = 1024):
+        # 과부하 시 가장 오래된 항목부터 버림
+        self._entries: Deque[_AccessEntry] = deque(maxlen=maxlen)
+        self._wakeup = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+
+    def append(self, args: Tuple[Any, ...], extra: Dict[str, Any]) -> None:
+        if self._task is None:
+            # flush task 가 없으면 (lifespan 없이 구동 등) 바로 기록
+            access_logger.info(_ACCESS_LOG_FORMAT, *args, extra=extra)
+            return
+        self._entries.append((time.time(), args, extra))
+        if len(self._entries) >= self.FLUSH_SIZE:
+            self._wakeup.set()
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        task, self._task = self._task, None
+        if task is not None:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        self.flush()
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), self.FLUSH_INTERVAL)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+            try:
+                self.flush()
+            except Exception:
+                # 한 번의 실패로 flush task 가 죽어 이후 로그가 모두 사라지지 않도록 함
+                logger.exception("Failed to flush access log buffer")
+
+    def flush(self) -> None:
+        """Emit every buffered entry, one write per stream handler."""
+        if not self._entries:
+            return
+        entries = [self._entries.popleft() for _ in range(len(self._entries))]
+        if not access_logger.isEnabledFor(logging.INFO):
+            return
+
+        records = [self._make_record(*entry) for entry in entries]
+        if access_logger.propagate:
+            # 상위 logger 핸들러까지 거쳐야 하므로 일반 경로로 처리
+            for record in records:
+                access_logger.handle(record)
+            return
+
+        for handler in access_logger.handlers:
+            if isinstance(handler, logging.StreamHandler):
+                self._write_batch(handler, records)
+            else:
+                for record in records:
+                    handler.handle(record)
+
+    @staticmethod
+    def _write_batch(
+        handler: logging.StreamHandler, records: List[logging.LogRecord]
+    ) -> None:
+        """Format records and write them to the handler's stream in one call.
+
+        handler.handle 를 거치지 않으므로 오류는 logging 과 같이 handleError 로 보고.
+        """
+        terminator = handler.terminator
+        parts = []
+        last = None
+        for record in records:
+            if not handler.filter(record) or record.levelno < handler.level:
+                continue
+            try:
+                parts.append(handler.format(record) + terminator)
+                last = record
+            except Exception:
+                handler.handleError(record)
+        if not parts:
+            return
+        try:
+            with handler.lock:
+                handler.stream.write("".join(parts))
+                handler.flush()
+        except Exception:
+            handler.handleError(last)
+
+    @staticmethod
+    def _make_record(
+        created: float, args: Tuple[Any, ...], extra: Dict[str, Any]
+    ) -> logging.LogRecord:
+        record = access_logger.makeRecord(
+            access_logger.name,
+            logging.INFO,
+            __file__,
+            0,
+            _ACCESS_LOG_FORMAT,
+            args,
+            None,
+            extra=extra,
+        )
+        # 요청 시점 시각으로 기록
+        record.created = created
+        record.msecs = (created - int(created)) * 1000
+        return record
+
+
+access_log_buffer = AccessLogBuffer()
 
 
 class AccessLogMiddleware(BaseHTTPMiddleware):
@@ -19,10 +153,12 @@ class AccessLogMiddleware(BaseHTTPMiddleware):
     async def dispatch(
         self, request: Request, call_next: RequestResponseEndpoint
     ) -> Response:
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
 
+        # URL 직렬화는 한 번만 (extra 와 메시지에서 같이 사용)
+        url_str = str(request.url)
         log_extra = {
-            "url": request.url.include_query_params(),
+            "url": url_str,
             "method": request.method,
             "user_agent": request.headers.get("User-Agent"),
             "path": request.url.path,
@@ -35,22 +171,24 @@ class AccessLogMiddleware(BaseHTTPMiddleware):
             response = await call_next(request)
             return response
         finally:
-            process_time = (time.time() - start_time) * 1000  # ms 단위
+            # monotonic 정수 ns 로 측정, 접근 로그에는 정수 ms 면 충분
+            process_time_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
             status_code = response.status_code if response else 500
 
             # 최종 응답 상태와 처리 시간을 로그에 추가
             log_extra["status_code"] = status_code
-            log_extra["process_time_ms"] = round(process_time, 2)
-
-            # HTTP 버전과 함께 최종 로그 메시지 포맷팅
-            log_message = "%s %s HTTP/%s %d" % (
-                request.method,
-                request.url.include_query_params(),
-                request.scope["http_version"],
-                status_code,
-            )
+            log_extra["process_time_ms"] = process_time_ms
 
-            access_logger.info(log_message, extra=log_extra)
+            # 포맷팅/출력은 버퍼의 flush 시점에 일괄 처리
+            access_log_buffer.append(
+                (
+                    request.method,
+                    url_str,
+                    request.scope["http_version"],
+                    status_code,
+                ),
+                log_extra,
+            )
 
 
 access_log_middleware = Middleware(AccessLogMiddleware)
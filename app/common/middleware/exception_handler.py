@@ -1,40 +1,60 @@
 """Global exception handlers for the application."""
 
+import logging
+
 from fastapi import HTTPException, Request
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 from starlette.exceptions import HTTPException as StarletteHTTPException
 
 from app.common.exception import APIException
 from app.common.logging import error_logger
 
 
-async def api_exception_handler(request: Request, exc: APIException) -> JSONResponse:
+class LazyHeaders:
+    """Defer copying request headers until a formatter actually renders them."""
+
+    __slots__ = ("_headers",)
+
+    def __init__(self, headers):
+        self._headers = headers
+
+    def __repr__(self) -> str:
+        return repr(dict(self._headers))
+
+
+async def api_exception_handler(request: Request, exc: APIException) -> ORJSONResponse:
     """Handle custom API exceptions."""
-    error_logger.warning(
-        f"API Exception: {exc.message}",
-        extra={
-            "status_code": exc.status_code,
-            "path": request.url.path,
-            "method": request.method,
-            "headers": dict(request.headers),
-        },
-    )
+    if error_logger.isEnabledFor(logging.WARNING):
+        error_logger.warning(
+            "API Exception: %s",
+            exc.message,
+            extra={
+                "status_code": exc.status_code,
+                "path": request.url.path,
+                "method": request.method,
+                "headers": LazyHeaders(request.headers),
+            },
+        )
 
     return exc.construct_response()
 
 
-async def http_exception_handler(request: Request, exc: HTTPException) -> JSONResponse:
+async def http_exception_handler(
+    request: Request, exc: HTTPException
+) -> ORJSONResponse:
     """Handle FastAPI HTTP exceptions."""
-    error_logger.warning(
-        f"HTTP Exception: {exc.detail}",
-        extra={
-            "status_code": exc.status_code,
-            "path": request.url.path,
-            "method": request.method,
-        },
-    )
+    if error_logger.isEnabledFor(logging.WARNING):
+        error_logger.warning(
+            "HTTP Exception: %s",
+            exc.detail,
+            extra={
+                "status_code": exc.status_code,
+                "path": request.url.path,
+                "method": request.method,
+            },
+        )
 
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=exc.status_code,
         content={"message": exc.detail},
         headers=getattr(exc, "headers", None),
@@ -43,27 +63,30 @@ async def http_exception_handler(request: Request, exc: HTTPException) -> JSONRe
 
 async def starlette_http_exception_handler(
     request: Request, exc: StarletteHTTPException
-) -> JSONResponse:
+) -> ORJSONResponse:
     """Handle Starlette HTTP exceptions."""
-    error_logger.warning(
-        f"Starlette HTTP Exception: {exc.detail}",
-        extra={
-            "status_code": exc.status_code,
-            "path": request.url.path,
-            "method": request.method,
-        },
-    )
+    if error_logger.isEnabledFor(logging.WARNING):
+        error_logger.warning(
+            "Starlette HTTP Exception: %s",
+            exc.detail,
+            extra={
+                "status_code": exc.status_code,
+                "path": request.url.path,
+                "method": request.method,
+            },
+        )
 
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=exc.status_code,
         content={"message": exc.detail},
     )
 
 
-async def general_exception_handler(request: Request, exc: Exception) -> JSONResponse:
+async def general_exception_handler(request: Request, exc: Exception) -> ORJSONResponse:
     """Handle unexpected exceptions."""
     error_logger.error(
-        f"Unhandled Exception: {str(exc)}",
+        "Unhandled Exception: %s",
+        exc,
         extra={
             "path": request.url.path,
             "method": request.method,
@@ -72,7 +95,7 @@ async def general_exception_handler(request: Request, exc: Exception) -> JSONRes
         exc_info=True,
     )
 
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=500,
         content={"message": "Internal server error"},
     )
@@ -1,9 +1,18 @@
 """Rate limiting middleware using SlowAPI."""
 
+import asyncio
+import time
+from typing import Dict, Optional, Tuple
+
+from limits import RateLimitItem
+from limits.strategies import RateLimiter
+from limits.util import WindowStats
 from slowapi import Limiter, _rate_limit_exceeded_handler
 from slowapi.middleware import SlowAPIMiddleware
 from slowapi.util import get_remote_address
 
+from app.common.logging import logger
+from app.common.storage.redis import pools
 from config.settings import settings
 
 
@@ -13,11 +22,158 @@ def get_limiter_key(request):
     return get_remote_address(request)
 
 
+class LocalTokenBucket(RateLimiter):
+    """In-process token bucket, synced to Redis in the background.
+
+    판정은 로컬 dict 만 보고 끝나서 요청마다 Redis 왕복이 없음.
+    소비량은 FLUSH_EVERY 건 또는 FLUSH_INTERVAL 초마다 INCRBY 로 모아 보내고,
+    그 사이 다른 워커가 쓴 만큼을 로컬 토큰에서 차감 (워커 간에는 eventual).
+    """
+
+    FLUSH_EVERY = 100
+    FLUSH_INTERVAL = 1.0
+
+    def __init__(self, storage):
+        super().__init__(storage)
+        # key -> (tokens, last_refill); 이벤트 루프 한 스레드에서만 동기적으로 갱신
+        self._buckets: Dict[str, Tuple[float, float]] = {}
+        self._items: Dict[str, RateLimitItem] = {}
+        self._pending: Dict[str, int] = {}
+        # key -> (마지막으로 본 Redis 합계, Redis 키가 만료되는 monotonic 시각)
+        # 버킷이 비워져도 Redis 카운터는 TTL 동안 남으므로 버킷과 별도로 만료
+        self._seen: Dict[str, Tuple[int, float]] = {}
+        self._hits_since_flush = 0
+        self._last_flush = time.monotonic()
+        self._flush_task: Optional[asyncio.Task] = None
+
+    def _tokens(self, key: str, item: RateLimitItem, now: float) -> float:
+        tokens, last = self._buckets.get(key, (item.amount, now))
+        rate = item.amount / item.get_expiry()
+        return min(item.amount, tokens + (now - last) * rate)
+
+    def hit(self, item: RateLimitItem, *identifiers: str, cost: int = 1) -> bool:
+        key = item.key_for(*identifiers)
+        now = time.monotonic()
+        tokens = self._tokens(key, item, now)
+        allowed = tokens >= cost
+        if allowed:
+            tokens -= cost
+            self._pending[key] = self._pending.get(key, 0) + cost
+        self._buckets[key] = (tokens, now)
+        self._items[key] = item
+        self._maybe_flush(now)
+        return allowed
+
+    def test(self, item: RateLimitItem, *identifiers: str, cost: int = 1) -> bool:
+        key = item.key_for(*identifiers)
+        return self._tokens(key, item, time.monotonic()) >= cost
+
+    def get_window_stats(self, item: RateLimitItem, *identifiers: str) -> WindowStats:
+        key = item.key_for(*identifiers)
+        tokens = self._tokens(key, item, time.monotonic())
+        rate = item.amount / item.get_expiry()
+        reset_time = time.time() + (item.amount - tokens) / rate
+        return WindowStats(reset_time, max(0, int(tokens)))
+
+    def clear(self, item: RateLimitItem, *identifiers: str) -> None:
+        key = item.key_for(*identifiers)
+        # _seen 은 Redis 카운터 기준이라 유지 (지우면 자기 소비량을 남의 것으로 셈)
+        for state in (self._buckets, self._items, self._pending):
+            state.pop(key, None)
+
+    def _maybe_flush(self, now: float) -> None:
+        self._hits_since_flush += 1
+        if self._flush_task is not None and not self._flush_task.done():
+            return
+        if (
+            self._hits_since_flush < self.FLUSH_EVERY
+            and now - self._last_flush < self.FLUSH_INTERVAL
+        ):
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+
+        self._hits_since_flush = 0
+        self._last_flush = now
+        pending, self._pending = self._pending, {}
+        self._evict_full(now, keep=pending)
+        if pending:
+            self._flush_task = loop.create_task(self._flush(pending))
+
+    def _evict_full(self, now: float, keep: Dict[str, int]) -> None:
+        """Drop buckets that have refilled completely (same as a fresh bucket)."""
+        full = [
+            key
+            for key, item in self._items.items()
+            if key not in keep and self._tokens(key, item, now) >= item.amount
+        ]
+        for key in full:
+            del self._buckets[key], self._items[key]
+        expired = [key for key, (_, until) in self._seen.items() if until <= now]
+        for key in expired:
+            del self._seen[key]
+
+    async def _flush(self, pending: Dict[str, int]) -> None:
+        # 트래픽이 끊겨도 남은 소비량이 전달되도록 비워질 때까지 주기적으로 반복
+        while pending:
+            await self._sync(pending)
+            await asyncio.sleep(self.FLUSH_INTERVAL)
+            pending, self._pending = self._pending, {}
+
+    async def _sync(self, pending: Dict[str, int]) -> None:
+        expiries = {}
+        try:
+            conn = await pools.get_connection()
+            async with conn.pipeline(transaction=False) as pipe:
+                for key, delta in pending.items():
+                    item = self._items.get(key)
+                    expiries[key] = item.get_expiry() if item else 60
+                    pipe.incrby(key, delta)
+                    pipe.expire(key, expiries[key])
+                results = await pipe.execute()
+        except Exception:
+            # Redis 장애 시에도 로컬 판정은 계속 (워커 단위 제한으로 동작)
+            logger.warning("Rate limit sync to Redis failed", exc_info=True)
+            return
+
+        now = time.monotonic()
+        for (key, delta), total in zip(pending.items(), results[::2]):
+            seen, until = self._seen.get(key, (0, now))
+            if until <= now:
+                # Redis 키도 이미 만료되어 0 부터 다시 셌음
+                seen = 0
+            # 지난 동기화 이후 다른 워커가 소비한 양
+            others = max(0, total - seen - delta)
+            self._seen[key] = (total, now + expiries[key])
+            if others and key in self._buckets:
+                tokens, last = self._buckets[key]
+                self._buckets[key] = (tokens - others, last)
+
+
+class LocalTokenBucketLimiter(Limiter):
+    """SlowAPI Limiter that judges every limit with LocalTokenBucket.
+
+    limits 의 전역 STRATEGIES 에 등록하지 않고 이 인스턴스에만 전략을 연결.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._limiter = LocalTokenBucket(self._storage)
+        if self._fallback_limiter is not None:
+            self._fallback_limiter = LocalTokenBucket(self._fallback_storage)
+
+
 # Create limiter instance
-limiter = Limiter(
+# LocalTokenBucket: 프로세스 내에서 판정하고 Redis 에는 비동기로 합산
+# (키: LIMITER/rl/<endpoint>/<ip>/...), SlowAPI storage 는 판정에 쓰이지 않음
+limiter = LocalTokenBucketLimiter(
     key_func=get_limiter_key,
     default_limits=["60/minute"] if not settings.is_prod() else ["1/minute"],
-    storage_uri=settings.redis_url,
+    storage_uri="memory://",
+    key_prefix="rl",
+    key_style="endpoint",
     in_memory_fallback_enabled=True,
 )
 
@@ -0,0 +1,28 @@
+from starlette.middleware import Middleware
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from app.common.storage.postgres import request_cache
+
+
+class RequestCacheMiddleware:
+    """
+    요청마다 빈 조회 결과 캐시를 열어 주는 ASGI 미들웨어
+    (같은 요청 안의 반복 get_by_id / get_by_field 를 한 번의 쿼리로)
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        token = request_cache.set({})
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            request_cache.reset(token)
+
+
+request_cache_middleware = Middleware(RequestCacheMiddleware)
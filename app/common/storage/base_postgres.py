@@ -1,17 +1,85 @@
 """Base repository with read/write database separation."""
 
-from typing import Any, Dict, List, Optional, TypeVar
+import asyncio
+import functools
+from typing import (
+    Any,
+    Callable,
+    ClassVar,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    TypeVar,
+)
 
-from sqlalchemy import delete, select, update
-from sqlalchemy.orm import DeclarativeBase
+import redis
+from cachetools import LRUCache
+from sqlalchemy import Integer, bindparam, delete, insert, literal, select, update
+from sqlalchemy.orm import (
+    DeclarativeBase,
+    InstrumentedAttribute,
+    load_only,
+    raiseload,
+    selectinload,
+)
+from sqlalchemy.sql import Executable
 from sqlalchemy.sql.functions import func
 
 from app.common.logging import logger
-from app.common.storage.postgres import postgres_storage
+from app.common.storage.postgres import postgres_storage, request_cache
+from app.common.storage.query_cache import query_cache
 from app.common.utils.datetime import get_utc_datetime
+from config.settings import settings
 
 T = TypeVar("T", bound=DeclarativeBase)
 
+# get_by_ids 한 번의 IN (...) 에 넣을 최대 ID 수
+GET_BY_IDS_CHUNK_SIZE = 1000
+
+
+class _IdLoader:
+    """Coalesce get_by_id calls made in the same event-loop tick into one get_by_ids."""
+
+    __slots__ = ("_repository", "_pending", "_tasks")
+
+    def __init__(self, repository: type):
+        self._repository = repository
+        self._pending: Dict[Any, asyncio.Future] = {}
+        # 실행 중인 batch task 참조 유지 (GC 방지)
+        self._tasks: Set[asyncio.Task] = set()
+
+    def load(self, entity_id: Any) -> asyncio.Future:
+        # "abc..." 와 UUID("abc...") 가 같은 future 를 공유하도록 키를 정규화
+        entity_id = self._repository._coerce_id(entity_id)
+        future = self._pending.get(entity_id)
+        if future is None:
+            loop = asyncio.get_running_loop()
+            if not self._pending:
+                # 첫 요청에서 dispatch 예약, 같은 tick 의 나머지 호출은 여기에 합류
+                loop.call_soon(self._dispatch)
+            future = self._pending[entity_id] = loop.create_future()
+        return future
+
+    def _dispatch(self) -> None:
+        pending, self._pending = self._pending, {}
+        task = asyncio.create_task(self._run(pending))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, pending: Dict[Any, asyncio.Future]) -> None:
+        try:
+            found = await self._repository.get_by_ids(list(pending))
+        except Exception as e:
+            for future in pending.values():
+                if not future.done():
+                    future.set_exception(e)
+            return
+        for entity_id, future in pending.items():
+            if not future.done():
+                future.set_result(found.get(entity_id))
+
 
 class BaseRepository:
     """Base repository class with read/write routing."""
@@ -20,29 +88,197 @@ class BaseRepository:
     domain = "default"
     logger.debug(f"Repository initialized for model {model_class} in domain '{domain}'")
 
+    # 서브클래스 정의 시 한 번 계산 (요청마다 hasattr/getattr 하지 않도록)
+    _columns: ClassVar[Dict[str, InstrumentedAttribute]] = {}
+    _has_updated_at: ClassVar[bool] = False
+    # id 컬럼의 파이썬 타입 (요청 캐시/결과 dict 키를 같은 타입으로 맞추는 데 사용)
+    _id_type: ClassVar[Optional[type]] = None
+    # bindparam 기반 statement 를 (연산, 필드 이름들) 키로 재사용
+    _stmt_cache: ClassVar[LRUCache] = LRUCache(maxsize=256)
+    # @cached_read 메서드가 있는 repository 만 쓰기 시 Redis 캐시 무효화
+    _uses_query_cache: ClassVar[bool] = False
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if cls.model_class is None:
+            return
+        cls._columns = {
+            c.key: getattr(cls.model_class, c.key)
+            for c in cls.model_class.__table__.columns
+        }
+        cls._has_updated_at = "updated_at" in cls._columns
+        try:
+            cls._id_type = cls.model_class.__table__.c.id.type.python_type
+        except (AttributeError, NotImplementedError):
+            cls._id_type = None
+        cls._stmt_cache = LRUCache(maxsize=256)
+        cls._uses_query_cache = any(
+            getattr(getattr(attr, "__func__", attr), "__cached_read__", False)
+            for klass in cls.__mro__
+            for attr in vars(klass).values()
+        )
+
+    @classmethod
+    def _column(cls, field_name: str) -> InstrumentedAttribute:
+        """Resolve a model attribute, using the precomputed column map first."""
+        column = cls._columns.get(field_name)
+        if column is None:
+            return getattr(cls.model_class, field_name)
+        return column
+
+    @classmethod
+    def _coerce_id(cls, entity_id: Any) -> Any:
+        """Convert an id to the id column's python type (e.g. str -> UUID)."""
+        id_type = cls._id_type
+        if id_type is None or entity_id is None or isinstance(entity_id, id_type):
+            return entity_id
+        try:
+            return id_type(entity_id)
+        except (TypeError, ValueError):
+            # 변환할 수 없는 값은 그대로 두고 DB 가 판단하도록 함
+            return entity_id
+
+    @classmethod
+    def _eager_options(cls, relationships: Sequence[str]) -> list:
+        """selectinload options for the given relationship names."""
+        if not relationships:
+            return []
+        options = [selectinload(getattr(cls.model_class, r)) for r in relationships]
+        if not settings.is_prod():
+            # 개발 환경에서는 eager 에 빠진 관계 접근을 즉시 에러로 드러냄
+            options.append(raiseload("*"))
+        return options
+
+    @classmethod
+    def _cached_stmt(cls, key: tuple, build: Callable[[], Executable]) -> Executable:
+        """Build a parameterized statement once per (repository, key) and reuse it."""
+        stmt = cls._stmt_cache.get(key)
+        if stmt is None:
+            stmt = cls._stmt_cache[key] = build()
+        return stmt
+
+    @classmethod
+    def _filter_names(cls, filters: Optional[Dict[str, Any]]) -> tuple:
+        """Filter keys that map to real columns (unknown keys are ignored)."""
+        if not filters:
+            return ()
+        return tuple(name for name in filters if name in cls._columns)
+
+    @classmethod
+    def _where_filters(cls, stmt, names: tuple):
+        for name in names:
+            stmt = stmt.where(cls._columns[name] == bindparam(f"f_{name}"))
+        return stmt
+
+    @staticmethod
+    def _filter_params(filters: Dict[str, Any], names: tuple) -> Dict[str, Any]:
+        return {f"f_{name}": filters[name] for name in names}
+
     # Read operations - use read database
     @classmethod
-    async def get_by_id(cls, entity_id: str) -> Optional[T]:
-        """Get entity by ID using read database."""
+    async def get_by_id(cls, entity_id: Any, eager: Sequence[str] = ()) -> Optional[T]:
+        """Get entity by ID using read database (memoized and batched per request).
+
+        eager 에 관계 이름을 주면 selectinload 로 함께 조회 (요청 캐시는 거치지 않음).
+        """
+        entity_id = cls._coerce_id(entity_id)
+        eager = tuple(eager)
+        cache = None if eager else request_cache.get()
+        key = (cls, "id", entity_id)
+        if cache is not None:
+            if key in cache:
+                return cache[key]
+            # 요청 세션 안에서는 아직 commit 안 된 쓰기도 보여야 하므로 그 세션으로 직접 조회
+            if not postgres_storage.has_request_session(cls.domain):
+                return await cls._id_loader(cache).load(entity_id)
+
+        async with postgres_storage.get_domain_read_session(
+            domain=cls.domain
+        ) as session:
+            stmt = cls._cached_stmt(
+                ("get_by_id", eager),
+                lambda: select(cls.model_class)
+                .where(cls.model_class.id == bindparam("pk"))
+                .options(*cls._eager_options(eager)),
+            )
+            result = await session.execute(stmt, {"pk": entity_id})
+            entity = result.scalar_one_or_none()
+
+        if cache is not None:
+            cache[key] = entity
+        return entity
+
+    @classmethod
+    def _id_loader(cls, cache: Dict[Any, Any]) -> _IdLoader:
+        """Per-request loader for this repository, kept in the request cache."""
+        loader = cache.get((cls, "loader"))
+        if loader is None:
+            loader = cache[(cls, "loader")] = _IdLoader(cls)
+        return loader
+
+    @classmethod
+    async def get_by_ids(cls, entity_ids: Sequence[Any]) -> Dict[Any, T]:
+        """Get several entities by ID with ``id IN (...)`` queries; returns {id: entity}.
+
+        결과 dict 의 키는 id 컬럼 타입으로 변환된 값 (str 로 넘겨도 UUID 키).
+        없는 ID 는 결과 dict 에 포함되지 않음.
+        """
+        cache = request_cache.get()
+        found: Dict[Any, T] = {}
+        missing = []
+        for entity_id in dict.fromkeys(map(cls._coerce_id, entity_ids)):
+            key = (cls, "id", entity_id)
+            if cache is not None and key in cache:
+                if cache[key] is not None:
+                    found[entity_id] = cache[key]
+            else:
+                missing.append(entity_id)
+        if not missing:
+            return found
+
         async with postgres_storage.get_domain_read_session(
             domain=cls.domain
         ) as session:
-            result = await session.execute(
-                select(cls.model_class).where(cls.model_class.id == entity_id)
+            stmt = cls._cached_stmt(
+                ("get_by_ids",),
+                lambda: select(cls.model_class).where(
+                    cls.model_class.id.in_(bindparam("pks", expanding=True))
+                ),
             )
-            return result.scalar_one_or_none()
+            # 바인드 파라미터 개수 제한을 넘지 않도록 나눠서 조회
+            for start in range(0, len(missing), GET_BY_IDS_CHUNK_SIZE):
+                chunk = missing[start : start + GET_BY_IDS_CHUNK_SIZE]
+                result = await session.execute(stmt, {"pks": chunk})
+                for entity in result.scalars():
+                    found[entity.id] = entity
+
+        if cache is not None:
+            for entity_id in missing:
+                cache[(cls, "id", entity_id)] = found.get(entity_id)
+        return found
 
     @classmethod
     async def get_by_field(cls, field_name: str, field_value: Any) -> Optional[T]:
-        """Get entity by specific field using read database."""
+        """Get entity by specific field using read database (memoized per request)."""
+        cache = request_cache.get()
+        key = (cls, field_name, field_value)
+        if cache is not None and key in cache:
+            return cache[key]
+
         async with postgres_storage.get_domain_read_session(
             domain=cls.domain
         ) as session:
-            field = getattr(cls.model_class, field_name)
-            result = await session.execute(
-                select(cls.model_class).where(field == field_value)
+            field = cls._column(field_name)
+            stmt = cls._cached_stmt(
+                ("get_by_field", field_name),
+                lambda: select(cls.model_class).where(field == bindparam("value")),
             )
-            return result.scalar_one_or_none()
+            result = await session.execute(stmt, {"value": field_value})
+            entity = result.scalar_one_or_none()
+
+        if cache is not None:
+            cache[key] = entity
+        return entity
 
     @classmethod
     async def list_all(
@@ -50,20 +286,37 @@ class BaseRepository:
         limit: int = 100,
         offset: int = 0,
         filters: Optional[Dict[str, Any]] = None,
+        columns: Optional[Sequence[str]] = None,
+        eager: Sequence[str] = (),
     ) -> List[T]:
-        """List entities with pagination using read database."""
+        """List entities with pagination using read database.
+
+        columns 를 주면 해당 컬럼만 조회 (load_only), 나머지 속성은 접근 불가.
+        eager 에 준 관계는 selectinload 로 IN 쿼리 한 번에 함께 로드.
+        """
         async with postgres_storage.get_domain_read_session(
             domain=cls.domain
         ) as session:
-            stmt = select(cls.model_class).offset(offset).limit(limit)
+            names = cls._filter_names(filters)
+            columns = tuple(columns) if columns else ()
+            eager = tuple(eager)
 
-            if filters:
-                for field_name, field_value in filters.items():
-                    if hasattr(cls.model_class, field_name):
-                        field = getattr(cls.model_class, field_name)
-                        stmt = stmt.where(field == field_value)
+            def build():
+                stmt = (
+                    select(cls.model_class)
+                    .offset(bindparam("offset", type_=Integer))
+                    .limit(bindparam("limit", type_=Integer))
+                )
+                if columns:
+                    stmt = stmt.options(load_only(*(cls._column(c) for c in columns)))
+                if eager:
+                    stmt = stmt.options(*cls._eager_options(eager))
+                return cls._where_filters(stmt, names)
 
-            result = await session.execute(stmt)
+            stmt = cls._cached_stmt(("list_all", names, columns, eager), build)
+            params = {"offset": offset, "limit": limit}
+            params.update(cls._filter_params(filters, names))
+            result = await session.execute(stmt, params)
             return list(result.scalars().all())
 
     @classmethod
@@ -72,15 +325,14 @@ class BaseRepository:
         async with postgres_storage.get_domain_read_session(
             domain=cls.domain
         ) as session:
-            stmt = select(func.count(cls.model_class.id))
-
-            if filters:
-                for field_name, field_value in filters.items():
-                    if hasattr(cls.model_class, field_name):
-                        field = getattr(cls.model_class, field_name)
-                        stmt = stmt.where(field == field_value)
-
-            result = await session.execute(stmt)
+            names = cls._filter_names(filters)
+            stmt = cls._cached_stmt(
+                ("count", names),
+                lambda: cls._where_filters(
+                    select(func.count(cls.model_class.id)), names
+                ),
+            )
+            result = await session.execute(stmt, cls._filter_params(filters, names))
             return result.scalar()
 
     @classmethod
@@ -89,11 +341,40 @@ class BaseRepository:
         async with postgres_storage.get_domain_read_session(
             domain=cls.domain
         ) as session:
-            stmt = select(func.count(cls.model_class.id)).where(
-                cls.model_class.id == entity_id
+            # 집계 없이 PK 인덱스에서 첫 행만 확인
+            stmt = cls._cached_stmt(
+                ("exists",),
+                lambda: select(literal(1))
+                .where(cls.model_class.id == bindparam("pk"))
+                .limit(1),
+            )
+            result = await session.execute(stmt, {"pk": entity_id})
+            return result.scalar() is not None
+
+    @classmethod
+    async def invalidate_cached_reads(
+        cls, entity_ids: Optional[Sequence[Any]] = None
+    ) -> None:
+        """Drop @cached_read results for entity_ids (None: every row) and all lists.
+
+        요청 세션 안의 쓰기라면 commit 이후에 지움 (그 사이 조회가 옛 값을 다시 캐시하지 않도록).
+        """
+        if not cls._uses_query_cache:
+            return
+        await postgres_storage.run_after_commit(
+            cls.domain, functools.partial(cls._drop_cached_reads, entity_ids)
+        )
+
+    @classmethod
+    async def _drop_cached_reads(cls, entity_ids: Optional[Sequence[Any]]) -> None:
+        try:
+            await query_cache.invalidate(cls.model_class.__name__, entity_ids)
+        except redis.exceptions.RedisError:
+            logger.warning(
+                "Query cache invalidation failed for %s",
+                cls.model_class.__name__,
+                exc_info=True,
             )
-            result = await session.execute(stmt)
-            return result.scalar() > 0
 
     # Write operations - use write database
     @classmethod
@@ -105,37 +386,55 @@ class BaseRepository:
             session.add(entity)
             await session.flush()
             await session.refresh(entity)
-            return entity
+        await cls.invalidate_cached_reads([entity.id])
+        return entity
 
     @classmethod
-    async def update_by_id(cls, entity_id: str, **kwargs) -> Optional[T]:
+    async def update_by_id(cls, entity_id: Any, **kwargs) -> Optional[T]:
         """Update entity by ID using write database."""
 
         async with postgres_storage.get_domain_write_session(
             domain=cls.domain
         ) as session:
             # Add updated_at if the model has it
-            if hasattr(cls.model_class, "updated_at"):
+            if cls._has_updated_at:
                 kwargs["updated_at"] = get_utc_datetime()
 
-            stmt = (
-                update(cls.model_class)
-                .where(cls.model_class.id == entity_id)
-                .values(**kwargs)
+            keys = tuple(sorted(kwargs))
+            # SET 절 bindparam 이름은 컬럼명과 겹치면 안 되므로 v_ 접두사 사용
+            stmt = cls._cached_stmt(
+                ("update_by_id", keys),
+                lambda: update(cls.model_class)
+                .where(cls.model_class.id == bindparam("pk"))
+                .values({key: bindparam(f"v_{key}") for key in keys})
                 .returning(cls.model_class)
+                # bindparam 값은 Python 에서 평가할 수 없으므로 세션 동기화 대신
+                # RETURNING 행으로 identity map 의 객체를 덮어씀
+                .execution_options(synchronize_session=False, populate_existing=True),
             )
-            result = await session.execute(stmt)
-            return result.scalar_one_or_none()
+            params = {f"v_{key}": value for key, value in kwargs.items()}
+            params["pk"] = entity_id
+            result = await session.execute(stmt, params)
+            entity = result.scalar_one_or_none()
+        await cls.invalidate_cached_reads([entity_id])
+        return entity
 
     @classmethod
-    async def delete_by_id(cls, entity_id: str) -> bool:
+    async def delete_by_id(cls, entity_id: Any) -> bool:
         """Delete entity by ID using write database."""
         async with postgres_storage.get_domain_write_session(
             domain=cls.domain
         ) as session:
-            stmt = delete(cls.model_class).where(cls.model_class.id == entity_id)
-            result = await session.execute(stmt)
-            return result.rowcount > 0
+            stmt = cls._cached_stmt(
+                ("delete_by_id",),
+                lambda: delete(cls.model_class).where(
+                    cls.model_class.id == bindparam("pk")
+                ),
+            )
+            result = await session.execute(stmt, {"pk": entity_id})
+            deleted = result.rowcount > 0
+        await cls.invalidate_cached_reads([entity_id])
+        return deleted
 
     @classmethod
     async def delete_by_field(cls, field_name: str, field_value: Any) -> bool:
@@ -143,23 +442,27 @@ class BaseRepository:
         async with postgres_storage.get_domain_write_session(
             domain=cls.domain
         ) as session:
-            field = getattr(cls.model_class, field_name)
+            field = cls._column(field_name)
             stmt = delete(cls.model_class).where(field == field_value)
             result = await session.execute(stmt)
-            return result.rowcount > 0
+            deleted = result.rowcount > 0
+        await cls.invalidate_cached_reads()
+        return deleted
 
     @classmethod
     async def bulk_create(cls, entities_data: List[Dict[str, Any]]) -> List[T]:
         """Bulk create entities using write database."""
+        if not entities_data:
+            return []
         async with postgres_storage.get_domain_write_session(
             domain=cls.domain
         ) as session:
-            entities = [cls.model_class(**data) for data in entities_data]
-            session.add_all(entities)
-            await session.flush()
-            for entity in entities:
-                await session.refresh(entity)
-            return entities
+            # 행마다 refresh 하지 않고 INSERT ... RETURNING 한 번으로 서버 기본값까지 받음
+            stmt = insert(cls.model_class).returning(cls.model_class)
+            result = await session.execute(stmt, entities_data)
+            entities = list(result.scalars().all())
+        await cls.invalidate_cached_reads([entity.id for entity in entities])
+        return entities
 
     @classmethod
     async def bulk_update(
@@ -170,18 +473,26 @@ class BaseRepository:
             domain=cls.domain
         ) as session:
             # Add updated_at if the model has it
-            if hasattr(cls.model_class, "updated_at"):
+            if cls._has_updated_at:
                 update_data["updated_at"] = get_utc_datetime()
 
-            stmt = update(cls.model_class).values(**update_data)
-
-            for field_name, field_value in filters.items():
-                if hasattr(cls.model_class, field_name):
-                    field = getattr(cls.model_class, field_name)
-                    stmt = stmt.where(field == field_value)
-
-            result = await session.execute(stmt)
-            return result.rowcount
+            names = cls._filter_names(filters)
+            keys = tuple(sorted(update_data))
+            stmt = cls._cached_stmt(
+                ("bulk_update", names, keys),
+                lambda: cls._where_filters(
+                    update(cls.model_class)
+                    .values({key: bindparam(f"v_{key}") for key in keys})
+                    .execution_options(synchronize_session=False),
+                    names,
+                ),
+            )
+            params = {f"v_{key}": value for key, value in update_data.items()}
+            params.update(cls._filter_params(filters, names))
+            result = await session.execute(stmt, params)
+            rowcount = result.rowcount
+        await cls.invalidate_cached_reads()
+        return rowcount
 
     # Manual session access for complex operations
     @classmethod
@@ -1,19 +1,36 @@
 """PostgreSQL database connection management using asyncpg and SQLAlchemy."""
 
+import asyncio
 import functools
-from contextlib import asynccontextmanager
-from typing import Any, Dict
+import uuid
+from contextlib import AsyncExitStack, asynccontextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+)
 
 import asyncpg
-from sqlalchemy import MetaData
+from sqlalchemy import MetaData, event, text
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
 from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
     AsyncSession,
     async_sessionmaker,
     create_async_engine,
 )
 from sqlalchemy.orm import declarative_base
+from sqlalchemy.pool import AsyncAdaptedQueuePool, NullPool
 
-from app.common.exception import ServerError
+from app.common.exception import ServerError, TooManyRequests
 from app.common.logging import logger
 from app.common.utils.singleton import Singleton
 from config.settings import settings
@@ -22,6 +39,19 @@ from config.settings import settings
 Base = declarative_base()
 metadata = MetaData()
 
+# 요청 단위로 묶인 세션: (domain, 바인딩한 task, session)
+_request_session: ContextVar[
+    Optional[Tuple[str, Optional[asyncio.Task], AsyncSession]]
+] = ContextVar("postgres_request_session", default=None)
+
+# 요청 세션 commit 후 실행할 콜백 목록을 담는 session.info 키
+_AFTER_COMMIT_KEY = "after_commit"
+
+# 요청 범위 조회 결과 캐시; RequestCacheMiddleware 가 요청마다 새 dict 를 설정
+request_cache: ContextVar[Optional[Dict[Any, Any]]] = ContextVar(
+    "postgres_request_cache", default=None
+)
+
 
 def handle_postgres_error(func):
     """Decorator to handle PostgreSQL errors."""
@@ -30,6 +60,10 @@ def handle_postgres_error(func):
     async def wrapper(*args, **kwargs):
         try:
             return await func(*args, **kwargs)
+        except PoolTimeoutError as exc:
+            # pool_timeout 안에 커넥션을 못 얻으면 무한 대기 대신 429
+            logger.warning("PostgreSQL pool exhausted in %s", func.__qualname__)
+            raise TooManyRequests from exc
         except asyncpg.PostgresError as exc:
             logger.exception("PostgreSQL operation failed")
             raise ServerError from exc
@@ -40,13 +74,43 @@ def handle_postgres_error(func):
     return wrapper
 
 
+@dataclass(slots=True)
+class DomainPool:
+    """Engines and session factories for one domain (read/write)."""
+
+    read_engine: AsyncEngine
+    write_engine: AsyncEngine
+    read_session_factory: async_sessionmaker[AsyncSession]
+    write_session_factory: async_sessionmaker[AsyncSession]
+
+
 class PostgresStorage(metaclass=Singleton):
     """Domain-aware PostgreSQL storage manager with read/write separation."""
 
     def __init__(self):
-        self._domain_pools = (
-            {}
-        )  # domain -> {read_engine, write_engine, read_session_factory, write_session_factory}
+        self._domain_pools: Dict[str, DomainPool] = {}
+        self._connection_setups: Dict[
+            str, List[Callable[[asyncpg.Connection], Awaitable[None]]]
+        ] = {}
+
+    def register_connection_setup(
+        self, domain: str, setup: Callable[[asyncpg.Connection], Awaitable[None]]
+    ) -> None:
+        """Run setup(conn) on every new asyncpg connection of the domain's engines.
+
+        Must be registered before the domain pool is created (i.e. at import time).
+        """
+        self._connection_setups.setdefault(domain, []).append(setup)
+
+    def _attach_connection_setups(self, engine: AsyncEngine, domain: str) -> None:
+        setups = self._connection_setups.get(domain)
+        if not setups:
+            return
+
+        @event.listens_for(engine.sync_engine, "connect")
+        def _on_connect(dbapi_connection, _connection_record):
+            for setup in setups:
+                dbapi_connection.run_async(setup)
 
     def _get_domain_database_urls(self, domain: str) -> tuple[str, str]:
         """Get read and write database URLs for a specific domain."""
@@ -71,32 +135,70 @@ class PostgresStorage(metaclass=Singleton):
         """Convert PostgreSQL URL to asyncpg format."""
         return url.replace("postgresql://", "postgresql+asyncpg://")
 
-    def _get_or_create_domain_pool(self, domain: str) -> Dict[str, Any]:
+    def _get_connect_args(self, read_only: bool = False) -> Dict[str, Any]:
+        """asyncpg connect args (PgBouncer transaction mode needs no statement cache)."""
+        server_settings = {"application_name": "kang-read" if read_only else "kang"}
+        if not settings.postgres_pgbouncer:
+            # 짧은 OLTP 쿼리에서는 JIT 컴파일 비용이 실행 시간보다 큼
+            server_settings["jit"] = "off"
+            if read_only:
+                # 확장 로드 전에도 커스텀 GUC 로 받아 두었다가 pgvector 가 사용
+                server_settings["hnsw.ef_search"] = str(settings.rag_hnsw_ef_search)
+            connect_args: Dict[str, Any] = {
+                "statement_cache_size": settings.postgres_statement_cache_size,
+                "prepared_statement_cache_size": (
+                    settings.postgres_prepared_statement_cache_size
+                ),
+            }
+        else:
+            connect_args = {
+                "statement_cache_size": 0,
+                "prepared_statement_cache_size": 0,
+                # 트랜잭션마다 백엔드가 바뀌므로 prepared statement 이름 충돌 방지
+                "prepared_statement_name_func": lambda: f"__asyncpg_{uuid.uuid4()}__",
+            }
+        connect_args["server_settings"] = server_settings
+        if read_only:
+            connect_args["target_session_attrs"] = (
+                settings.postgres_read_target_session_attrs
+            )
+        return connect_args
+
+    def _create_engine(self, url: str, read_only: bool = False):
+        """Create an async engine; queue pool by default, NullPool behind a pooler.
+
+        Read engines run in AUTOCOMMIT so a read session issues no BEGIN/COMMIT.
+        """
+        if settings.postgres_pool_class == "null":
+            pool_args: Dict[str, Any] = {"poolclass": NullPool}
+        else:
+            pool_args = {
+                "poolclass": AsyncAdaptedQueuePool,
+                "pool_size": settings.postgres_pool_size,
+                "max_overflow": settings.postgres_max_overflow,
+                "pool_timeout": settings.postgres_pool_timeout,
+                "pool_pre_ping": True,
+                "pool_recycle": 3600,
+                # 최근 반납된 커넥션부터 재사용해 statement 캐시 적중률을 높임
+                "pool_use_lifo": True,
+            }
+        return create_async_engine(
+            self._get_database_url(url),
+            echo=not settings.is_prod(),
+            connect_args=self._get_connect_args(read_only),
+            **pool_args,
+            **({"isolation_level": "AUTOCOMMIT"} if read_only else {}),
+        )
+
+    def _get_or_create_domain_pool(self, domain: str) -> DomainPool:
         """Get or create connection pools for a specific domain."""
         if domain not in self._domain_pools:
             read_url, write_url = self._get_domain_database_urls(domain)
 
-            # Create read engine
-            read_database_url = self._get_database_url(read_url)
-            read_engine = create_async_engine(
-                read_database_url,
-                echo=not settings.is_prod(),
-                pool_size=8,  # Optimized for read operations
-                max_overflow=15,
-                pool_pre_ping=True,
-                pool_recycle=3600,
-            )
-
-            # Create write engine
-            write_database_url = self._get_database_url(write_url)
-            write_engine = create_async_engine(
-                write_database_url,
-                echo=not settings.is_prod(),
-                pool_size=10,  # Optimized for write operations
-                max_overflow=20,
-                pool_pre_ping=True,
-                pool_recycle=3600,
-            )
+            read_engine = self._create_engine(read_url, read_only=True)
+            write_engine = self._create_engine(write_url)
+            self._attach_connection_setups(read_engine, domain)
+            self._attach_connection_setups(write_engine, domain)
 
             # Create session factories
             read_session_factory = async_sessionmaker(
@@ -111,12 +213,12 @@ class PostgresStorage(metaclass=Singleton):
                 expire_on_commit=False,
             )
 
-            self._domain_pools[domain] = {
-                "read_engine": read_engine,
-                "write_engine": write_engine,
-                "read_session_factory": read_session_factory,
-                "write_session_factory": write_session_factory,
-            }
+            self._domain_pools[domain] = DomainPool(
+                read_engine=read_engine,
+                write_engine=write_engine,
+                read_session_factory=read_session_factory,
+                write_session_factory=write_session_factory,
+            )
 
             logger.info(
                 f"Created domain pool for '{domain}': read='{read_url}', write='{write_url}'"
@@ -124,40 +226,141 @@ class PostgresStorage(metaclass=Singleton):
 
         return self._domain_pools[domain]
 
+    def _get_bound_session(self, domain: str) -> Optional[AsyncSession]:
+        """Return the request-bound session if it belongs to this domain and task."""
+        bound = _request_session.get()
+        if bound is None:
+            return None
+        bound_domain, bound_task, session = bound
+        # gather 로 만든 하위 task 는 context 를 복사하므로, 세션 동시 사용을 막기 위해 task 까지 비교
+        if bound_domain != domain or bound_task is not asyncio.current_task():
+            return None
+        return session
+
+    def has_request_session(self, domain: str) -> bool:
+        """Whether the current task runs inside a request-bound session for domain."""
+        return self._get_bound_session(domain) is not None
+
+    def _get_pool(self, domain: str) -> DomainPool:
+        """Look up a domain pool; pools are normally pre-created by warmup()."""
+        try:
+            return self._domain_pools[domain]
+        except KeyError:
+            # warmup 에 없던 도메인(스크립트/테스트 등)만 여기서 생성
+            return self._get_or_create_domain_pool(domain)
+
+    @asynccontextmanager
+    async def get_domain_request_session(self, domain: str = "default"):
+        """Bind one write session to the current request for a specific domain.
+
+        Repository calls inside the scope reuse this session (and its pooled
+        connection) instead of checking out their own; commit happens once on exit.
+        """
+        bound = self._get_bound_session(domain)
+        if bound is not None:
+            yield bound
+            return
+
+        async with self.get_domain_write_session(domain) as session:
+            token = _request_session.set((domain, asyncio.current_task(), session))
+            try:
+                yield session
+            finally:
+                _request_session.reset(token)
+        # commit 이 끝난 뒤에만 실행 (rollback 이면 예외가 전파되어 여기까지 오지 않음)
+        for callback in session.info.pop(_AFTER_COMMIT_KEY, ()):
+            await callback()
+
+    async def run_after_commit(
+        self, domain: str, callback: Callable[[], Awaitable[Any]]
+    ) -> None:
+        """Run callback once the current request session for domain commits.
+
+        Outside a request-bound session the write has already committed, so the
+        callback runs immediately.
+        """
+        bound = self._get_bound_session(domain)
+        if bound is None:
+            await callback()
+            return
+        bound.info.setdefault(_AFTER_COMMIT_KEY, []).append(callback)
+
     @asynccontextmanager
     async def get_domain_read_session(self, domain: str = "default"):
         """Get read-only database session for a specific domain."""
-        pool = self._get_or_create_domain_pool(domain)
-        async with pool["read_session_factory"]() as session:
+        bound = self._get_bound_session(domain)
+        if bound is not None:
+            yield bound
+            return
+
+        pool = self._get_pool(domain)
+        async with pool.read_session_factory() as session:
+            # 세션 close 는 async with 종료 시 처리됨
             try:
+                # AUTOCOMMIT 엔진이라 commit 호출 없음
                 yield session
-                # No commit needed for read operations
             except Exception:
                 await session.rollback()
                 raise
-            finally:
-                await session.close()
 
     @asynccontextmanager
     async def get_domain_write_session(self, domain: str = "default"):
         """Get write database session for a specific domain."""
-        pool = self._get_or_create_domain_pool(domain)
-        async with pool["write_session_factory"]() as session:
+        cache = request_cache.get()
+        if cache:
+            # 쓰기가 일어나면 이 요청에서 캐시한 조회 결과는 더 이상 믿지 않음
+            cache.clear()
+        bound = self._get_bound_session(domain)
+        if bound is not None:
+            # commit/rollback 은 요청 세션을 연 쪽에서 처리
+            yield bound
+            return
+
+        pool = self._get_pool(domain)
+        async with pool.write_session_factory() as session:
             try:
                 yield session
                 await session.commit()
             except Exception:
                 await session.rollback()
                 raise
-            finally:
-                await session.close()
+
+    async def warm_domain_pool(self, domain: str, size: Optional[int] = None) -> None:
+        """Pre-open pooled connections so the first requests skip the handshake."""
+        size = settings.postgres_pool_warmup if size is None else size
+        size = min(size, settings.postgres_pool_size)
+        if size <= 0 or settings.postgres_pool_class == "null":
+            return
+
+        pool = self._get_or_create_domain_pool(domain)
+        async with AsyncExitStack() as stack:
+            # 동시에 잡고 있어야 서로 다른 커넥션이 size 개 만들어짐
+            for engine in (pool.read_engine, pool.write_engine):
+                conns = await asyncio.gather(
+                    *(stack.enter_async_context(engine.connect()) for _ in range(size))
+                )
+                await asyncio.gather(
+                    *(conn.execute(text("SELECT 1")) for conn in conns)
+                )
+        logger.info("Warmed domain pool '%s' with %d connection(s)", domain, size)
+
+    async def warmup(self, domains: Sequence[str]) -> None:
+        """Create the pools for every known domain up front and pre-open connections."""
+        for domain in domains:
+            self._get_or_create_domain_pool(domain)
+        for domain in domains:
+            try:
+                await self.warm_domain_pool(domain)
+            except Exception as e:
+                # DB 가 아직 안 떠 있어도 기동은 계속, 커넥션은 첫 요청 때 lazy 하게 생성
+                logger.warning("Postgres pool warmup skipped for '%s': %s", domain, e)
 
     async def close_domain_pool(self, domain: str):
         """Close all connections for a specific domain."""
         if domain in self._domain_pools:
             pool = self._domain_pools[domain]
-            await pool["read_engine"].dispose()
-            await pool["write_engine"].dispose()
+            await pool.read_engine.dispose()
+            await pool.write_engine.dispose()
             del self._domain_pools[domain]
             logger.info(f"Closed domain pool for '{domain}'")
 
@@ -170,3 +373,17 @@ class PostgresStorage(metaclass=Singleton):
 
 # Global instances
 postgres_storage = PostgresStorage()
+
+
+def get_db_session(domain: str = "default"):
+    """Build a FastAPI dependency yielding one request-scoped session for a domain.
+
+    Use with ``Depends(..., scope="function")`` so the commit runs before the
+    response is sent.
+    """
+
+    async def _get_db_session() -> AsyncIterator[AsyncSession]:
+        async with postgres_storage.get_domain_request_session(domain) as session:
+            yield session
+
+    return _get_db_session
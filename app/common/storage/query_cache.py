@@ -0,0 +1,166 @@
+"""Redis-backed cache for read-only repository queries."""
+
+import functools
+import hashlib
+import random
+import uuid
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple, Union
+
+import orjson
+import redis
+from sqlalchemy import DateTime
+from sqlalchemy.dialects.postgresql import UUID
+
+from app.common.logging import logger
+from app.common.storage.redis import _ORJSON_OPTIONS, CacheExpire, _CacheClient
+
+# SCAN 한 번에 훑을 키 개수 힌트
+_SCAN_COUNT = 500
+
+
+class QueryCache(_CacheClient):
+    """Cache client for repository read results (``repo:{Model}:...`` keys)."""
+
+    _alias: str = "default"
+    _prefix: str = "repo:"
+    _ttl: Union[int, CacheExpire] = CacheExpire.MINUTE * 5
+
+    def _get_key(self, key: str) -> str:
+        return self._prefix + key
+
+    async def get_raw(self, key: str) -> Optional[bytes]:
+        conn = await self.get_connection()
+        return await conn.get(self._get_key(key))
+
+    async def set_raw(self, key: str, value: bytes, expire: int) -> None:
+        """SET NX EX: 동시에 miss 난 요청들 중 첫 결과만 저장."""
+        conn = await self.get_connection()
+        await conn.set(self._get_key(key), value, nx=True, ex=expire)
+
+    async def invalidate(
+        self, model_name: str, entity_ids: Optional[Iterable[Any]] = None
+    ) -> None:
+        """Drop cached rows for entity_ids and every cached list/count of the model.
+
+        entity_ids 가 None 이면 (영향받은 행을 모를 때) 모델의 모든 키를 지움.
+        """
+        conn = await self.get_connection()
+        if entity_ids is None:
+            keys, pattern = [], f"{model_name}:*"
+        else:
+            keys = [
+                self._get_key(f"{model_name}:id:{entity_id}")
+                for entity_id in entity_ids
+            ]
+            pattern = f"{model_name}:list:*"
+        async for key in conn.scan_iter(
+            match=self._get_key(pattern), count=_SCAN_COUNT
+        ):
+            keys.append(key)
+        if keys:
+            await conn.unlink(*keys)
+
+
+query_cache = QueryCache()
+
+
+@functools.lru_cache(maxsize=None)
+def _typed_columns(model_class) -> Tuple[Tuple[str, ...], Tuple[Tuple[str, bool], ...]]:
+    """(UUID 컬럼들, (DateTime 컬럼, timezone 여부)들) - JSON 에서 복원할 때 사용."""
+    columns = model_class.__table__.c
+    uuid_columns = tuple(c.key for c in columns if isinstance(c.type, UUID))
+    datetime_columns = tuple(
+        (c.key, bool(c.type.timezone)) for c in columns if isinstance(c.type, DateTime)
+    )
+    return uuid_columns, datetime_columns
+
+
+def _entity_to_dict(entity) -> Dict[str, Any]:
+    return {c.key: getattr(entity, c.key) for c in entity.__table__.c}
+
+
+def _entity_from_dict(model_class, data: Dict[str, Any]):
+    uuid_columns, datetime_columns = _typed_columns(model_class)
+    for key in uuid_columns:
+        if data.get(key) is not None:
+            data[key] = uuid.UUID(data[key])
+    for key, has_timezone in datetime_columns:
+        if data.get(key) is not None:
+            value = datetime.fromisoformat(data[key])
+            data[key] = value if has_timezone else value.replace(tzinfo=None)
+    return model_class(**data)
+
+
+def _encode(model_class, result: Any) -> bytes:
+    if isinstance(result, model_class):
+        payload = {"e": _entity_to_dict(result)}
+    elif isinstance(result, list):
+        payload = {"l": [_entity_to_dict(entity) for entity in result]}
+    else:
+        payload = {"v": result}
+    return orjson.dumps(payload, option=_ORJSON_OPTIONS)
+
+
+def _decode(model_class, raw: bytes) -> Any:
+    payload = orjson.loads(raw)
+    if "e" in payload:
+        return _entity_from_dict(model_class, payload["e"])
+    if "l" in payload:
+        return [_entity_from_dict(model_class, data) for data in payload["l"]]
+    return payload["v"]
+
+
+def _default_key(name: str, args: tuple, kwargs: dict) -> str:
+    if name == "get_by_id" and args and not kwargs:
+        return f"id:{args[0]}"
+    digest = hashlib.blake2b(
+        repr((args, sorted(kwargs.items()))).encode(), digest_size=16
+    ).hexdigest()
+    return f"list:{name}:{digest}"
+
+
+def cached_read(
+    ttl: Union[int, CacheExpire] = CacheExpire.MINUTE * 5,
+    key: Optional[Callable[..., str]] = None,
+):
+    """Cache a repository read classmethod's result in Redis.
+
+    Put it under ``@classmethod``. key(*args, **kwargs) returns the key suffix;
+    "id:{pk}" keys are dropped per row on write, any other suffix must start with
+    "list:" and is dropped on every write to the model. Cached entities come back
+    as transient objects with column attributes only (read-only use).
+    """
+
+    def decorator(func):
+        @functools.wraps(func)
+        async def wrapper(cls, *args, **kwargs):
+            suffix = (
+                key(*args, **kwargs)
+                if key
+                else _default_key(func.__name__, args, kwargs)
+            )
+            cache_key = f"{cls.model_class.__name__}:{suffix}"
+            try:
+                raw = await query_cache.get_raw(cache_key)
+            except redis.exceptions.RedisError:
+                logger.warning("Query cache read failed: %s", cache_key, exc_info=True)
+                return await func(cls, *args, **kwargs)
+            if raw is not None:
+                return _decode(cls.model_class, raw)
+
+            result = await func(cls, *args, **kwargs)
+            # TTL 에 지터를 줘서 같은 시점에 만든 키들이 한꺼번에 만료되지 않도록
+            expire = int(ttl) + random.randint(0, max(1, int(ttl) // 10))
+            try:
+                await query_cache.set_raw(
+                    cache_key, _encode(cls.model_class, result), expire
+                )
+            except redis.exceptions.RedisError:
+                logger.warning("Query cache write failed: %s", cache_key, exc_info=True)
+            return result
+
+        wrapper.__cached_read__ = True
+        return wrapper
+
+    return decorator
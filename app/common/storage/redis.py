@@ -1,11 +1,12 @@
 import asyncio
 import os
 from collections import namedtuple
+from contextlib import asynccontextmanager
 from enum import IntEnum
 from functools import wraps
-from typing import Any, Dict, List, Optional, Tuple, Union
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
 
-import rapidjson
+import orjson
 import redis
 
 from app.common.exception import ServerError
@@ -42,6 +43,9 @@ def aioredis_error_handler(func):
     return wrapper
 
 
+# datetime(naive)은 UTC로 간주, UUID는 orjson이 기본 지원
+_ORJSON_OPTIONS = orjson.OPT_NAIVE_UTC
+
 ConnectionInfo = namedtuple("ConnectionInfo", ("hosts", "db", "minsize", "maxsize"))
 
 
@@ -76,26 +80,43 @@ class _RedisStorage(metaclass=Singleton):
         if key not in _POOLS:
             conn_info = self.get_connection_info(alias)
             logger.info("Connecting to Redis: %s", conn_info.hosts)
-            options = {
-                "encoding": encoding,
-                "decode_responses": decode_responses,
-            }
-            _redis = await redis.asyncio.from_url(
+            # 풀이 가득 차면 에러 대신 socket_timeout 동안 반납을 기다림
+            connection_pool = redis.asyncio.BlockingConnectionPool.from_url(
                 f"redis://{conn_info.hosts}",
                 db=conn_info.db,
-                **options,
+                max_connections=conn_info.maxsize,
+                timeout=settings.redis_socket_timeout,
+                socket_timeout=settings.redis_socket_timeout,
+                socket_keepalive=True,
+                health_check_interval=settings.redis_health_check_interval,
+                protocol=3,
+                encoding=encoding,
+                decode_responses=decode_responses,
             )
-            _POOLS[key] = _redis
+            _POOLS[key] = redis.asyncio.Redis(connection_pool=connection_pool)
         return _POOLS[key]
 
+    async def warmup(self, aliases: Sequence[str]) -> None:
+        """Open one connection per alias (bytes and decoded clients) ahead of traffic."""
+        for alias in aliases:
+            try:
+                for decode_responses in (False, True):
+                    conn = await self.get_connection(
+                        alias, decode_responses=decode_responses
+                    )
+                    await conn.ping()
+            except redis.exceptions.RedisError as e:
+                # Redis 가 늦게 떠도 기동은 계속, 커넥션은 첫 사용 시 생성
+                logger.warning("Redis warmup skipped for '%s': %s", alias, e)
+
     async def close_all(self):
         logger.info("Shutting down all Redis connection pools...")
         global _POOLS
-        f = []
-        for _, v in _POOLS.items():
-            f.append(v.close())
-        _ = await asyncio.gather(*f)
-        _POOLS = {}
+        # 먼저 비워 두면 종료 중에 들어온 호출은 닫히는 클라이언트 대신 새로 연결
+        old_pools, _POOLS = _POOLS, {}
+        async with asyncio.TaskGroup() as tg:
+            for client in old_pools.values():
+                tg.create_task(client.aclose(close_connection_pool=True))
         logger.info("Successfully shut down all Redis connection pools.")
 
 
@@ -107,15 +128,30 @@ class _CacheClient:
         raise NotImplementedError
 
     @aioredis_error_handler
-    async def get_connection(self):
-        conn = await pools.get_connection(alias=self._alias)
+    async def get_connection(self, decode_responses: bool = False):
+        # 값은 orjson 으로 bytes 그대로 다루고, 문자열 값/멤버가 필요할 때만 decode 풀 사용
+        conn = await pools.get_connection(
+            alias=self._alias, decode_responses=decode_responses
+        )
         return conn
 
+    @asynccontextmanager
+    async def _pipeline(self, transaction: bool = True, decode_responses: bool = False):
+        """Yield a pipeline so several commands share one round-trip."""
+        conn = await self.get_connection(decode_responses)
+        async with conn.pipeline(transaction=transaction) as pipe:
+            yield pipe
+
     @aioredis_error_handler
     async def get(self, *args, **kwargs) -> Optional[Any]:
         conn = await self.get_connection()
-        result: Optional[str] = await conn.get(self._get_key(*args, **kwargs))
-        return rapidjson.loads(result) if isinstance(result, str) else result
+        result: Optional[bytes] = await conn.get(self._get_key(*args, **kwargs))
+        return orjson.loads(result) if result is not None else None
+
+    @aioredis_error_handler
+    async def exists(self, *args, **kwargs) -> int:
+        conn = await self.get_connection()
+        return await conn.exists(self._get_key(*args, **kwargs))
 
     @aioredis_error_handler
     async def mget(
@@ -133,10 +169,9 @@ class _CacheClient:
             for key_source in key_sources
         ]
         conn = await self.get_connection()
-        results: List[Optional[str]] = await conn.mget(*keys)
+        results: List[Optional[bytes]] = await conn.mget(*keys)
         return [
-            rapidjson.loads(result) if isinstance(result, str) else result
-            for result in results
+            orjson.loads(result) if result is not None else None for result in results
         ]
 
     @aioredis_error_handler
@@ -147,8 +182,9 @@ class _CacheClient:
     @aioredis_error_handler
     async def batch_delete(self, keys):
         if keys:
-            task = [self.delete(key) for key in keys]
-            await asyncio.gather(*task)
+            # 키 개수만큼 DEL 을 보내지 않고 UNLINK 한 번 (메모리 해제는 서버 백그라운드)
+            conn = await self.get_connection()
+            await conn.unlink(*(self._get_key(key) for key in keys))
 
     @aioredis_error_handler
     async def set(
@@ -157,7 +193,7 @@ class _CacheClient:
         value: Optional[Union[str, dict, List[dict]]] = None,
         expire: Optional[Union[int, CacheExpire]] = None,
     ):
-        serialized_value: str = rapidjson.dumps(value)
+        serialized_value: bytes = orjson.dumps(value, option=_ORJSON_OPTIONS)
         conn = await self.get_connection()
         await conn.set(
             self._get_key(*args),
@@ -171,15 +207,15 @@ class _CacheClient:
         key_with_value_list: List[Tuple[str, Any]],
         expire: Optional[Union[int, CacheExpire]] = None,
     ):
+        ex = int(expire if expire is not None else self._ttl)
+        serialized: List[Tuple[str, bytes]] = [
+            (self._get_key(key), orjson.dumps(value, option=_ORJSON_OPTIONS))
+            for key, value in key_with_value_list
+        ]
         conn = await self.get_connection()
         pipe = conn.pipeline()
-        for key, value in key_with_value_list:
-            serialized_value: str = rapidjson.dumps(value)
-            pipe.set(
-                self._get_key(key),
-                value=serialized_value,
-                ex=int(expire if expire is not None else self._ttl),
-            )
+        for key, value in serialized:
+            pipe.set(key, value=value, ex=ex)
         await pipe.execute()
 
 
@@ -1,15 +1,29 @@
+import time
 from datetime import datetime, timezone
+from functools import lru_cache
+
+_UTC = timezone.utc
 
 
 def get_utc_timestamp() -> float:
     """
     :return: UTC timestamp in float
     """
-    return get_utc_datetime().timestamp()
+    # epoch 초는 이미 UTC 기준이라 datetime 을 만들 필요 없음
+    return time.time()
 
 
 def get_utc_datetime() -> datetime:
     """
     :return: UTC timestamp in datetime.datetime
     """
-    return datetime.now(tz=timezone.utc)
+    return datetime.now(_UTC)
+
+
+@lru_cache(maxsize=2)
+def utcnow_cached(ttl_hash: int) -> datetime:
+    """
+    :param ttl_hash: int(time.time()) - 같은 초 안의 호출은 같은 값을 공유
+    :return: naive UTC datetime (datetime.utcnow() 호환), 초 단위로 캐시
+    """
+    return datetime.utcnow()
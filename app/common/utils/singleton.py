@@ -4,9 +4,10 @@
 class Singleton(type):
     """Singleton metaclass ensuring only one instance of a class."""
 
-    _instances = {}
-
     def __call__(cls, *args, **kwargs):
-        if cls not in cls._instances:
-            cls._instances[cls] = super().__call__(*args, **kwargs)
-        return cls._instances[cls]
+        # cls.__dict__ 로 조회해 부모 클래스의 인스턴스를 상속받지 않도록 함
+        instance = cls.__dict__.get("__instance__")
+        if instance is None:
+            instance = super().__call__(*args, **kwargs)
+            cls.__instance__ = instance
+        return instance
@@ -1,19 +1,28 @@
+import asyncio
+from contextlib import asynccontextmanager, suppress
 from logging import config as logging_config
 
 from fastapi import APIRouter, FastAPI, HTTPException, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from slowapi.errors import RateLimitExceeded
 from starlette.exceptions import HTTPException as StarletteHTTPException
 
 from app import __version__
 from app.auth.routes.auth import auth_public_router_v1
+from app.auth.services.google_oauth_service import google_oauth_service
+from app.auth.services.user_service import user_service
 from app.common.exception import APIException
 from app.common.logging import (
     CONSOLE_LOGGING_CONFIG,
     UVICORN_LOGGING_CONFIG,
     logger,
+    start_log_listeners,
+)
+from app.common.middleware.access_log import (
+    access_log_buffer,
+    access_log_middleware,
 )
-from app.common.middleware.access_log import access_log_middleware
 from app.common.middleware.exception_handler import (
     api_exception_handler,
     general_exception_handler,
@@ -25,9 +34,11 @@ from app.common.middleware.rate_limiting import (
     get_rate_limit_middleware,
     limiter,
 )
+from app.common.middleware.request_cache import request_cache_middleware
 from app.common.storage.postgres import postgres_storage
 from app.common.storage.redis import pools
 from app.rag.routes.rag import router as rag_router
+from app.rag.services.embedding_cache import embedding_matrix
 from config.settings import settings
 
 router = APIRouter()
@@ -72,8 +83,48 @@ def get_custom_openapi(f_app: FastAPI):
     return openapi_schema
 
 
+@asynccontextmanager
+async def lifespan(_app: FastAPI):
+    """Application startup / shutdown."""
+    logger.info("Application starting up...")
+    access_log_buffer.start()
+    # 첫 요청이 커넥션 생성 비용을 내지 않도록 DB/Redis 풀을 미리 채움
+    await postgres_storage.warmup(settings.postgres_domains)
+    await pools.warmup(settings.redis_aliases)
+    if settings.rag_embedding_cache:
+        try:
+            await embedding_matrix.load()
+        except Exception as e:
+            # 캐시가 비어 있으면 검색은 pgvector 쿼리로 동작
+            logger.warning("Embedding cache load skipped: %s", e)
+    last_login_flusher = asyncio.create_task(user_service.run_last_login_flusher())
+
+    yield
+
+    logger.info("Application shutting down...")
+
+    # Stop the periodic flusher and write out whatever is still buffered
+    last_login_flusher.cancel()
+    # 취소가 끝나야 (drain 했던 항목이 버퍼로 되돌아온 뒤) 마지막 flush 가 전부 씀
+    with suppress(asyncio.CancelledError):
+        await last_login_flusher
+    try:
+        await user_service.user_repo.flush_last_logins()
+    except Exception as e:
+        logger.exception(e)
+
+    # Close database connections
+    await postgres_storage.close_all_pools()
+    await pools.close_all()
+    await google_oauth_service.aclose()
+    await access_log_buffer.stop()
+
+    logger.info("Application shutdown complete")
+
+
 def create_app(logging_configuration: dict):
     logging_config.dictConfig(logging_configuration)
+    start_log_listeners()
 
     tags_metadata = [
         {"name": "auth", "description": "auth endpoints"},
@@ -81,8 +132,10 @@ def create_app(logging_configuration: dict):
     ]
 
     app_args = {
-        "middleware": (access_log_middleware,),
+        "middleware": (access_log_middleware, request_cache_middleware),
+        "lifespan": lifespan,
         "version": __version__,
+        "default_response_class": ORJSONResponse,
     }
     if not settings.is_prod():
         app_args.update(
@@ -121,23 +174,6 @@ def create_app(logging_configuration: dict):
     _app.include_router(auth_public_router_v1)
     _app.include_router(rag_router)
 
-    # Startup and shutdown events
-    @_app.on_event("startup")
-    async def startup_event():
-        """Application startup events."""
-        logger.info("Application starting up...")
-
-    @_app.on_event("shutdown")
-    async def shutdown_event():
-        """Application shutdown events."""
-        logger.info("Application shutting down...")
-
-        # Close database connections
-        await postgres_storage.close_all_pools()
-        await pools.close_all()
-
-        logger.info("Application shutdown complete")
-
     if not settings.is_prod():
         _app.openapi = lambda: get_custom_openapi(_app)
 
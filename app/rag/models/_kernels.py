@@ -0,0 +1,24 @@
+"""임베딩 연산용 컴파일 커널 (numba 선택 의존성)."""
+
+import math
+
+try:
+    from numba import njit
+except ImportError:  # numba 가 없으면 호출부에서 numpy 로 계산
+    njit = None
+
+cosine_f32 = None
+
+if njit is not None:
+    # 시그니처를 주면 import 시점에 바로 컴파일되어 첫 호출이 느리지 않음
+    @njit("float32(float32[::1], float32[::1])", cache=True, fastmath=True)
+    def cosine_f32(a, b):  # noqa: F811
+        """한 번의 루프로 내적과 두 노름을 함께 누적한 코사인 유사도."""
+        dot = 0.0
+        na = 0.0
+        nb = 0.0
+        for i in range(a.shape[0]):
+            dot += a[i] * b[i]
+            na += a[i] * a[i]
+            nb += b[i] * b[i]
+        return dot / math.sqrt(na * nb)
@@ -6,6 +6,9 @@ from typing import List, Optional
 
 from pydantic import BaseModel, ConfigDict, Field, field_validator
 
+_ALLOWED_FILE_TYPES = frozenset(("pdf", "docx", "txt", "md"))
+_ALLOWED_FILE_TYPES_STR = ", ".join(sorted(_ALLOWED_FILE_TYPES))
+
 
 class DocumentChunkModel(BaseModel):
     """문서 청크 도메인 모델."""
@@ -19,13 +22,19 @@ class DocumentChunkModel(BaseModel):
     chunk_size: int = Field(..., gt=0, description="청크 크기")
     created_at: datetime
 
+    @classmethod
+    def from_orm_trusted(cls, obj) -> "DocumentChunkModel":
+        """DB에서 읽은 청크 ORM 객체나 Row 를 검증 없이 도메인 모델로 변환."""
+        return cls.model_construct(**{f: getattr(obj, f) for f in cls.model_fields})
+
     @field_validator("content")
     @classmethod
     def validate_content(cls, v: str) -> str:
         """청크 내용 검증."""
-        if not v.strip():
+        v = v.strip()
+        if not v:
             raise ValueError("청크 내용은 비어있을 수 없습니다")
-        return v.strip()
+        return v
 
 
 class DocumentModel(BaseModel):
@@ -50,30 +59,32 @@ class DocumentModel(BaseModel):
     @classmethod
     def validate_title(cls, v: str) -> str:
         """문서 제목 검증."""
-        if not v.strip():
+        v = v.strip()
+        if not v:
             raise ValueError("문서 제목은 비어있을 수 없습니다")
-        return v.strip()
+        return v
 
     @field_validator("content")
     @classmethod
     def validate_content(cls, v: str) -> str:
         """문서 내용 검증."""
-        if not v.strip():
+        v = v.strip()
+        if not v:
             raise ValueError("문서 내용은 비어있을 수 없습니다")
-        return v.strip()
+        return v
 
     @field_validator("file_type")
     @classmethod
     def validate_file_type(cls, v: Optional[str]) -> Optional[str]:
         """파일 타입 검증."""
-        if v is not None:
-            allowed_types = {"pdf", "docx", "txt", "md"}
-            if v.lower() not in allowed_types:
-                raise ValueError(
-                    f"지원되지 않는 파일 타입입니다: {v}. 지원 타입: {allowed_types}"
-                )
-            return v.lower()
-        return v
+        if v is None:
+            return v
+        lowered = v.lower()
+        if lowered not in _ALLOWED_FILE_TYPES:
+            raise ValueError(
+                f"지원되지 않는 파일 타입입니다: {v}. 지원 타입: {_ALLOWED_FILE_TYPES_STR}"
+            )
+        return lowered
 
     def get_total_chunks_size(self) -> int:
         """모든 청크의 총 크기를 반환."""
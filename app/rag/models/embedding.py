@@ -2,81 +2,161 @@
 
 import uuid
 from datetime import datetime
-from typing import List
+from functools import cached_property
+from typing import Any, List, Tuple
 
-from pydantic import BaseModel, ConfigDict, Field, field_validator
+import numpy as np
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    field_serializer,
+    field_validator,
+)
+
+from app.rag.models._kernels import cosine_f32
+
+try:
+    import simsimd
+except ImportError:  # 선택 의존성: 없으면 numpy 로 계산
+    simsimd = None
+
+EXPECTED_DIM = 768
+
+# float32 로 정규화한 벡터의 노름 오차 허용치
+_UNIT_TOLERANCE = 1e-4
+
+
+def quantize_int8(vectors: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """마지막 축 기준 대칭 int8 양자화 - (int8 값, 역양자화 배율) 반환.
+
+    v ≈ q * scale 이며 scale = max|v| / 127 (영벡터는 1).
+    """
+    vectors = np.asarray(vectors, dtype=np.float32)
+    scale = np.abs(vectors).max(axis=-1, keepdims=True) / 127.0
+    scale[scale == 0] = 1.0
+    q = np.clip(np.rint(vectors / scale), -127, 127).astype(np.int8)
+    return q, scale.squeeze(-1)
 
 
 class EmbeddingModel(BaseModel):
     """임베딩 도메인 모델."""
 
-    model_config = ConfigDict(from_attributes=True)
+    # embedding 은 float32 ndarray 로 보관 (DB 코덱이 주는 배열을 그대로 사용)
+    model_config = ConfigDict(from_attributes=True, arbitrary_types_allowed=True)
 
     id: uuid.UUID
     chunk_id: uuid.UUID
-    embedding: List[float] = Field(..., min_length=1, description="임베딩 벡터")
+    embedding: np.ndarray = Field(..., description="임베딩 벡터 (float32)")
     created_at: datetime
 
-    @field_validator("embedding")
+    @field_validator("embedding", mode="before")
     @classmethod
-    def validate_embedding(cls, v: List[float]) -> List[float]:
-        """임베딩 벡터 검증."""
-        if not v:
+    def validate_embedding(cls, v: Any) -> np.ndarray:
+        """임베딩 벡터 검증 및 float32 연속 배열로 변환."""
+        try:
+            arr = np.ascontiguousarray(v, dtype=np.float32)
+        except (TypeError, ValueError):
+            raise ValueError("임베딩 벡터는 숫자 리스트여야 합니다")
+
+        if arr.size == 0:
             raise ValueError("임베딩 벡터는 비어있을 수 없습니다")
 
         # ko-sroberta-multitask 모델의 차원 확인 (768차원)
-        expected_dim = 768
-        if len(v) != expected_dim:
+        if arr.ndim != 1 or arr.size != EXPECTED_DIM:
             raise ValueError(
-                f"임베딩 차원이 잘못되었습니다. 기대값: {expected_dim}, 실제값: {len(v)}"
+                f"임베딩 차원이 잘못되었습니다. 기대값: {EXPECTED_DIM}, 실제값: {arr.shape}"
             )
 
-        # 벡터의 각 요소가 유효한 float 값인지 확인
-        for i, val in enumerate(v):
-            if not isinstance(val, (int, float)):
-                raise ValueError(
-                    f"임베딩 벡터의 {i}번째 요소가 숫자가 아닙니다: {type(val)}"
-                )
-            if not (-1.0 <= val <= 1.0):
-                # 일반적으로 정규화된 임베딩은 -1~1 범위, 하지만 모델에 따라 다를 수 있음
-                # 너무 엄격하게 하지 않고 경고만 표시하도록 수정 가능
-                pass
+        if not np.isfinite(arr).all():
+            raise ValueError("임베딩 벡터에 NaN 또는 무한대 값이 있습니다")
+
+        return arr
 
-        return v
+    @field_serializer("embedding")
+    def serialize_embedding(self, v: np.ndarray) -> List[float]:
+        return v.tolist()
 
     def get_dimension(self) -> int:
         """임베딩 차원 수를 반환."""
         return len(self.embedding)
 
+    @property
+    def _vec(self) -> np.ndarray:
+        """float32 연속 배열 임베딩 (검증 시 이미 변환됨)."""
+        return self.embedding
+
+    @cached_property
+    def magnitude(self) -> float:
+        """임베딩 벡터의 크기(magnitude) - 인스턴스당 한 번만 계산."""
+        return float(np.linalg.norm(self._vec))
+
     def get_magnitude(self) -> float:
-        """임베딩 벡터의 크기(magnitude)를 계산."""
-        return sum(x * x for x in self.embedding) ** 0.5
+        """임베딩 벡터의 크기(magnitude)를 반환."""
+        return self.magnitude
 
     def is_normalized(self, tolerance: float = 1e-6) -> bool:
         """임베딩 벡터가 정규화되었는지 확인."""
-        magnitude = self.get_magnitude()
-        return abs(magnitude - 1.0) < tolerance
+        return abs(self.magnitude - 1.0) < tolerance
 
     def normalize(self) -> List[float]:
         """임베딩 벡터를 정규화하여 반환."""
-        magnitude = self.get_magnitude()
-        if magnitude == 0:
+        if self.magnitude == 0:
             raise ValueError("영벡터는 정규화할 수 없습니다")
-        return [x / magnitude for x in self.embedding]
+        return (self._vec / self.magnitude).tolist()
 
     def cosine_similarity(self, other: "EmbeddingModel") -> float:
         """다른 임베딩과의 코사인 유사도를 계산."""
         if len(self.embedding) != len(other.embedding):
             raise ValueError("임베딩 차원이 다릅니다")
 
-        # 내적 계산
-        dot_product = sum(a * b for a, b in zip(self.embedding, other.embedding))
+        a, b = self._vec, other._vec
+        if self.magnitude == 0 or other.magnitude == 0:
+            return 0.0
 
-        # 크기 계산
-        magnitude_a = self.get_magnitude()
-        magnitude_b = other.get_magnitude()
+        # 저장 시 정규화된 벡터끼리는 내적이 곧 코사인 유사도
+        if self.is_normalized(_UNIT_TOLERANCE) and other.is_normalized(_UNIT_TOLERANCE):
+            return float(np.dot(a, b))
 
-        if magnitude_a == 0 or magnitude_b == 0:
-            return 0.0
+        if simsimd is not None:
+            # simsimd.cosine 은 거리(1 - 유사도)를 반환
+            return 1.0 - float(simsimd.cosine(a, b))
+        if cosine_f32 is not None:
+            return float(cosine_f32(a, b))
+
+        return float(np.dot(a, b)) / (self.magnitude * other.magnitude)
+
+    @classmethod
+    def batch_cosine(cls, query: np.ndarray, matrix: np.ndarray) -> np.ndarray:
+        """(N, dim) 행렬의 각 행과 query 의 유사도 (둘 다 정규화되어 있다고 가정)."""
+        return matrix @ query
 
-        return dot_product / (magnitude_a * magnitude_b)
+    @classmethod
+    def batch_cosine_i8(
+        cls,
+        query: np.ndarray,
+        query_scale: float,
+        matrix: np.ndarray,
+        scales: np.ndarray,
+    ) -> np.ndarray:
+        """int8 양자화된 행렬/쿼리의 유사도 (정수 내적 후 배율만 곱함)."""
+        dots = matrix.astype(np.int32) @ query.astype(np.int32)
+        return dots * (scales * query_scale)
+
+    @classmethod
+    def select_top_k(cls, scores: np.ndarray, k: int) -> Tuple[np.ndarray, np.ndarray]:
+        """점수 배열에서 상위 k 개의 (인덱스, 점수) 를 높은 순으로 반환."""
+        if k < len(scores):
+            # 전체 정렬 대신 O(N) 으로 상위 k 개만 골라낸 뒤 그것만 정렬
+            idx = np.argpartition(-scores, k)[:k]
+        else:
+            idx = np.arange(len(scores))
+        idx = idx[np.argsort(-scores[idx])]
+        return idx, scores[idx]
+
+    @classmethod
+    def top_k(
+        cls, query: np.ndarray, matrix: np.ndarray, k: int
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """유사도 상위 k 개 행의 (인덱스, 점수) 를 높은 순으로 반환."""
+        return cls.select_top_k(cls.batch_cosine(query, matrix), k)
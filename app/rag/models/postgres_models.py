@@ -3,12 +3,26 @@
 import uuid
 from datetime import datetime
 
-from pgvector.sqlalchemy import Vector
-from sqlalchemy import ARRAY, Column, DateTime, ForeignKey, Integer, String, Text
+import numpy as np
+from sqlalchemy import (
+    ARRAY,
+    Column,
+    DateTime,
+    Float,
+    ForeignKey,
+    Index,
+    Integer,
+    LargeBinary,
+    String,
+    Text,
+    event,
+)
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 
 from app.common.storage.postgres import Base
+from app.rag.models.embedding import quantize_int8
+from app.rag.models.vector_type import Float32Vector
 
 
 class Document(Base):
@@ -71,12 +85,44 @@ class Embedding(Base):
         ForeignKey("document_chunks.id", ondelete="CASCADE"),
         nullable=False,
     )
-    embedding = Column(Vector(768), nullable=False)  # ko-sroberta-multitask dimension
+    # ko-sroberta-multitask dimension
+    embedding = Column(Float32Vector(768), nullable=False)
+    # int8 양자화본 (embedding ≈ embedding_i8 * embedding_scale) - 인메모리 int8 검색용
+    embedding_i8 = Column(LargeBinary, nullable=True)
+    embedding_scale = Column(Float(precision=24), nullable=True)
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
 
     # Relationships
     chunk = relationship("DocumentChunk", back_populates="embedding")
 
+    __table_args__ = (
+        # 코사인 거리(<=>) 근사 최근접 탐색용
+        Index(
+            "embeddings_hnsw",
+            "embedding",
+            postgresql_using="hnsw",
+            postgresql_ops={"embedding": "vector_cosine_ops"},
+            postgresql_with={"m": 16, "ef_construction": 64},
+        ),
+    )
+
+
+@event.listens_for(Embedding, "before_insert")
+@event.listens_for(Embedding, "before_update")
+def _normalize_embedding(mapper, connection, target: Embedding) -> None:
+    """저장 전에 단위 벡터로 정규화 - 검색 시 코사인이 내적 한 번으로 끝나도록.
+
+    정규화한 벡터의 int8 양자화본도 함께 채움.
+    """
+    if target.embedding is None:
+        return
+    vector = np.asarray(target.embedding, dtype=np.float32)
+    norm = np.linalg.norm(vector)
+    target.embedding = vector / norm if norm > 0 else vector
+    quantized, scale = quantize_int8(target.embedding)
+    target.embedding_i8 = quantized.tobytes()
+    target.embedding_scale = float(scale)
+
 
 class RAGQuery(Base):
     """RAG 질의 이력 모델."""
@@ -89,7 +135,9 @@ class RAGQuery(Base):
     )
     question = Column(Text, nullable=False)
     answer = Column(Text, nullable=False)
-    context_documents = Column(ARRAY(String), nullable=True)  # 참조된 문서 ID들
+    context_documents = Column(
+        ARRAY(UUID(as_uuid=True)), nullable=True
+    )  # 참조된 문서 ID들
     confidence_score = Column(Integer, nullable=True)  # 1-10 점수
     feedback = Column(Text, nullable=True)  # 사용자 피드백
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
@@ -16,7 +16,7 @@ class RAGQueryModel(BaseModel):
     user_id: uuid.UUID
     question: str = Field(..., min_length=1, max_length=1000, description="사용자 질문")
     answer: str = Field(..., min_length=1, description="생성된 답변")
-    context_documents: Optional[List[str]] = Field(
+    context_documents: Optional[List[uuid.UUID]] = Field(
         default=None, description="참조된 문서 ID들"
     )
     confidence_score: Optional[int] = Field(
@@ -49,23 +49,12 @@ class RAGQueryModel(BaseModel):
 
     @field_validator("context_documents")
     @classmethod
-    def validate_context_documents(cls, v: Optional[List[str]]) -> Optional[List[str]]:
-        """참조 문서 ID 목록 검증."""
-        if v is not None:
-            # 빈 리스트는 허용
-            if not isinstance(v, list):
-                raise ValueError("context_documents는 문자열 리스트여야 합니다")
-
-            # 각 문서 ID가 유효한 UUID 형식인지 확인
-            for doc_id in v:
-                if not isinstance(doc_id, str):
-                    raise ValueError("문서 ID는 문자열이어야 합니다")
-                try:
-                    uuid.UUID(doc_id)  # UUID 형식 검증
-                except ValueError:
-                    raise ValueError(f"유효하지 않은 문서 ID 형식입니다: {doc_id}")
-
-        return v
+    def validate_context_documents(
+        cls, v: Optional[List[uuid.UUID]]
+    ) -> Optional[List[uuid.UUID]]:
+        """참조 문서 ID 목록 중복 제거 (형식 검증은 UUID 타입이 처리)."""
+        # 같은 문서가 여러 청크로 중복 참조될 수 있으므로 한 번씩만 저장
+        return list(dict.fromkeys(v)) if v else v
 
     @field_validator("feedback")
     @classmethod
@@ -0,0 +1,63 @@
+"""pgvector column type that round-trips float32 NumPy arrays over the binary protocol."""
+
+import struct
+from typing import Any
+
+import asyncpg
+import numpy as np
+from pgvector import Vector
+from pgvector.sqlalchemy import VECTOR
+
+from app.common.storage.postgres import postgres_storage
+
+# pgvector 바이너리 포맷: dim(uint16) + unused(uint16) + big-endian float32 * dim
+_HEADER = struct.Struct(">HH")
+
+
+def _encode_vector(value: Any) -> bytes:
+    if isinstance(value, str):
+        value = Vector._from_text(value)
+    elif isinstance(value, Vector):
+        value = value.to_numpy()
+    data = np.asarray(value, dtype=">f4")
+    return _HEADER.pack(data.size, 0) + data.tobytes()
+
+
+def _decode_vector(data: bytes) -> np.ndarray:
+    dim, _ = _HEADER.unpack_from(data)
+    # 한 번의 복사로 네이티브 float32 배열 (행마다 PyFloat 768개를 만들지 않음)
+    return np.frombuffer(data, dtype=">f4", count=dim, offset=_HEADER.size).astype(
+        np.float32
+    )
+
+
+async def register_vector_codec(conn: asyncpg.Connection) -> None:
+    """vector 타입을 바이너리 코덱으로 주고받도록 등록."""
+    await conn.set_type_codec(
+        "vector",
+        schema="public",
+        encoder=_encode_vector,
+        decoder=_decode_vector,
+        format="binary",
+    )
+
+
+class Float32Vector(VECTOR):
+    """Vector column whose values are float32 ndarrays; encoding is left to the codec."""
+
+    cache_ok = True
+
+    def bind_processor(self, dialect):
+        return None
+
+    def result_processor(self, dialect, coltype):
+        def process(value):
+            # 코덱이 없는 커넥션(텍스트 포맷)에서도 같은 타입으로 반환
+            if isinstance(value, str):
+                return np.asarray(Vector._from_text(value), dtype=np.float32)
+            return value
+
+        return process
+
+
+postgres_storage.register_connection_setup("rag", register_vector_codec)
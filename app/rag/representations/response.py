@@ -2,9 +2,9 @@
 
 import uuid
 from datetime import datetime
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
 
 
 class DocumentChunk(BaseModel):
@@ -67,19 +67,6 @@ class Embedding(EmbeddingBase):
     created_at: datetime
 
 
-class RAGQueryResponse(BaseModel):
-    """RAG 응답 결과 스키마."""
-
-    answer: str = Field(..., description="생성된 답변")
-    context_documents: List[str] = Field(default=[], description="참조한 문서 컨텍스트")
-    confidence_score: Optional[float] = Field(
-        None, ge=0.0, le=1.0, description="신뢰도 점수"
-    )
-    sources: Optional[List[DocumentResponse]] = Field(
-        default=None, description="참조 문서들"
-    )
-
-
 class RAGQuery(BaseModel):
     """RAG 질의 응답 기록 스키마."""
 
@@ -89,8 +76,8 @@ class RAGQuery(BaseModel):
     user_id: uuid.UUID
     question: str = Field(..., description="사용자 질문")
     answer: str = Field(..., description="생성된 답변")
-    context_documents: Optional[List[str]] = Field(
-        default=None, description="참조 문서 컨텍스트"
+    context_documents: Optional[List[uuid.UUID]] = Field(
+        default=None, description="참조 문서 ID들"
     )
     confidence_score: Optional[int] = Field(None, description="신뢰도 점수")
     feedback: Optional[str] = Field(None, description="사용자 피드백")
@@ -114,7 +101,7 @@ class RAGResponse(BaseModel):
     question: str
     answer: str
     context_count: int
-    model_info: dict
+    model_info: Dict[str, Any]
 
 
 class HealthResponse(BaseModel):
@@ -159,3 +146,7 @@ class RAGQueryResponse(BaseModel):
     )
     db_status: Optional[dict] = Field(None, description="데이터베이스 상태 정보")
     error: Optional[bool] = Field(False, description="오류 발생 여부")
+
+
+# 모듈 로드 시 한 번만 생성해 요청마다 재사용
+RAG_QUERY_RESPONSE_ADAPTER = TypeAdapter(RAGQueryResponse)
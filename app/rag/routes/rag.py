@@ -1,9 +1,11 @@
 """GPT-OSS RAG 시스템 API 엔드포인트."""
 
 from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import ORJSONResponse
 
 from app.rag.representations.request import RAGRequest, RAGQueryParametersRequest
 from app.rag.representations.response import (
+    RAG_QUERY_RESPONSE_ADAPTER,
     HealthResponse,
     RAGQueryResponse,
     RAGResponse,
@@ -69,7 +71,10 @@ async def process_rag_query(
             temperature=payload.temperature,
         )
 
-        return RAGQueryResponse(**result)
+        response = RAG_QUERY_RESPONSE_ADAPTER.validate_python(result)
+        return ORJSONResponse(
+            RAG_QUERY_RESPONSE_ADAPTER.dump_python(response, mode="json")
+        )
 
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
@@ -0,0 +1,200 @@
+"""임베딩 캐시 - 검색용 인메모리 임베딩 행렬과 질문 임베딩 캐시."""
+
+import hashlib
+import logging
+from collections import OrderedDict
+from typing import List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+import redis
+from sqlalchemy import func, select
+
+from app.common.storage.postgres import postgres_storage
+from app.common.storage.redis import CacheExpire, _CacheClient
+from app.rag.models.embedding import EmbeddingModel, quantize_int8
+from app.rag.models.postgres_models import Embedding
+from config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+_FLOAT32_SIZE = np.dtype(np.float32).itemsize
+
+
+def _normalize_rows(matrix: np.ndarray) -> np.ndarray:
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    matrix /= norms
+    return matrix
+
+
+class EmbeddingMatrix:
+    """(N, dim) 행렬과 같은 순서의 chunk id 배열 (SoA 배치 레이아웃).
+
+    행은 로드 시 한 번 정규화해 두므로 유사도는 ``matrix @ q`` 한 번으로 계산.
+    int8=True 면 행렬은 int8 양자화본, scales 는 행별 역양자화 배율.
+    """
+
+    def __init__(self, dimension: int, int8: bool = False):
+        self.dimension = dimension
+        self.int8 = int8
+        self.matrix = np.empty((0, dimension), dtype=np.int8 if int8 else np.float32)
+        self.scales = np.empty(0, dtype=np.float32)
+        self.ids = np.empty(0, dtype="<U36")
+
+    @property
+    def size(self) -> int:
+        return len(self.ids)
+
+    async def load(self, batch_size: int = 1000) -> None:
+        """embeddings 테이블 전체를 스트리밍으로 읽어 행렬을 새로 만듭니다."""
+        if self.int8:
+            # 양자화본이 없는 행(마이그레이션 이전 데이터)은 제외
+            stmt = select(
+                Embedding.chunk_id, Embedding.embedding_i8, Embedding.embedding_scale
+            ).where(Embedding.embedding_i8.is_not(None))
+        else:
+            stmt = select(Embedding.chunk_id, Embedding.embedding)
+
+        async with postgres_storage.get_domain_read_session("rag") as session:
+            total = (
+                await session.execute(select(func.count()).select_from(stmt.subquery()))
+            ).scalar()
+            matrix = np.empty((total, self.dimension), dtype=self.matrix.dtype)
+            scales = np.ones(total, dtype=np.float32)
+            ids = np.empty(total, dtype="<U36")
+
+            result = await session.stream(
+                stmt, execution_options={"yield_per": batch_size}
+            )
+            count = 0
+            async for row in result:
+                if count == len(ids):
+                    # count 이후 추가된 행이 있으면 두 배로 확장
+                    size = max(1, count * 2)
+                    matrix = np.resize(matrix, (size, self.dimension))
+                    scales = np.resize(scales, size)
+                    ids = np.resize(ids, size)
+                if self.int8:
+                    matrix[count] = np.frombuffer(row[1], dtype=np.int8)
+                    scales[count] = row[2]
+                else:
+                    matrix[count] = row[1]
+                ids[count] = str(row[0])
+                count += 1
+
+        matrix = matrix[:count].copy()
+        # int8 본은 저장 시 정규화된 벡터에서 만든 것이라 그대로 사용
+        self.matrix = matrix if self.int8 else _normalize_rows(matrix)
+        self.scales = scales[:count].copy()
+        self.ids = ids[:count].copy()
+        logger.info(f"임베딩 캐시 로드 완료: {count}개 (int8={self.int8})")
+
+    def append(
+        self, chunk_ids: Sequence[str], vectors: Sequence[Sequence[float]]
+    ) -> None:
+        """새로 저장된 임베딩을 행렬 끝에 추가합니다."""
+        if not chunk_ids:
+            return
+        rows = _normalize_rows(np.asarray(vectors, dtype=np.float32).copy())
+        if self.int8:
+            rows, scales = quantize_int8(rows)
+            self.scales = np.concatenate((self.scales, scales.astype(np.float32)))
+        self.matrix = np.vstack((self.matrix, rows))
+        self.ids = np.concatenate((self.ids, np.asarray(chunk_ids, dtype="<U36")))
+
+    def search(
+        self,
+        query: Sequence[float],
+        k: int,
+        threshold: Optional[float] = None,
+    ) -> List[Tuple[str, float]]:
+        """코사인 유사도 상위 k 개의 (chunk_id, score) 를 높은 순으로 반환합니다."""
+        if not self.size or k <= 0:
+            return []
+
+        q = np.asarray(query, dtype=np.float32)
+        norm = np.linalg.norm(q)
+        if norm == 0:
+            return []
+        q = q / norm
+        if self.int8:
+            q_i8, q_scale = quantize_int8(q)
+            scores = EmbeddingModel.batch_cosine_i8(
+                q_i8, float(q_scale), self.matrix, self.scales
+            )
+            top, scores = EmbeddingModel.select_top_k(scores, k)
+        else:
+            top, scores = EmbeddingModel.top_k(q, self.matrix, k)
+        if threshold is not None:
+            keep = scores >= threshold
+            top, scores = top[keep], scores[keep]
+        return [(str(self.ids[i]), float(score)) for i, score in zip(top, scores)]
+
+
+class QueryEmbeddingCache(_CacheClient):
+    """질문 임베딩 캐시 - 프로세스 내 LRU(L1) + Redis(L2, ``vec:{model}:{dim}:{sha256}``).
+
+    값은 float32 원시 바이트로 저장. Redis 오류나 차원이 맞지 않는 값은 캐시 miss 로 취급.
+    """
+
+    _alias: str = "default"
+    _prefix: str = "vec:"
+    _ttl: Union[int, CacheExpire] = CacheExpire.DAY
+
+    def __init__(
+        self,
+        maxsize: int = 8192,
+        model: str = settings.embedding_model,
+        dimension: int = settings.embedding_dimension,
+    ):
+        self._maxsize = maxsize
+        self._dimension = dimension
+        # 모델/차원이 바뀌면 다른 키 공간을 쓰도록 prefix 에 포함
+        self._prefix = f"vec:{model}:{dimension}:"
+        self._local: "OrderedDict[bytes, np.ndarray]" = OrderedDict()
+
+    def _get_key(self, digest: bytes) -> str:
+        return self._prefix + digest.hex()
+
+    @staticmethod
+    def digest(text: str) -> bytes:
+        return hashlib.sha256(text.strip().encode()).digest()
+
+    def _remember(self, digest: bytes, vector: np.ndarray) -> None:
+        self._local[digest] = vector
+        if len(self._local) > self._maxsize:
+            self._local.popitem(last=False)
+
+    async def get_vector(self, digest: bytes) -> Optional[np.ndarray]:
+        vector = self._local.get(digest)
+        if vector is not None:
+            self._local.move_to_end(digest)
+            return vector
+
+        try:
+            conn = await self.get_connection()
+            raw = await conn.get(self._get_key(digest))
+        except redis.exceptions.RedisError:
+            logger.warning("질문 임베딩 캐시 조회 실패", exc_info=True)
+            return None
+        if raw is None or len(raw) != self._dimension * _FLOAT32_SIZE:
+            return None
+        vector = np.frombuffer(raw, dtype=np.float32)
+        self._remember(digest, vector)
+        return vector
+
+    async def set_vector(self, digest: bytes, vector: np.ndarray) -> None:
+        vector = np.asarray(vector, dtype=np.float32)
+        self._remember(digest, vector)
+        try:
+            conn = await self.get_connection()
+            await conn.set(self._get_key(digest), vector.tobytes(), ex=int(self._ttl))
+        except redis.exceptions.RedisError:
+            logger.warning("질문 임베딩 캐시 저장 실패", exc_info=True)
+
+
+query_embedding_cache = QueryEmbeddingCache()
+
+embedding_matrix = EmbeddingMatrix(
+    settings.embedding_dimension, int8=settings.use_int8_embeddings
+)
@@ -5,6 +5,7 @@ from typing import List
 
 from sentence_transformers import SentenceTransformer
 
+from app.rag.services.embedding_cache import query_embedding_cache
 from config.settings import settings
 
 logger = logging.getLogger(__name__)
@@ -31,12 +32,19 @@ class EmbeddingService:
             raise ValueError("텍스트가 제공되지 않았습니다")
 
         try:
+            # 같은 질문은 모델을 거치지 않고 캐시된 벡터 사용
+            digest = query_embedding_cache.digest(text)
+            cached = await query_embedding_cache.get_vector(digest)
+            if cached is not None:
+                return cached.tolist()
+
             self._load_model()
 
             logger.info(f"텍스트 임베딩 생성 중: {text[:50]}...")
 
             # 텍스트를 임베딩으로 변환
             embedding = self._model.encode(text.strip(), normalize_embeddings=True)
+            await query_embedding_cache.set_vector(digest, embedding)
 
             # numpy array를 Python list로 변환
             embedding_list = embedding.tolist()
@@ -6,7 +6,8 @@ from typing import List, Optional
 from sqlalchemy import text
 
 from app.common.storage.postgres import postgres_storage
-from app.rag.models.postgres_models import DocumentChunk
+from app.rag.models.document import DocumentChunkModel
+from app.rag.services.embedding_cache import embedding_matrix
 from config.settings import settings
 
 logger = logging.getLogger(__name__)
@@ -15,7 +16,7 @@ logger = logging.getLogger(__name__)
 class DocumentChunkResult:
     """검색 결과 문서 청크."""
 
-    def __init__(self, chunk: DocumentChunk, similarity_score: float):
+    def __init__(self, chunk: DocumentChunkModel, similarity_score: float):
         self.chunk = chunk
         self.similarity_score = similarity_score
         self.content = chunk.content
@@ -46,11 +47,15 @@ class VectorSearchService:
         threshold = similarity_threshold or self.similarity_threshold
         limit = max_docs or self.max_retrieved_docs
 
+        if embedding_matrix.size:
+            return await self._search_in_memory(query_embedding, threshold, limit)
+
         try:
             async with postgres_storage.get_domain_read_session("rag") as session:
                 logger.info(f"벡터 검색 시작 - threshold: {threshold}, limit: {limit}")
 
                 # pgvector 코사인 유사도 검색 쿼리
+                # ORDER BY 에 거리 연산자를 그대로 써야 HNSW 인덱스(embeddings_hnsw)를 사용
                 query = text(
                     """
                     SELECT
@@ -64,8 +69,8 @@ class VectorSearchService:
                     FROM document_chunks dc
                     JOIN embeddings e ON dc.id = e.chunk_id
                     JOIN documents d ON dc.document_id = d.id
-                    WHERE (1 - (e.embedding <=> :query_embedding)) >= :threshold
-                    ORDER BY similarity_score DESC
+                    WHERE (e.embedding <=> :query_embedding) <= 1 - :threshold
+                    ORDER BY e.embedding <=> :query_embedding
                     LIMIT :limit
                 """
                 )
@@ -89,15 +94,8 @@ class VectorSearchService:
                 # 결과 변환
                 search_results = []
                 for row in rows:
-                    # DocumentChunk 객체 생성
-                    chunk = DocumentChunk(
-                        id=row.id,
-                        document_id=row.document_id,
-                        chunk_index=row.chunk_index,
-                        content=row.content,
-                        chunk_size=row.chunk_size,
-                        created_at=row.created_at,
-                    )
+                    # DB 에서 읽은 행이므로 검증 없이 도메인 모델로 변환
+                    chunk = DocumentChunkModel.from_orm_trusted(row)
 
                     # 검색 결과 객체 생성
                     search_result = DocumentChunkResult(
@@ -112,9 +110,31 @@ class VectorSearchService:
             logger.error(f"벡터 검색 중 오류: {str(e)}")
             raise Exception(f"문서 검색에 실패했습니다: {str(e)}")
 
+    async def _search_in_memory(
+        self, query_embedding: List[float], threshold: float, limit: int
+    ) -> List[DocumentChunkResult]:
+        """인메모리 임베딩 행렬에서 상위 청크를 고른 뒤 청크 본문만 DB에서 조회."""
+        hits = embedding_matrix.search(query_embedding, limit, threshold)
+        if not hits:
+            logger.info("검색 결과 없음")
+            return []
+
+        chunks = await self.get_document_chunks_by_ids(
+            [chunk_id for chunk_id, _ in hits]
+        )
+        chunks_by_id = {str(chunk.id): chunk for chunk in chunks}
+        # 캐시 이후 삭제된 청크는 건너뜀
+        search_results = [
+            DocumentChunkResult(chunk=chunks_by_id[chunk_id], similarity_score=score)
+            for chunk_id, score in hits
+            if chunk_id in chunks_by_id
+        ]
+        logger.info(f"벡터 검색 완료(메모리): {len(search_results)}개 문서 발견")
+        return search_results
+
     async def get_document_chunks_by_ids(
         self, chunk_ids: List[str]
-    ) -> List[DocumentChunk]:
+    ) -> List[DocumentChunkModel]:
         """청크 ID 목록으로 문서 청크들을 가져옵니다."""
 
         if not chunk_ids:
@@ -136,19 +156,7 @@ class VectorSearchService:
 
                 rows = result.fetchall()
 
-                chunks = []
-                for row in rows:
-                    chunk = DocumentChunk(
-                        id=row.id,
-                        document_id=row.document_id,
-                        chunk_index=row.chunk_index,
-                        content=row.content,
-                        chunk_size=row.chunk_size,
-                        created_at=row.created_at,
-                    )
-                    chunks.append(chunk)
-
-                return chunks
+                return [DocumentChunkModel.from_orm_trusted(row) for row in rows]
 
         except Exception as e:
             logger.error(f"청크 조회 중 오류: {str(e)}")
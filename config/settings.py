@@ -1,4 +1,5 @@
-from typing import List
+import os
+from typing import List, Literal
 
 from pydantic_settings import BaseSettings
 
@@ -13,6 +14,25 @@ class Settings(BaseSettings):
     postgres_password: str
     postgres_host: str = "localhost"  # Default for local development
     postgres_port: int = 5432
+    # 외부 풀러(pgbouncer/pgcat) 뒤에서는 "null" 로 앱 쪽 풀링을 끔
+    postgres_pool_class: Literal["queue", "null"] = "queue"
+    postgres_pool_size: int = min(32, (os.cpu_count() or 1) * 2 + 1)
+    postgres_max_overflow: int = 10
+    postgres_pool_timeout: float = 2.0  # seconds to wait for a pooled connection
+    postgres_pool_warmup: int = 5  # connections opened per engine at startup
+    # PgBouncer(transaction pooling) 경유 시 서버측 prepared statement 비활성화
+    postgres_pgbouncer: bool = False
+    # 읽기 전용 레플리카/풀러 호스트 (비어 있으면 primary 사용)
+    postgres_read_host: str = ""
+    # 읽기 엔진 연결 시 asyncpg 가 고를 서버 종류; 단일 호스트면 primary 로 폴백
+    postgres_read_target_session_attrs: Literal[
+        "any", "prefer-standby", "standby", "read-only"
+    ] = "prefer-standby"
+    # 기동 시 풀을 미리 만들어 둘 도메인 (repository 의 domain 값)
+    postgres_domains: List[str] = ["user", "rag"]
+    # asyncpg 연결별 statement 캐시 / SQLAlchemy prepared statement LRU 크기
+    postgres_statement_cache_size: int = 256
+    postgres_prepared_statement_cache_size: int = 256
 
     # Test database settings
     test_postgres_db: str
@@ -26,6 +46,10 @@ class Settings(BaseSettings):
     redis_auth_db: int = 1
     redis_auth_minsize: int = 1
     redis_auth_maxsize: int = 10
+    # 기동 시 커넥션을 미리 열어 둘 Redis alias (_CacheClient._alias 값)
+    redis_aliases: List[str] = ["default", "auth"]
+    redis_socket_timeout: float = 2.0  # 명령 응답 / 풀 커넥션 대기 시간(초)
+    redis_health_check_interval: int = 30  # 유휴 커넥션 재사용 전 PING 주기(초)
 
     # JWT
     jwt_secret_key: str
@@ -58,6 +82,12 @@ class Settings(BaseSettings):
     # Vector search settings
     similarity_threshold: float = 0.7
     max_retrieved_docs: int = 5
+    # 기동 시 임베딩 전체를 메모리 행렬로 올려 검색 (pgvector 쿼리 대신)
+    rag_embedding_cache: bool = False
+    # HNSW 탐색 후보 수 (클수록 recall 증가, 느려짐)
+    rag_hnsw_ef_search: int = 40
+    # 인메모리 검색 행렬을 int8 양자화본으로 구성 (메모리/대역폭 1/4, recall 비교용)
+    use_int8_embeddings: bool = False
 
     # File upload settings
     max_file_size_mb: int = 10
@@ -78,7 +108,9 @@ class Settings(BaseSettings):
 
     @property
     def postgres_read_url(self) -> str:
-        return self.postgres_url  # Can be customized later for read replicas
+        if not self.postgres_read_host:
+            return self.postgres_url
+        return f"postgresql://{self.postgres_user}:{self.postgres_password}@{self.postgres_read_host}:{self.postgres_port}/{self.postgres_db}"
 
     @property
     def postgres_write_url(self) -> str:
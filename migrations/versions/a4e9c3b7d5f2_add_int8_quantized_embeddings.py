@@ -0,0 +1,62 @@
+"""Add int8 quantized copy of embeddings
+
+Revision ID: a4e9c3b7d5f2
+Revises: f2c7a8e5b3d1
+Create Date: 2026-10-16 00:06:41.273519
+
+"""
+
+from typing import Sequence, Union
+
+import numpy as np
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "a4e9c3b7d5f2"
+down_revision: Union[str, None] = "f2c7a8e5b3d1"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+_BATCH_SIZE = 1000
+
+
+def upgrade() -> None:
+    op.add_column(
+        "embeddings", sa.Column("embedding_i8", sa.LargeBinary(), nullable=True)
+    )
+    op.add_column("embeddings", sa.Column("embedding_scale", sa.REAL(), nullable=True))
+
+    # 기존 행 채우기 - 새 행은 Embedding before_insert 이벤트에서 채워짐
+    bind = op.get_bind()
+    while True:
+        rows = bind.execute(
+            sa.text(
+                "SELECT id, embedding::real[] AS vector FROM embeddings "
+                "WHERE embedding_i8 IS NULL LIMIT :limit"
+            ),
+            {"limit": _BATCH_SIZE},
+        ).fetchall()
+        if not rows:
+            break
+        vectors = np.asarray([row.vector for row in rows], dtype=np.float32)
+        scales = np.abs(vectors).max(axis=1) / 127.0
+        scales[scales == 0] = 1.0
+        quantized = np.clip(np.rint(vectors / scales[:, None]), -127, 127).astype(
+            np.int8
+        )
+        bind.execute(
+            sa.text(
+                "UPDATE embeddings SET embedding_i8 = :data, embedding_scale = :scale "
+                "WHERE id = :id"
+            ),
+            [
+                {"id": row.id, "data": q.tobytes(), "scale": float(scale)}
+                for row, q, scale in zip(rows, quantized, scales)
+            ],
+        )
+
+
+def downgrade() -> None:
+    op.drop_column("embeddings", "embedding_scale")
+    op.drop_column("embeddings", "embedding_i8")
@@ -0,0 +1,44 @@
+"""Add composite indexes on social_accounts
+
+Revision ID: b7e4c1d2a9f3
+Revises: 061adf9eaf75
+Create Date: 2026-10-15 10:12:41.318204
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "b7e4c1d2a9f3"
+down_revision: Union[str, None] = "061adf9eaf75"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_unique_constraint(
+        "uq_social_provider_pid",
+        "social_accounts",
+        ["provider", "provider_user_id"],
+    )
+    op.create_index(
+        "ix_social_user_provider",
+        "social_accounts",
+        ["user_id", "provider"],
+        unique=False,
+    )
+    # (user_id, provider) 인덱스의 leftmost prefix가 user_id 단독 조회를 대체
+    op.drop_index(op.f("ix_social_accounts_user_id"), table_name="social_accounts")
+
+
+def downgrade() -> None:
+    op.create_index(
+        op.f("ix_social_accounts_user_id"),
+        "social_accounts",
+        ["user_id"],
+        unique=False,
+    )
+    op.drop_index("ix_social_user_provider", table_name="social_accounts")
+    op.drop_constraint("uq_social_provider_pid", "social_accounts", type_="unique")
@@ -0,0 +1,47 @@
+"""Add functional index on lower(users.email)
+
+Revision ID: c5a9e3f17b42
+Revises: b7e4c1d2a9f3
+Create Date: 2026-10-15 23:04:12.527931
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c5a9e3f17b42"
+down_revision: Union[str, None] = "b7e4c1d2a9f3"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # 기존 대소문자 혼용 이메일을 소문자로 정규화 (충돌하는 행은 그대로 둠)
+    # 소문자가 같은 혼용 행이 여럿이면 가장 먼저 가입한 한 행만 변경
+    op.execute(
+        """
+        UPDATE users AS u
+        SET email = lower(u.email)
+        FROM (
+            SELECT DISTINCT ON (lower(email)) id
+            FROM users
+            WHERE email <> lower(email)
+            ORDER BY lower(email), created_at, id
+        ) AS first_per_email
+        WHERE u.id = first_per_email.id
+          AND NOT EXISTS (SELECT 1 FROM users o WHERE o.email = lower(u.email))
+        """
+    )
+    op.create_index(
+        "users_email_lower_idx",
+        "users",
+        [sa.text("lower(email)")],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("users_email_lower_idx", table_name="users")
@@ -0,0 +1,35 @@
+"""Normalize existing embeddings to unit length
+
+Revision ID: d3f8a1b6c2e4
+Revises: c5a9e3f17b42
+Create Date: 2026-10-15 23:41:05.318274
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "d3f8a1b6c2e4"
+down_revision: Union[str, None] = "c5a9e3f17b42"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # 새 행은 Embedding before_insert 이벤트에서 정규화됨 - 기존 행만 한 번 맞춰 줌
+    # l2_normalize 는 pgvector 0.7.0 이상에서 제공
+    op.execute(
+        """
+        UPDATE embeddings
+        SET embedding = l2_normalize(embedding)
+        WHERE abs(vector_norm(embedding) - 1) > 1e-4
+          AND vector_norm(embedding) > 0
+        """
+    )
+
+
+def downgrade() -> None:
+    # 원래 크기는 보관하지 않으므로 되돌릴 수 없음 (코사인 유사도는 동일)
+    pass
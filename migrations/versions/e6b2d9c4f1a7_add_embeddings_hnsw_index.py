@@ -0,0 +1,34 @@
+"""Add HNSW index on embeddings.embedding
+
+Revision ID: e6b2d9c4f1a7
+Revises: d3f8a1b6c2e4
+Create Date: 2026-10-15 23:52:37.904118
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "e6b2d9c4f1a7"
+down_revision: Union[str, None] = "d3f8a1b6c2e4"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # 코사인 거리(<=>) ORDER BY ... LIMIT 검색을 순차 스캔 대신 HNSW 탐색으로
+    op.create_index(
+        "embeddings_hnsw",
+        "embeddings",
+        ["embedding"],
+        unique=False,
+        postgresql_using="hnsw",
+        postgresql_ops={"embedding": "vector_cosine_ops"},
+        postgresql_with={"m": 16, "ef_construction": 64},
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("embeddings_hnsw", table_name="embeddings")
@@ -0,0 +1,42 @@
+"""Store rag_queries.context_documents as uuid[]
+
+Revision ID: f2c7a8e5b3d1
+Revises: e6b2d9c4f1a7
+Create Date: 2026-10-15 23:58:14.662305
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "f2c7a8e5b3d1"
+down_revision: Union[str, None] = "e6b2d9c4f1a7"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # 36자 문자열 대신 16바이트 uuid 로 저장 (기존 값은 UUID 형식으로 검증되어 있음)
+    op.alter_column(
+        "rag_queries",
+        "context_documents",
+        type_=postgresql.ARRAY(postgresql.UUID(as_uuid=True)),
+        existing_type=sa.ARRAY(sa.String()),
+        existing_nullable=True,
+        postgresql_using="context_documents::uuid[]",
+    )
+
+
+def downgrade() -> None:
+    op.alter_column(
+        "rag_queries",
+        "context_documents",
+        type_=sa.ARRAY(sa.String()),
+        existing_type=postgresql.ARRAY(postgresql.UUID(as_uuid=True)),
+        existing_nullable=True,
+        postgresql_using="context_documents::varchar[]",
+    )
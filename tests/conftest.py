@@ -2,6 +2,7 @@
 
 import asyncio
 
+import fakeredis
 import pytest
 from fastapi.testclient import TestClient
 from httpx import AsyncClient
@@ -35,3 +36,23 @@ async def async_client(app):
     """Create async test client."""
     async with AsyncClient(app=app, base_url="http://test") as client:
         yield client
+
+
+@pytest.fixture
+def fake_redis(monkeypatch):
+    """Route every Redis connection to an in-memory fakeredis server."""
+    from app.common.storage import redis as redis_storage
+
+    server = fakeredis.FakeServer()
+    clients = {}
+
+    async def get_connection(alias="default", encoding="utf8", decode_responses=True):
+        key = (alias, decode_responses)
+        if key not in clients:
+            clients[key] = fakeredis.FakeAsyncRedis(
+                server=server, decode_responses=decode_responses
+            )
+        return clients[key]
+
+    monkeypatch.setattr(redis_storage.pools, "get_connection", get_connection)
+    return fakeredis.FakeAsyncRedis(server=server)
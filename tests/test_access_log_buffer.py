@@ -0,0 +1,79 @@
+"""Test batched access-log output."""
+
+import asyncio
+import io
+import logging
+
+import pytest
+
+from app.common.logging import access_logger
+from app.common.middleware.access_log import AccessLogBuffer
+
+
+class _BrokenStream(io.StringIO):
+    def write(self, text):
+        raise OSError("disk full")
+
+
+@pytest.fixture
+def handler(monkeypatch):
+    handler = logging.StreamHandler(io.StringIO())
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    monkeypatch.setattr(access_logger, "handlers", [handler])
+    monkeypatch.setattr(access_logger, "propagate", False)
+    monkeypatch.setattr(access_logger, "disabled", False)
+    level = access_logger.level
+    access_logger.setLevel(logging.INFO)
+    yield handler
+    access_logger.setLevel(level)
+
+
+def _args(status: int = 200):
+    return ("GET", "http://test/", "1.1", status)
+
+
+class TestAccessLogBuffer:
+    """AccessLogBuffer batching and failure handling."""
+
+    async def test_flush_writes_buffered_entries_in_order(self, handler):
+        buffer = AccessLogBuffer()
+        buffer.start()
+        buffer.append(_args(200), {})
+        buffer.append(_args(404), {})
+
+        await buffer.stop()
+
+        assert handler.stream.getvalue().splitlines() == [
+            "GET http://test/ HTTP/1.1 200",
+            "GET http://test/ HTTP/1.1 404",
+        ]
+
+    async def test_write_failure_goes_to_handle_error(self, handler, monkeypatch):
+        handler.setStream(_BrokenStream())
+        failed = []
+        monkeypatch.setattr(handler, "handleError", failed.append)
+        buffer = AccessLogBuffer()
+        buffer.start()
+        buffer.append(_args(), {})
+
+        await buffer.stop()
+
+        assert len(failed) == 1
+        assert failed[0].args == _args()
+
+    async def test_flush_task_survives_errors(self, handler, monkeypatch):
+        buffer = AccessLogBuffer()
+        calls = []
+
+        def flush():
+            calls.append(None)
+            raise RuntimeError("boom")
+
+        monkeypatch.setattr(buffer, "FLUSH_INTERVAL", 0.001)
+        monkeypatch.setattr(buffer, "flush", flush)
+        buffer.start()
+        await asyncio.sleep(0.05)
+
+        assert len(calls) > 1
+        assert not buffer._task.done()
+        buffer._task.cancel()
@@ -0,0 +1,72 @@
+"""Test post-commit callbacks on the request-bound session."""
+
+from contextlib import asynccontextmanager
+
+import pytest
+
+from app.common.storage.postgres import PostgresStorage
+
+
+class _FakeSession:
+    def __init__(self, events):
+        self.info = {}
+        self.events = events
+
+
+def _storage(monkeypatch, events, fail=False):
+    storage = PostgresStorage()
+
+    @asynccontextmanager
+    async def get_domain_write_session(domain="default"):
+        session = _FakeSession(events)
+        try:
+            yield session
+        except Exception:
+            events.append("rollback")
+            raise
+        events.append("commit")
+
+    monkeypatch.setattr(storage, "get_domain_write_session", get_domain_write_session)
+    return storage
+
+
+class TestRunAfterCommit:
+    """run_after_commit ordering."""
+
+    async def test_runs_immediately_without_request_session(self, monkeypatch):
+        events = []
+        storage = _storage(monkeypatch, events)
+
+        async def callback():
+            events.append("callback")
+
+        await storage.run_after_commit("user", callback)
+
+        assert events == ["callback"]
+
+    async def test_deferred_until_request_session_commits(self, monkeypatch):
+        events = []
+        storage = _storage(monkeypatch, events)
+
+        async def callback():
+            events.append("callback")
+
+        async with storage.get_domain_request_session("user"):
+            await storage.run_after_commit("user", callback)
+            assert events == []
+
+        assert events == ["commit", "callback"]
+
+    async def test_skipped_on_rollback(self, monkeypatch):
+        events = []
+        storage = _storage(monkeypatch, events)
+
+        async def callback():
+            events.append("callback")
+
+        with pytest.raises(RuntimeError):
+            async with storage.get_domain_request_session("user"):
+                await storage.run_after_commit("user", callback)
+                raise RuntimeError("boom")
+
+        assert events == ["rollback"]
@@ -0,0 +1,131 @@
+"""Test in-memory embedding search, int8 quantization and the vector codec."""
+
+import numpy as np
+import pytest
+
+from app.rag.models.embedding import EmbeddingModel, quantize_int8
+from app.rag.models.vector_type import _decode_vector, _encode_vector
+from app.rag.services.embedding_cache import EmbeddingMatrix
+
+
+def _unit(vector):
+    vector = np.asarray(vector, dtype=np.float32)
+    return vector / np.linalg.norm(vector)
+
+
+@pytest.fixture
+def vectors():
+    rng = np.random.default_rng(0)
+    return rng.standard_normal((50, 16)).astype(np.float32)
+
+
+class TestQuantizeInt8:
+    """Symmetric int8 quantization."""
+
+    def test_round_trip_error_is_within_half_a_step(self, vectors):
+        q, scales = quantize_int8(vectors)
+
+        assert q.dtype == np.int8
+        assert np.abs(q).max() <= 127
+        error = np.abs(q * scales[:, None] - vectors)
+        assert np.all(error <= scales[:, None] / 2 + 1e-6)
+
+    def test_zero_vector_uses_unit_scale(self):
+        q, scale = quantize_int8(np.zeros(4, dtype=np.float32))
+
+        assert scale == 1.0
+        assert not q.any()
+
+
+class TestTopK:
+    """EmbeddingModel.select_top_k / top_k."""
+
+    def test_select_top_k_orders_by_score(self):
+        scores = np.array([0.1, 0.9, 0.5, 0.7], dtype=np.float32)
+
+        idx, top = EmbeddingModel.select_top_k(scores, 2)
+
+        assert idx.tolist() == [1, 3]
+        np.testing.assert_allclose(top, [0.9, 0.7])
+
+    def test_k_larger_than_rows_returns_everything_sorted(self):
+        scores = np.array([0.2, 0.8], dtype=np.float32)
+
+        idx, _ = EmbeddingModel.select_top_k(scores, 5)
+
+        assert idx.tolist() == [1, 0]
+
+    def test_top_k_matches_full_sort(self, vectors):
+        matrix = vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+        query = matrix[7]
+
+        idx, scores = EmbeddingModel.top_k(query, matrix, 5)
+
+        assert idx.tolist() == np.argsort(-(matrix @ query))[:5].tolist()
+        assert idx[0] == 7
+        assert scores[0] == pytest.approx(1.0, abs=1e-5)
+
+
+class TestEmbeddingMatrix:
+    """EmbeddingMatrix search over float32 and int8 rows."""
+
+    def _matrix(self, vectors, int8):
+        matrix = EmbeddingMatrix(vectors.shape[1], int8=int8)
+        matrix.append([f"chunk-{i}" for i in range(len(vectors))], vectors)
+        return matrix
+
+    @pytest.mark.parametrize("int8", [False, True])
+    def test_search_finds_nearest_rows(self, vectors, int8):
+        matrix = self._matrix(vectors, int8)
+
+        hits = matrix.search(vectors[3] * 2, k=3)
+
+        assert hits[0][0] == "chunk-3"
+        assert hits[0][1] == pytest.approx(1.0, abs=0.02)
+        assert [score for _, score in hits] == sorted(
+            (score for _, score in hits), reverse=True
+        )
+
+    def test_int8_scores_track_float32_scores(self, vectors):
+        exact = self._matrix(vectors, int8=False)
+        quantized = self._matrix(vectors, int8=True)
+        query = vectors[11] + vectors[12]
+
+        exact_hits = dict(exact.search(query, k=len(vectors)))
+        quantized_hits = dict(quantized.search(query, k=len(vectors)))
+
+        for chunk_id, score in exact_hits.items():
+            assert quantized_hits[chunk_id] == pytest.approx(score, abs=0.02)
+
+    def test_threshold_and_degenerate_queries(self, vectors):
+        matrix = self._matrix(vectors, int8=False)
+
+        hits = matrix.search(vectors[0], k=10, threshold=0.99)
+
+        assert [chunk_id for chunk_id, _ in hits] == ["chunk-0"]
+        assert matrix.search(np.zeros(16), k=3) == []
+        assert matrix.search(vectors[0], k=0) == []
+        assert EmbeddingMatrix(16).search(vectors[0], k=3) == []
+
+
+class TestVectorCodec:
+    """pgvector binary encoding."""
+
+    def test_round_trip(self):
+        vector = np.array([0.5, -1.25, 3.0], dtype=np.float32)
+
+        decoded = _decode_vector(_encode_vector(vector))
+
+        assert decoded.dtype == np.float32
+        np.testing.assert_array_equal(decoded, vector)
+
+    def test_binary_layout(self):
+        data = _encode_vector([1.0, 2.0])
+
+        assert data[:4] == b"\x00\x02\x00\x00"
+        assert data[4:] == np.array([1.0, 2.0], dtype=">f4").tobytes()
+
+    def test_accepts_text_form(self):
+        np.testing.assert_array_equal(
+            _decode_vector(_encode_vector("[1,2,3]")), np.array([1, 2, 3])
+        )
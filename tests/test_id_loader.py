@@ -0,0 +1,97 @@
+"""Test request-scoped get_by_id batching and memoization."""
+
+import asyncio
+import uuid
+from contextlib import asynccontextmanager
+
+import pytest
+
+import app.common.storage.base_postgres as base_postgres_module
+from app.auth.models.postgres_models import User
+from app.auth.repositories.user_repository import UserRepository
+from app.common.storage.postgres import request_cache
+
+
+class _FakeResult:
+    def __init__(self, entities):
+        self._entities = entities
+
+    def scalars(self):
+        return iter(self._entities)
+
+
+class _FakeSession:
+    def __init__(self, rows):
+        self.rows = rows
+        self.queries = []
+
+    async def execute(self, statement, params):
+        self.queries.append(list(params["pks"]))
+        return _FakeResult([self.rows[pk] for pk in params["pks"] if pk in self.rows])
+
+
+@pytest.fixture
+def session(monkeypatch):
+    user = User(id=uuid.uuid4(), email="a@example.com", name="a")
+    session = _FakeSession({user.id: user})
+
+    @asynccontextmanager
+    async def get_domain_read_session(domain="default"):
+        yield session
+
+    monkeypatch.setattr(
+        base_postgres_module.postgres_storage,
+        "get_domain_read_session",
+        get_domain_read_session,
+    )
+    monkeypatch.setattr(
+        base_postgres_module.postgres_storage,
+        "has_request_session",
+        lambda domain: False,
+    )
+    token = request_cache.set({})
+    yield session
+    request_cache.reset(token)
+
+
+class TestIdLoader:
+    """get_by_id / get_by_ids under a request cache."""
+
+    async def test_same_tick_calls_coalesce_into_one_query(self, session):
+        user_id = next(iter(session.rows))
+        missing_id = uuid.uuid4()
+
+        found, missing = await asyncio.gather(
+            UserRepository.get_by_id(user_id), UserRepository.get_by_id(missing_id)
+        )
+
+        assert found is session.rows[user_id]
+        assert missing is None
+        assert len(session.queries) == 1
+        assert set(session.queries[0]) == {user_id, missing_id}
+
+    async def test_str_and_uuid_ids_share_one_lookup(self, session):
+        user_id = next(iter(session.rows))
+
+        by_str, by_uuid = await asyncio.gather(
+            UserRepository.get_by_id(str(user_id)), UserRepository.get_by_id(user_id)
+        )
+
+        assert by_str is by_uuid is session.rows[user_id]
+        assert session.queries == [[user_id]]
+
+    async def test_get_by_ids_accepts_str_ids(self, session):
+        user_id = next(iter(session.rows))
+
+        found = await UserRepository.get_by_ids([str(user_id)])
+
+        assert found == {user_id: session.rows[user_id]}
+        assert request_cache.get()[(UserRepository, "id", user_id)] is found[user_id]
+
+    async def test_missing_id_is_cached_as_none(self, session):
+        missing_id = uuid.uuid4()
+
+        assert await UserRepository.get_by_ids([missing_id]) == {}
+        assert await UserRepository.get_by_id(str(missing_id)) is None
+
+        assert len(session.queries) == 1
@@ -0,0 +1,94 @@
+"""Test the buffered last-login flush."""
+
+import asyncio
+import uuid
+from contextlib import asynccontextmanager
+
+import pytest
+
+import app.auth.repositories.user_repository as user_repository_module
+from app.auth.repositories.cache.auth_cache_repository import auth_cache
+from app.auth.repositories.user_repository import UserRepository
+from app.common.exception import ServerError
+
+
+class _FakeSession:
+    def __init__(self):
+        self.statements = []
+
+    async def execute(self, statement):
+        self.statements.append(statement)
+
+
+def _write_session(monkeypatch, session=None, error=None, entered=None):
+    @asynccontextmanager
+    async def get_domain_write_session(domain="default"):
+        if error is not None:
+            raise error
+        if entered is not None:
+            # 취소될 때까지 UPDATE 중인 상태로 대기
+            entered.set()
+            await asyncio.Event().wait()
+        yield session
+
+    monkeypatch.setattr(
+        user_repository_module.postgres_storage,
+        "get_domain_write_session",
+        get_domain_write_session,
+    )
+
+
+class TestLastLoginBuffer:
+    """Last-login buffering and flushing."""
+
+    async def test_flush_writes_one_update_and_clears_buffer(
+        self, fake_redis, monkeypatch
+    ):
+        session = _FakeSession()
+        _write_session(monkeypatch, session=session)
+        user_ids = [uuid.uuid4(), uuid.uuid4()]
+        for user_id in user_ids:
+            await auth_cache.buffer_last_login(user_id, 1_700_000_000.0)
+
+        assert await UserRepository.flush_last_logins() == 2
+        assert len(session.statements) == 1
+        assert await auth_cache.drain_last_logins() == {}
+
+    async def test_flush_with_empty_buffer_skips_db(self, fake_redis, monkeypatch):
+        session = _FakeSession()
+        _write_session(monkeypatch, session=session)
+
+        assert await UserRepository.flush_last_logins() == 0
+        assert session.statements == []
+
+    async def test_failed_update_restores_buffer(self, fake_redis, monkeypatch):
+        _write_session(monkeypatch, error=RuntimeError("db down"))
+        user_id = uuid.uuid4()
+        await auth_cache.buffer_last_login(user_id, 1_700_000_000.0)
+
+        with pytest.raises(ServerError):
+            await UserRepository.flush_last_logins()
+
+        assert await auth_cache.drain_last_logins() == {user_id.hex: 1_700_000_000.0}
+
+    async def test_restore_keeps_newer_login(self, fake_redis):
+        user_id = uuid.uuid4()
+        await auth_cache.buffer_last_login(user_id, 2.0)
+
+        await auth_cache.restore_last_logins({user_id.hex: 1.0})
+
+        assert await auth_cache.drain_last_logins() == {user_id.hex: 2.0}
+
+    async def test_cancelled_flush_restores_buffer(self, fake_redis, monkeypatch):
+        entered = asyncio.Event()
+        _write_session(monkeypatch, session=_FakeSession(), entered=entered)
+        user_id = uuid.uuid4()
+        await auth_cache.buffer_last_login(user_id, 1_700_000_000.0)
+
+        task = asyncio.create_task(UserRepository.flush_last_logins())
+        await entered.wait()
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        assert await auth_cache.drain_last_logins() == {user_id.hex: 1_700_000_000.0}
@@ -0,0 +1,41 @@
+"""Test single-use OAuth state verification."""
+
+import pytest
+import redis
+
+import app.auth.services.google_oauth_service as google_oauth_module
+from app.auth.repositories.cache.auth_cache_repository import auth_cache
+from app.auth.services.google_oauth_service import google_oauth_service
+from app.common.exception import ServerError
+
+
+@pytest.fixture(autouse=True)
+def clear_negative_cache():
+    google_oauth_module._STATE_NEG.clear()
+    yield
+    google_oauth_module._STATE_NEG.clear()
+
+
+class TestVerifyState:
+    """GoogleOAuthService.verify_state."""
+
+    async def test_state_is_single_use(self, fake_redis):
+        _, state = await google_oauth_service.generate_auth_url()
+
+        assert await google_oauth_service.verify_state(state) is True
+        assert await google_oauth_service.verify_state(state) is False
+        assert state in google_oauth_module._STATE_NEG
+
+    async def test_redis_failure_does_not_poison_state(self, fake_redis, monkeypatch):
+        _, state = await google_oauth_service.generate_auth_url()
+        pop_oauth_state = auth_cache.pop_oauth_state
+
+        async def failing_pop(state_token):
+            raise ServerError from redis.exceptions.ConnectionError()
+
+        monkeypatch.setattr(auth_cache, "pop_oauth_state", failing_pop)
+        with pytest.raises(ServerError):
+            await google_oauth_service.verify_state(state)
+
+        monkeypatch.setattr(auth_cache, "pop_oauth_state", pop_oauth_state)
+        assert await google_oauth_service.verify_state(state) is True
@@ -0,0 +1,100 @@
+"""Test the Redis-backed repository read cache."""
+
+import uuid
+from contextlib import asynccontextmanager
+
+import pytest
+
+import app.common.storage.base_postgres as base_postgres_module
+from app.auth.models.postgres_models import SocialAccount
+from app.auth.repositories.social_account_repository import SocialAccountRepository
+from app.common.storage import query_cache as query_cache_module
+
+
+class _FakeResult:
+    def __init__(self, entity=None, rowcount=0):
+        self._entity = entity
+        self.rowcount = rowcount
+
+    def scalar_one_or_none(self):
+        return self._entity
+
+
+class _FakeSession:
+    def __init__(self, account):
+        self.account = account
+        self.reads = 0
+
+    async def execute(self, statement, params=None):
+        if statement.is_select:
+            self.reads += 1
+            return _FakeResult(self.account)
+        return _FakeResult(self.account, rowcount=1)
+
+
+@pytest.fixture
+def session(fake_redis, monkeypatch):
+    account = SocialAccount(
+        id=uuid.uuid4(),
+        user_id=uuid.uuid4(),
+        provider="google",
+        provider_user_id="google-1",
+        is_primary=True,
+    )
+    session = _FakeSession(account)
+
+    @asynccontextmanager
+    async def get_session(domain="default"):
+        yield session
+
+    storage = base_postgres_module.postgres_storage
+    monkeypatch.setattr(storage, "get_domain_read_session", get_session)
+    monkeypatch.setattr(storage, "get_domain_write_session", get_session)
+    return session
+
+
+class TestCachedRead:
+    """@cached_read on SocialAccountRepository.get_social_account_by_id."""
+
+    async def test_second_read_is_served_from_redis(self, session):
+        account_id = session.account.id
+
+        first = await SocialAccountRepository.get_social_account_by_id(account_id)
+        second = await SocialAccountRepository.get_social_account_by_id(account_id)
+
+        assert session.reads == 1
+        assert second is not first
+        assert (second.id, second.user_id, second.provider) == (
+            first.id,
+            first.user_id,
+            first.provider,
+        )
+
+    async def test_update_invalidates_cached_row(self, session):
+        account_id = session.account.id
+        await SocialAccountRepository.get_social_account_by_id(account_id)
+
+        await SocialAccountRepository.update_social_account(
+            account_id, is_primary=False
+        )
+        await SocialAccountRepository.get_social_account_by_id(account_id)
+
+        assert session.reads == 2
+
+    async def test_delete_invalidates_cached_row(self, session):
+        account_id = session.account.id
+        await SocialAccountRepository.get_social_account_by_id(account_id)
+
+        await SocialAccountRepository.delete_social_account(account_id)
+        await SocialAccountRepository.get_social_account_by_id(account_id)
+
+        assert session.reads == 2
+
+    async def test_ttl_is_jittered_within_ten_percent(self, session, fake_redis):
+        account_id = session.account.id
+        ttl = int(query_cache_module.CacheExpire.MINUTE * 5)
+
+        await SocialAccountRepository.get_social_account_by_id(account_id)
+
+        expire = await fake_redis.ttl(f"repo:SocialAccount:id:{account_id}")
+        assert ttl - 1 <= expire <= ttl + ttl // 10
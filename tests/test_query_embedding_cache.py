@@ -0,0 +1,41 @@
+"""Test the question embedding cache."""
+
+import numpy as np
+
+from app.rag.services.embedding_cache import QueryEmbeddingCache
+
+
+class TestQueryEmbeddingCache:
+    """QueryEmbeddingCache keys and validation."""
+
+    async def test_vector_round_trips_through_redis(self, fake_redis):
+        digest = QueryEmbeddingCache.digest("질문")
+        vector = np.arange(4, dtype=np.float32)
+        await QueryEmbeddingCache(model="m", dimension=4).set_vector(digest, vector)
+
+        # 새 인스턴스는 L1 이 비어 있으므로 Redis 에서 읽음
+        cached = await QueryEmbeddingCache(model="m", dimension=4).get_vector(digest)
+
+        np.testing.assert_array_equal(cached, vector)
+
+    async def test_key_includes_model_and_dimension(self, fake_redis):
+        digest = QueryEmbeddingCache.digest("질문")
+        await QueryEmbeddingCache(model="m", dimension=4).set_vector(
+            digest, np.ones(4, dtype=np.float32)
+        )
+
+        assert (
+            await QueryEmbeddingCache(model="other", dimension=4).get_vector(digest)
+            is None
+        )
+        assert await fake_redis.exists(f"vec:m:4:{digest.hex()}")
+
+    async def test_wrong_size_hit_is_a_miss(self, fake_redis):
+        digest = QueryEmbeddingCache.digest("질문")
+        await fake_redis.set(
+            f"vec:m:4:{digest.hex()}", np.ones(3, dtype=np.float32).tobytes()
+        )
+
+        assert (
+            await QueryEmbeddingCache(model="m", dimension=4).get_vector(digest) is None
+        )
@@ -0,0 +1,103 @@
+"""Test the in-process token bucket rate limiter."""
+
+import pytest
+from limits import parse
+from limits.storage import MemoryStorage
+from limits.strategies import STRATEGIES
+
+import app.common.middleware.rate_limiting as rate_limiting_module
+from app.common.middleware.rate_limiting import LocalTokenBucket, limiter
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = _Clock()
+    monkeypatch.setattr(rate_limiting_module.time, "monotonic", clock)
+    return clock
+
+
+class TestLocalTokenBucket:
+    """LocalTokenBucket allow/deny and refill."""
+
+    def test_denies_once_bucket_is_empty(self, clock):
+        bucket = LocalTokenBucket(MemoryStorage())
+        item = parse("3/minute")
+
+        assert [bucket.hit(item, "ip") for _ in range(4)] == [True, True, True, False]
+        assert bucket.test(item, "ip") is False
+        # 다른 식별자는 별도 버킷
+        assert bucket.hit(item, "other-ip") is True
+
+    def test_refills_over_time(self, clock):
+        bucket = LocalTokenBucket(MemoryStorage())
+        item = parse("3/minute")
+        for _ in range(3):
+            bucket.hit(item, "ip")
+
+        clock.now += 20  # 3/minute -> 20 초에 토큰 1개
+        assert bucket.hit(item, "ip") is True
+        assert bucket.hit(item, "ip") is False
+
+        clock.now += 600
+        assert bucket.get_window_stats(item, "ip").remaining == 3
+
+    def test_test_does_not_consume(self, clock):
+        bucket = LocalTokenBucket(MemoryStorage())
+        item = parse("1/minute")
+
+        assert bucket.test(item, "ip") is True
+        assert bucket.hit(item, "ip") is True
+
+    def test_clear_resets_bucket(self, clock):
+        bucket = LocalTokenBucket(MemoryStorage())
+        item = parse("1/minute")
+        bucket.hit(item, "ip")
+
+        bucket.clear(item, "ip")
+
+        assert bucket.hit(item, "ip") is True
+
+    async def test_sync_deducts_other_workers_usage(self, clock, fake_redis):
+        bucket = LocalTokenBucket(MemoryStorage())
+        item = parse("10/minute")
+        key = item.key_for("ip")
+        bucket.hit(item, "ip")
+        # 다른 워커가 같은 키로 5 만큼 소비
+        await fake_redis.incrby(key, 5)
+
+        await bucket._sync({key: 1})
+
+        assert await fake_redis.get(key) == b"6"
+        assert bucket.get_window_stats(item, "ip").remaining == 4
+
+    async def test_sync_after_eviction_does_not_count_own_hits(self, clock, fake_redis):
+        bucket = LocalTokenBucket(MemoryStorage())
+        # 백그라운드 flush 없이 동기화 시점을 직접 제어
+        bucket.FLUSH_INTERVAL = float("inf")
+        item = parse("5/minute")
+        key = item.key_for("ip")
+        bucket.hit(item, "ip")
+        await bucket._sync({key: 1})
+
+        # 버킷은 12 초면 다 차서 비워지지만 Redis 카운터는 1 분간 남음
+        clock.now += 13
+        bucket._evict_full(clock.now, keep={})
+        assert key not in bucket._buckets
+        bucket.hit(item, "ip")
+        await bucket._sync({key: 1})
+
+        assert await fake_redis.get(key) == b"2"
+        assert bucket.get_window_stats(item, "ip").remaining == 4
+
+
+def test_limiter_uses_local_bucket_without_global_registration():
+    assert isinstance(limiter.limiter, LocalTokenBucket)
+    assert LocalTokenBucket not in STRATEGIES.values()
@@ -0,0 +1,81 @@
+"""Test the bearer token lookup cache."""
+
+import time
+import uuid
+
+import jwt
+import pytest
+
+from app.auth.cache.token_lookup_cache import TokenLookupCache
+from app.auth.repositories.cache.auth_cache_repository import auth_cache
+from app.common.exception import Unauthorized
+
+
+def _token(jti: str = "jti-1") -> str:
+    return jwt.encode(
+        {"sub": str(uuid.uuid4()), "jti": jti, "exp": int(time.time()) + 600},
+        "test-secret-key-for-token-lookup-cache",
+        algorithm="HS256",
+    )
+
+
+class TestTokenLookupCache:
+    """Token lookup cache behaviour."""
+
+    async def test_hit_after_set(self, fake_redis):
+        cache = TokenLookupCache()
+        token, user_id = _token(), uuid.uuid4()
+
+        assert await cache.get(token) is None
+        await cache.set(token, user_id, time.time() + 600)
+
+        assert await cache.get(token) == user_id
+
+    async def test_expired_token_is_not_cached(self, fake_redis):
+        cache = TokenLookupCache()
+        token = _token()
+
+        await cache.set(token, uuid.uuid4(), time.time() - 1)
+
+        assert await cache.get(token) is None
+
+    async def test_blacklisted_token_is_rejected_on_hit(self, fake_redis):
+        cache = TokenLookupCache()
+        token = _token("revoked-jti")
+        await cache.set(token, uuid.uuid4(), None)
+
+        await auth_cache.blacklist_jwt_token("revoked-jti", 600)
+
+        with pytest.raises(Unauthorized):
+            await cache.get(token)
+
+    async def test_invalidate_applies_to_every_worker(self, fake_redis):
+        worker_a, worker_b = TokenLookupCache(), TokenLookupCache()
+        token, user_id = _token(), uuid.uuid4()
+        await worker_b.set(token, user_id, None)
+        assert await worker_b.get(token) == user_id
+
+        await worker_a.invalidate(token)
+
+        assert await worker_b.get(token) is None
+
+    async def test_invalidate_user_drops_all_tokens(self, fake_redis):
+        worker_a, worker_b = TokenLookupCache(), TokenLookupCache()
+        user_id = uuid.uuid4()
+        tokens = [_token("a"), _token("b")]
+        for token in tokens:
+            await worker_b.set(token, user_id, None)
+
+        await worker_a.invalidate_user(user_id)
+
+        for token in tokens:
+            assert await worker_b.get(token) is None
+
+    async def test_negative_entry_raises(self, fake_redis):
+        cache = TokenLookupCache()
+        token = _token()
+
+        cache.set_negative(token)
+
+        with pytest.raises(Unauthorized):
+            await cache.get(token)